@@ -0,0 +1,313 @@
+"""
+Módulo de analítica de flujo.
+Calcula con NumPy el flujo acumulado, el throughput, el lead time y el cycle
+time a partir del historial task_events, fuera del hilo de la interfaz.
+"""
+
+import threading
+import traceback
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+from app.database import Database, get_database
+from app.models import TaskModel
+from app.events import EventBus, TaskCreated, TaskDeleted, TaskMoved, TaskUpdated, event_bus
+
+
+# Códigos numéricos de los estados (-1 = sin estado: alta o eliminación)
+STATUS_CODES = {status: code for code, status in enumerate(TaskModel.VALID_STATUSES)}
+NO_STATUS = -1
+
+# Ventanas disponibles, en días
+WINDOWS = (7, 30, 90)
+
+
+@dataclass
+class FlowMetrics:
+    """Resultado del cálculo de flujo para una ventana de días."""
+    window_days: int
+    days: np.ndarray  # Fecha de cada día de la ventana (datetime64[D])
+    cumulative: Dict[str, np.ndarray]  # {status: tareas en ese estado al final de cada día}
+    throughput: np.ndarray  # Tareas que llegaron a 'done' cada día
+    lead_times: np.ndarray  # Días desde el alta hasta 'done' (tareas terminadas en la ventana)
+    cycle_times: np.ndarray  # Días desde la primera entrada a 'doing' hasta 'done'
+    event_count: int = 0  # Eventos procesados
+    summary: Dict[str, float] = field(default_factory=dict)
+
+
+def _window_bounds(window_days: int, today: date = None) -> Tuple[datetime, datetime]:
+    """
+    Calcula la ventana [inicio, fin) que termina al final del día de hoy.
+
+    Args:
+        window_days: Cantidad de días de la ventana
+        today: Día final incluido (hoy si no se indica)
+
+    Returns:
+        Tupla (inicio, fin) como datetimes a medianoche
+    """
+    end = datetime.combine((today or date.today()) + timedelta(days=1), time.min)
+    return end - timedelta(days=window_days), end
+
+
+def _to_arrays(events: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convierte una lista de eventos en arrays de NumPy.
+
+    Args:
+        events: Eventos con task_id, from_status, to_status y occurred_at
+
+    Returns:
+        Tupla (task_ids, instantes datetime64[us], from_codes, to_codes)
+    """
+    count = len(events)
+    task_ids = np.fromiter((event['task_id'] for event in events), dtype=np.int64, count=count)
+    times = np.array([event['occurred_at'] for event in events], dtype='datetime64[us]')
+    from_codes = np.fromiter((STATUS_CODES.get(event['from_status'], NO_STATUS) for event in events),
+                             dtype=np.int8, count=count)
+    to_codes = np.fromiter((STATUS_CODES.get(event['to_status'], NO_STATUS) for event in events),
+                           dtype=np.int8, count=count)
+    return task_ids, times, from_codes, to_codes
+
+
+def _first_time_per_task(task_ids: np.ndarray, times: np.ndarray,
+                         mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Obtiene, para cada tarea, el primer instante que cumple la máscara.
+
+    Los eventos vienen en orden cronológico, así que la primera aparición de
+    cada task_id es también la más temprana.
+
+    Returns:
+        Tupla (task_ids ordenados, instante correspondiente)
+    """
+    unique_ids, first_index = np.unique(task_ids[mask], return_index=True)
+    return unique_ids, times[mask][first_index]
+
+
+def _durations_in_days(end_ids: np.ndarray, end_times: np.ndarray,
+                       start_ids: np.ndarray, start_times: np.ndarray) -> np.ndarray:
+    """
+    Calcula end - start en días para las tareas presentes en ambos conjuntos.
+
+    Args:
+        end_ids, end_times: Tareas (ordenadas) y su instante final
+        start_ids, start_times: Tareas (ordenadas) y su instante inicial
+
+    Returns:
+        Array con las duraciones en días (se descartan las negativas)
+    """
+    if not len(end_ids) or not len(start_ids):
+        return np.empty(0)
+
+    positions = np.searchsorted(start_ids, end_ids)
+    positions = np.minimum(positions, len(start_ids) - 1)
+    matched = start_ids[positions] == end_ids
+
+    durations = (end_times[matched] - start_times[positions[matched]]) / np.timedelta64(1, 'D')
+    return durations[durations >= 0]
+
+
+def _percentile(values: np.ndarray, percent: float) -> float:
+    """Percentil de un array (0 si está vacío)."""
+    return float(np.percentile(values, percent)) if len(values) else 0.0
+
+
+def compute_flow_metrics(window_days: int, model=TaskModel, today: date = None) -> FlowMetrics:
+    """
+    Calcula las métricas de flujo de una ventana de días.
+
+    Solo lee la ventana: el estado inicial sale de los conteos actuales menos
+    los eventos desde el inicio, y luego se leen los eventos de la ventana y
+    el historial de las tareas terminadas en ella; el resto es vectorizado.
+
+    Args:
+        window_days: Cantidad de días de la ventana
+        model: Modelo del que se leen los eventos
+        today: Último día incluido (hoy si no se indica)
+
+    Returns:
+        FlowMetrics con los resultados
+    """
+    start, end = _window_bounds(window_days, today)
+    start_iso, end_iso = start.isoformat(), end.isoformat()
+
+    days = np.arange(np.datetime64(start.date()), np.datetime64(end.date()), dtype='datetime64[D]')
+    day_count = len(days)
+
+    # ---- Flujo acumulado y throughput ----
+    initial = model.count_by_status_at(start_iso)
+    events = model.get_events(start_iso, end_iso)
+    _, times, from_codes, to_codes = _to_arrays(events)
+    day_index = (times.astype('datetime64[D]') - days[0]).astype(np.int64) if len(events) else np.empty(0, np.int64)
+
+    cumulative = {}
+    for status, code in STATUS_CODES.items():
+        deltas = (to_codes == code).astype(np.int64) - (from_codes == code).astype(np.int64)
+        per_day = np.bincount(day_index, weights=deltas, minlength=day_count)[:day_count]
+        cumulative[status] = initial.get(status, 0) + np.cumsum(per_day).astype(np.int64)
+
+    done_code = STATUS_CODES[TaskModel.STATUS_DONE]
+    throughput = np.bincount(day_index[to_codes == done_code], minlength=day_count)[:day_count]
+
+    # ---- Lead time y cycle time de las tareas terminadas en la ventana ----
+    history = model.get_events_of_completed(start_iso, end_iso)
+    task_ids, times, from_codes, to_codes = _to_arrays(history)
+
+    in_window = (times >= np.datetime64(start)) & (times < np.datetime64(end))
+    done_ids, done_times = _first_time_per_task(task_ids, times, (to_codes == done_code) & in_window)
+    created_ids, created_times = _first_time_per_task(task_ids, times, from_codes == NO_STATUS)
+    doing_ids, doing_times = _first_time_per_task(
+        task_ids, times, to_codes == STATUS_CODES[TaskModel.STATUS_DOING])
+
+    lead_times = _durations_in_days(done_ids, done_times, created_ids, created_times)
+    cycle_times = _durations_in_days(done_ids, done_times, doing_ids, doing_times)
+
+    summary = {
+        'throughput_total': float(throughput.sum()),
+        'throughput_per_day': float(throughput.mean()) if day_count else 0.0,
+        'lead_time_p50': _percentile(lead_times, 50),
+        'lead_time_p85': _percentile(lead_times, 85),
+        'cycle_time_p50': _percentile(cycle_times, 50),
+        'cycle_time_p85': _percentile(cycle_times, 85),
+    }
+
+    return FlowMetrics(window_days, days, cumulative, throughput, lead_times, cycle_times,
+                       len(events) + len(history), summary)
+
+
+class FlowAnalytics(QObject):
+    """
+    Calcula las métricas de flujo en un hilo de trabajo y las guarda en caché
+    por ventana de días.
+
+    La caché se invalida con cualquier evento de tareas del bus y al cambiar
+    de día.
+    """
+
+    # Señal cuando hay métricas disponibles: window_days, FlowMetrics
+    metrics_ready = pyqtSignal(int, object)
+
+    # Señal cuando la caché se invalida (las métricas mostradas quedaron viejas)
+    invalidated = pyqtSignal()
+
+    # Señal interna desde el hilo de trabajo: window_days, generación, FlowMetrics o None
+    _computed = pyqtSignal(int, int, object)
+
+    def __init__(self, database: Database = None, model=TaskModel,
+                 bus: EventBus = event_bus, parent=None):
+        """
+        Inicializa el servicio con la caché vacía.
+
+        Las consultas del modelo y la instantánea de lectura usan siempre la
+        misma base de datos: si se indica una, el modelo se enlaza a ella.
+
+        Args:
+            database: Base de datos de la que se abren las conexiones de trabajo
+                      (None para la del modelo; la instancia por defecto se
+                      abre aquí y no en el hilo de trabajo)
+            model: Modelo del que se leen los eventos
+            bus: Bus de eventos que invalida la caché
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+        if database is None:
+            database = model.db if isinstance(model.db, Database) else get_database()
+        self.database = database
+        self.model = model if model.db is database else model.bind(database)
+        self._cache: Dict[int, Tuple[date, FlowMetrics]] = {}  # {window_days: (día, métricas)}
+        self._running: Dict[int, int] = {}  # {window_days: generación en cálculo}
+        self._generation = 0  # Aumenta con cada invalidación
+
+        self._computed.connect(self._on_computed)
+
+        self.bus = bus
+        # [(tipo_evento, handler)] para poder desuscribirse en close()
+        self._subscriptions = [(event_type, lambda event: self.invalidate())
+                               for event_type in (TaskCreated, TaskUpdated, TaskMoved, TaskDeleted)]
+        for event_type, handler in self._subscriptions:
+            bus.subscribe(event_type, handler)
+
+    def close(self):
+        """Deja de recibir los eventos del bus."""
+        for event_type, handler in self._subscriptions:
+            self.bus.unsubscribe(event_type, handler)
+        self._subscriptions = []
+
+    def cached(self, window_days: int) -> Optional[FlowMetrics]:
+        """
+        Retorna las métricas en caché de una ventana si siguen vigentes.
+
+        Args:
+            window_days: Cantidad de días de la ventana
+
+        Returns:
+            FlowMetrics o None si hay que calcularlas
+        """
+        entry = self._cache.get(window_days)
+        if entry and entry[0] == date.today():
+            return entry[1]
+        return None
+
+    def request(self, window_days: int):
+        """
+        Pide las métricas de una ventana; llegan por metrics_ready.
+
+        Si están en caché se entregan de inmediato; si no, se calculan en un
+        hilo de trabajo (un solo cálculo por ventana a la vez).
+
+        Args:
+            window_days: Cantidad de días de la ventana
+        """
+        metrics = self.cached(window_days)
+        if metrics is not None:
+            self.metrics_ready.emit(window_days, metrics)
+            return
+
+        if self._running.get(window_days) == self._generation:
+            return  # Ya se está calculando con los datos actuales
+
+        self._running[window_days] = self._generation
+        thread = threading.Thread(target=self._compute, args=(window_days, self._generation),
+                                  name="FlowAnalytics", daemon=True)
+        thread.start()
+
+    def invalidate(self):
+        """Descarta las métricas en caché (los datos cambiaron)."""
+        self._generation += 1
+        self._cache.clear()
+        self.invalidated.emit()
+
+    def _compute(self, window_days: int, generation: int):
+        """
+        Calcula las métricas en el hilo de trabajo, con una conexión del pool
+        de lectura y una sola versión de la base de datos para las tres consultas.
+        """
+        try:
+            with self.database.read_snapshot():
+                metrics = compute_flow_metrics(window_days, self.model)
+        except Exception as e:
+            traceback.print_exc()
+            print(f"✗ Error al calcular las métricas de flujo: {e}")
+            metrics = None
+        finally:
+            self.database.release_read_connection()
+
+        self._computed.emit(window_days, generation, metrics)
+
+    def _on_computed(self, window_days: int, generation: int, metrics):
+        """Guarda el resultado (hilo de la interfaz) y lo entrega."""
+        if self._running.get(window_days) == generation:
+            del self._running[window_days]
+
+        if metrics is None:
+            return
+
+        if generation == self._generation:
+            self._cache[window_days] = (date.today(), metrics)
+            self.metrics_ready.emit(window_days, metrics)
+        else:
+            # Los datos cambiaron durante el cálculo: calcular de nuevo
+            self.request(window_days)
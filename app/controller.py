@@ -4,18 +4,47 @@ Puente entre la UI y los modelos de datos.
 """
 
 from typing import List, Dict, Optional
+from app.database import Database
 from app.models import TaskModel
+from app.events import EventBus, TaskCreated, TaskDeleted, TaskMoved, TaskUpdated, event_bus
+from app.task_counters import TaskCounters
+from app.month_cache import MonthTaskCache
 
 
 class TaskController:
-    """Controlador para gestionar las operaciones de tareas."""
+    """
+    Controlador para gestionar las operaciones de tareas.
     
-    def __init__(self):
-        """Inicializa el controlador."""
-        self.model = TaskModel
+    Cada escritura exitosa publica un evento en el bus; los contadores, la
+    caché del calendario y las vistas suscritas aplican el cambio sin volver
+    a consultar la base de datos.
+    """
+    
+    def __init__(self, bus: EventBus = None, database: Database = None):
+        """
+        Inicializa el controlador.
+        
+        Args:
+            bus: Bus de eventos en el que se publican los cambios (None para el
+                 bus global, o uno propio si se indica la base de datos: los
+                 eventos de otra base de datos no deben mezclarse)
+            database: Base de datos de las tareas (None para la instancia por defecto)
+        """
+        if bus is None:
+            bus = EventBus() if database is not None else event_bus
+        self.database = database
+        self.model = TaskModel.bind(database) if database is not None else TaskModel
+        self.bus = bus
+        self.counters = TaskCounters(self.model, self.bus)
+        self.months = MonthTaskCache(self.model, self.bus)
+    
+    def close(self):
+        """Quita del bus las suscripciones de los contadores y de la caché del calendario."""
+        self.counters.close()
+        self.months.close()
     
     def create_task(self, title: str, description: str = "", 
-                    status: str = TaskModel.STATUS_TODO, due_date: str = None) -> Optional[int]:
+                    status: str = TaskModel.STATUS_TODO, due_date: str = None) -> Optional[Dict]:
         """
         Crea una nueva tarea.
         
@@ -26,17 +55,46 @@ class TaskController:
             due_date: Fecha programada/vencimiento en formato ISO (opcional)
             
         Returns:
-            ID de la tarea creada o None si hubo un error
+            Diccionario con la tarea creada o None si hubo un error
         """
         if not title or not title.strip():
             return None
         
         try:
-            task_id = self.model.create(title.strip(), description.strip(), status, due_date)
-            return task_id
+            task = self.model.create(title.strip(), description.strip(), status, due_date)
         except Exception as e:
             print(f"✗ Error al crear la tarea: {e}")
             return None
+        
+        self.bus.publish(TaskCreated(task))
+        return task
+    
+    def create_tasks(self, tasks: List[Dict]) -> List[Dict]:
+        """
+        Crea varias tareas con un solo commit (importaciones, acciones múltiples).
+        
+        Args:
+            tasks: Lista de diccionarios con title, description, status y due_date
+            
+        Returns:
+            Lista con las tareas creadas (vacía si hubo un error)
+        """
+        valid_tasks = []
+        for task in tasks:
+            title = (task.get('title') or '').strip()
+            if title:
+                valid_tasks.append({**task, 'title': title,
+                                    'description': (task.get('description') or '').strip()})
+        
+        try:
+            created = self.model.bulk_create(valid_tasks)
+        except Exception as e:
+            print(f"✗ Error al crear las tareas: {e}")
+            return []
+        
+        for task in created:
+            self.bus.publish(TaskCreated(task))
+        return created
     
     def get_all_tasks(self) -> List[Dict]:
         """
@@ -67,6 +125,43 @@ class TaskController:
             print(f"✗ Error al obtener las tareas por estado: {e}")
             return []
     
+    def get_tasks_page(self, status: str, after_position: str = None,
+                       after_id: int = None, limit: int = TaskModel.PAGE_SIZE) -> List[Dict]:
+        """
+        Obtiene una página de las tareas de una columna a partir de un cursor.
+        
+        Args:
+            status: Estado de las tareas a buscar
+            after_position: position de la última tarea ya cargada
+            after_id: ID de la última tarea ya cargada
+            limit: Cantidad máxima de tareas a retornar
+            
+        Returns:
+            Lista de diccionarios con las tareas
+        """
+        try:
+            return self.model.get_page(status, after_position, after_id, limit)
+        except Exception as e:
+            print(f"✗ Error al obtener la página de tareas: {e}")
+            return []
+    
+    def search(self, text: str, status: str = None) -> List[Dict]:
+        """
+        Busca tareas por título y descripción.
+        
+        Args:
+            text: Texto de búsqueda
+            status: Estado de las tareas a buscar (None para todos)
+            
+        Returns:
+            Lista de tareas ordenadas por relevancia
+        """
+        try:
+            return self.model.search(text, status)
+        except Exception as e:
+            print(f"✗ Error al buscar tareas: {e}")
+            return []
+    
     def get_task(self, task_id: int) -> Optional[Dict]:
         """
         Obtiene una tarea por su ID.
@@ -84,7 +179,7 @@ class TaskController:
             return None
     
     def update_task(self, task_id: int, title: str = None, 
-                   description: str = None, status: str = None, due_date: str = None) -> bool:
+                   description: str = None, status: str = None, due_date: str = None) -> Optional[Dict]:
         """
         Actualiza una tarea.
         
@@ -96,15 +191,21 @@ class TaskController:
             due_date: Nueva fecha programada/vencimiento en formato ISO (opcional)
             
         Returns:
-            True si la actualización fue exitosa, False en caso contrario
+            Diccionario con la tarea actualizada o None si hubo un error
         """
+        previous_status = self._get_statuses([task_id]).get(task_id) if status is not None else None
+        
         try:
-            return self.model.update(task_id, title, description, status, due_date)
+            task = self.model.update(task_id, title, description, status, due_date)
         except Exception as e:
             print(f"✗ Error al actualizar la tarea: {e}")
-            return False
+            return None
+        
+        if task:
+            self.bus.publish(TaskUpdated(task, previous_status))
+        return task
     
-    def update_task_status(self, task_id: int, status: str) -> bool:
+    def update_task_status(self, task_id: int, status: str) -> Optional[Dict]:
         """
         Actualiza el estado de una tarea.
         
@@ -113,13 +214,115 @@ class TaskController:
             status: Nuevo estado
             
         Returns:
-            True si la actualización fue exitosa, False en caso contrario
+            Diccionario con la tarea actualizada o None si hubo un error
         """
+        previous_status = self._get_statuses([task_id]).get(task_id)
+        
         try:
-            return self.model.update_status(task_id, status)
+            task = self.model.update_status(task_id, status)
         except Exception as e:
             print(f"✗ Error al actualizar el estado de la tarea: {e}")
+            return None
+        
+        if task:
+            self.bus.publish(TaskMoved(task_id, task['status'], task, previous_status))
+        return task
+    
+    def move_task(self, task_id: int, status: str, previous_id: int = None) -> Optional[Dict]:
+        """
+        Mueve una tarea a una columna (o dentro de la suya) y la ubica después de otra.
+        
+        Args:
+            task_id: ID de la tarea
+            status: Estado de destino
+            previous_id: ID de la tarjeta que queda justo arriba (None para ubicarla primera)
+            
+        Returns:
+            Diccionario con la tarea actualizada o None si hubo un error
+        """
+        previous_status = self._get_statuses([task_id]).get(task_id)
+        
+        try:
+            task = self.model.move(task_id, status, previous_id)
+        except Exception as e:
+            print(f"✗ Error al mover la tarea: {e}")
+            return None
+        
+        if task:
+            self.bus.publish(TaskMoved(task_id, task['status'], task, previous_status))
+        return task
+    
+    def move_tasks(self, task_ids: List[int], status: str, previous_id: int = None) -> List[Dict]:
+        """
+        Mueve varias tareas juntas a una columna con un solo commit y las
+        ubica, en orden, después de otra.
+        
+        Args:
+            task_ids: Lista de IDs de las tareas, en el orden en que deben quedar
+            status: Estado de destino
+            previous_id: ID de la tarjeta que queda justo arriba (None para ubicarlas primeras)
+            
+        Returns:
+            Lista con las tareas actualizadas (vacía si hubo un error)
+        """
+        previous_statuses = self._get_statuses(task_ids)
+        
+        try:
+            tasks = self.model.move_many(task_ids, status, previous_id)
+        except Exception as e:
+            print(f"✗ Error al mover las tareas: {e}")
+            return []
+        
+        for task in tasks:
+            self.bus.publish(TaskMoved(task['id'], task['status'], task, previous_statuses.get(task['id'])))
+        return tasks
+    
+    def update_tasks_status(self, task_ids: List[int], status: str) -> bool:
+        """
+        Mueve varias tareas al mismo estado con un solo commit.
+        
+        Args:
+            task_ids: Lista de IDs de las tareas
+            status: Nuevo estado
+            
+        Returns:
+            True si la actualización fue exitosa, False en caso contrario
+        """
+        previous_statuses = self._get_statuses(task_ids)
+        
+        try:
+            success = self.model.bulk_update_status(task_ids, status)
+        except Exception as e:
+            print(f"✗ Error al actualizar el estado de las tareas: {e}")
             return False
+        
+        if success:
+            for task_id in task_ids:
+                self.bus.publish(TaskMoved(task_id, status, previous_status=previous_statuses.get(task_id)))
+        return success
+    
+    def delete_tasks(self, task_ids: List[int]) -> bool:
+        """
+        Elimina varias tareas con un solo commit.
+        
+        Args:
+            task_ids: Lista de IDs de las tareas a eliminar
+            
+        Returns:
+            True si la eliminación fue exitosa, False en caso contrario
+        """
+        previous_statuses = self._get_statuses(task_ids)
+        
+        try:
+            success = self.model.bulk_delete(task_ids)
+        except Exception as e:
+            print(f"✗ Error al eliminar las tareas: {e}")
+            return False
+        
+        if success:
+            for task_id in task_ids:
+                self.bus.publish(TaskDeleted(task_id, previous_statuses.get(task_id)))
+        return success
     
     def delete_task(self, task_id: int) -> bool:
         """
@@ -131,11 +334,50 @@ class TaskController:
         Returns:
             True si la eliminación fue exitosa, False en caso contrario
         """
+        previous_status = self._get_statuses([task_id]).get(task_id)
+        
         try:
-            return self.model.delete(task_id)
+            success = self.model.delete(task_id)
         except Exception as e:
             print(f"✗ Error al eliminar la tarea: {e}")
             return False
+        
+        if success:
+            self.bus.publish(TaskDeleted(task_id, previous_status))
+        return success
+    
+    def get_task_counts(self) -> Dict[str, int]:
+        """
+        Cuenta las tareas de cada estado con una consulta agregada.
+        
+        Returns:
+            Diccionario {status: cantidad} (vacío si hubo un error)
+        """
+        try:
+            return self.model.count_by_status()
+        except Exception as e:
+            print(f"✗ Error al contar las tareas: {e}")
+            return {}
+    
+    def _get_statuses(self, task_ids: List[int]) -> Dict[int, str]:
+        """
+        Lee el estado previo de las tareas que se van a modificar, para que los
+        eventos permitan actualizar los contadores de forma incremental.
+        
+        Las escrituras están serializadas en DatabaseWriter, así que nadie más
+        puede cambiar el estado entre esta lectura y la escritura.
+        
+        Args:
+            task_ids: Lista de IDs de las tareas
+            
+        Returns:
+            Diccionario {task_id: status} (vacío si hubo un error)
+        """
+        try:
+            return self.model.get_statuses(task_ids)
+        except Exception as e:
+            print(f"✗ Error al obtener el estado de las tareas: {e}")
+            return {}
     
     def get_tasks_by_due_date(self, due_date: str) -> List[Dict]:
         """
@@ -153,6 +395,23 @@ class TaskController:
             print(f"✗ Error al obtener las tareas por fecha: {e}")
             return []
     
+    def get_tasks_by_due_date_range(self, start: str, end: str) -> List[Dict]:
+        """
+        Obtiene las tareas con fecha de vencimiento en el rango [start, end).
+        
+        Args:
+            start: Fecha inicial incluida en formato ISO (YYYY-MM-DD)
+            end: Fecha final excluida en formato ISO (YYYY-MM-DD)
+            
+        Returns:
+            Lista de diccionarios con las tareas
+        """
+        try:
+            return self.model.get_by_due_date_range(start, end)
+        except Exception as e:
+            print(f"✗ Error al obtener las tareas por rango de fechas: {e}")
+            return []
+    
     def get_tasks_with_due_dates(self) -> List[Dict]:
         """
         Obtiene todas las tareas que tienen una fecha de vencimiento asignada.
@@ -1,79 +1,404 @@
 """
 Módulo de gestión de base de datos SQLite.
 Maneja la conexión y creación de tablas.
+
+La instancia por defecto (db) se abre recién en su primer uso, con la ruta
+de configure(), de la variable de entorno TASKS_DB_PATH o "tasks.db".
+Las pruebas y herramientas pueden reemplazarla con use_database() o pasar
+su propia instancia a los modelos y controladores.
 """
 
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, Optional
+from app import migrations
+
+
+# Perfiles de almacenamiento: PRAGMAs aplicados al abrir la conexión.
+# Todos usan WAL, así los lectores no bloquean al escritor y cada commit
+# solo agrega páginas al log; cambian el nivel de fsync y la memoria usada.
+STORAGE_PROFILES = {
+    # fsync en cada commit: ninguna transacción confirmada se pierde ante un corte de luz
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8000,  # ~8 MB (valores negativos en KiB)
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    # fsync solo en los checkpoints: la base nunca se corrompe, pero un corte de
+    # luz puede deshacer las últimas transacciones
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -32000,  # ~32 MB
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    # Sin fsync: adecuado para importaciones masivas o bases de datos desechables
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64000,  # ~64 MB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+DEFAULT_STORAGE_PROFILE = "balanced"
+
+# Las sentencias INSERT/UPDATE ... RETURNING están disponibles desde SQLite 3.35
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Variable de entorno para elegir el perfil sin modificar el código
+STORAGE_PROFILE_ENV = "TASKS_DB_PROFILE"
+
+# Espera máxima (segundos) cuando otra conexión tiene el bloqueo de la base de
+# datos. Las escrituras esperan más: en WAL un lector solo se bloquea durante
+# la recuperación del log o un checkpoint completo.
+WRITE_BUSY_TIMEOUT = 5.0
+READ_BUSY_TIMEOUT = 2.0
+
+# Conexiones de lectura ociosas que se conservan para reutilizar en otros hilos
+READ_POOL_SIZE = 4
+
+# Sentencias preparadas que conserva cada conexión (sqlite3 las reutiliza por
+# texto SQL). Los modelos usan unas 40 sentencias fijas; el resto del margen
+# cubre las variantes de UPDATE según los campos que cambian y las de
+# "IN (?, ?, ...)" de las operaciones múltiples.
+STATEMENT_CACHE_SIZE = 256
+
+# Variable de entorno para elegir el archivo de la base de datos
+DB_PATH_ENV = "TASKS_DB_PATH"
+
+DEFAULT_DB_PATH = "tasks.db"
+
+
+def resolve_db_path(db_path: str = None) -> str:
+    """
+    Determina el archivo de base de datos a usar.
+    
+    Args:
+        db_path: Ruta pedida explícitamente (opcional)
+        
+    Returns:
+        db_path, o la variable de entorno TASKS_DB_PATH o "tasks.db"
+    """
+    return db_path or os.environ.get(DB_PATH_ENV) or DEFAULT_DB_PATH
+
+
+def _is_interrupted(error: sqlite3.Error) -> bool:
+    """Indica si la consulta se canceló (progress handler o interrupt())."""
+    return isinstance(error, sqlite3.OperationalError) and str(error) == "interrupted"
 
 
 class Database:
-    """Clase para manejar la conexión y operaciones de la base de datos SQLite."""
+    """
+    Clase para manejar la conexión y operaciones de la base de datos SQLite.
     
-    def __init__(self, db_path: str = "tasks.db"):
+    Conexiones:
+    - Principal: la del hilo que crea la instancia (la interfaz); lee y escribe.
+    - Propias: las de open_thread_connection() (p. ej. DatabaseWriter).
+    - De lectura: cualquier otro hilo que llame a fetch_all()/fetch_one() recibe
+      automáticamente una conexión query_only del pool, que se devuelve con
+      release_read_connection() o al terminar el hilo.
+    
+    Las escrituras de todas las conexiones de la instancia se serializan con un
+    lock, así nunca compiten entre sí por el bloqueo de SQLite.
+    """
+    
+    def __init__(self, db_path: str = None, profile: str = None,
+                 statement_cache_size: int = STATEMENT_CACHE_SIZE):
         """
         Inicializa la conexión a la base de datos.
         
         Args:
-            db_path: Ruta al archivo de base de datos SQLite
+            db_path: Ruta al archivo de base de datos SQLite (':memory:' para una
+                     base de datos en memoria, solo desde el hilo que la crea).
+                     Si es None se usa la variable de entorno TASKS_DB_PATH o,
+                     en su defecto, "tasks.db".
+            profile: Perfil de almacenamiento ("durable", "balanced" o "fast").
+                     Si es None se usa la variable de entorno TASKS_DB_PROFILE
+                     o, en su defecto, "balanced".
+            statement_cache_size: Sentencias preparadas que conserva cada
+                                  conexión (0 desactiva la caché; para medir)
         """
-        self.db_path = db_path
-        self.connection: Optional[sqlite3.Connection] = None
+        self.db_path = resolve_db_path(db_path)
+        self.profile = self._resolve_profile(profile)
+        self.statement_cache_size = statement_cache_size
+        self._main_connection: Optional[sqlite3.Connection] = None
+        # Estado por hilo: conexión propia de hilos de trabajo y profundidad de transaction()
+        self._local = threading.local()
+        # Escrituras serializadas (reentrante: transaction() anida execute())
+        self._write_lock = threading.RLock()
+        # Pool de lectura: conexiones ociosas y {hilo: conexión} en uso
+        self._pool_lock = threading.Lock()
+        self._idle_readers = []
+        self._busy_readers = {}
         self._connect()
         self._create_tables()
     
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Conexión que corresponde al hilo actual.
+        
+        Los hilos que llamaron a open_thread_connection() usan su propia
+        conexión; el resto usa la conexión principal (hilo de la interfaz).
+        """
+        return getattr(self._local, 'connection', None) or self._main_connection
+    
+    @property
+    def is_memory(self) -> bool:
+        """
+        Indica si la base de datos es ':memory:'.
+        
+        Cada conexión a ':memory:' abre una base de datos vacía distinta: solo
+        la conexión principal ve las tablas, así que no hay conexiones propias
+        ni pool de lectura para otros hilos.
+        """
+        return self.db_path == ":memory:"
+    
+    def require_file(self, operation: str):
+        """
+        Rechaza una operación que necesita otra conexión a la misma base de datos.
+        
+        Args:
+            operation: Descripción de la operación (para el mensaje de error)
+            
+        Raises:
+            sqlite3.ProgrammingError: Si la base de datos es ':memory:'
+        """
+        if self.is_memory:
+            raise sqlite3.ProgrammingError(
+                f"{operation} necesita una base de datos en archivo: "
+                f"':memory:' solo existe en la conexión principal")
+    
+    @property
+    def _transaction_depth(self) -> int:
+        """Cantidad de bloques transaction() abiertos en el hilo actual."""
+        return getattr(self._local, 'transaction_depth', 0)
+    
+    @_transaction_depth.setter
+    def _transaction_depth(self, value: int):
+        self._local.transaction_depth = value
+    
+    def query_count(self) -> int:
+        """
+        Cantidad de sentencias ejecutadas desde el hilo actual.
+        
+        Sirve para medir cuántas consultas provoca una acción de la interfaz
+        (p. ej. cambiar de vista con --profile-views).
+        """
+        return getattr(self._local, 'query_count', 0)
+    
+    def _count_query(self):
+        """Suma una sentencia al contador del hilo actual."""
+        self._local.query_count = self.query_count() + 1
+    
+    @staticmethod
+    def _resolve_profile(profile: str = None) -> str:
+        """
+        Determina el perfil de almacenamiento a usar.
+        
+        Args:
+            profile: Perfil pedido explícitamente (opcional)
+            
+        Returns:
+            Nombre de un perfil existente en STORAGE_PROFILES
+        """
+        name = (profile or os.environ.get(STORAGE_PROFILE_ENV) or DEFAULT_STORAGE_PROFILE).strip().lower()
+        
+        if name not in STORAGE_PROFILES:
+            print(f"⚠ Advertencia: Perfil de almacenamiento desconocido '{name}'. "
+                  f"Se usará '{DEFAULT_STORAGE_PROFILE}'.")
+            name = DEFAULT_STORAGE_PROFILE
+        
+        return name
+    
     def _connect(self):
         """Establece la conexión con la base de datos."""
         try:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row  # Permite acceso por nombre de columna
+            self._main_connection = sqlite3.connect(self.db_path, timeout=WRITE_BUSY_TIMEOUT,
+                                                    cached_statements=self.statement_cache_size)
+            self._main_thread = threading.get_ident()
+            self._main_connection.row_factory = sqlite3.Row  # Permite acceso por nombre de columna
             print(f"✓ Conexión establecida con la base de datos: {self.db_path}")
+            self._apply_profile(self._main_connection, report=True)
         except sqlite3.Error as e:
             print(f"✗ Error al conectar con la base de datos: {e}")
             raise
     
-    def _create_tables(self):
-        """Crea las tablas necesarias si no existen."""
-        try:
-            cursor = self.connection.cursor()
-            
-            # Tabla de tareas
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    status TEXT NOT NULL DEFAULT 'todo',
-                    created_at TEXT NOT NULL,
-                    due_date TEXT
-                )
-            """)
-            
-            # Agregar columna due_date si no existe (para bases de datos existentes)
-            try:
-                cursor.execute("ALTER TABLE tasks ADD COLUMN due_date TEXT")
-                self.connection.commit()
-                print("✓ Columna 'due_date' agregada a la tabla 'tasks'")
-            except sqlite3.OperationalError:
-                # La columna ya existe, no hacer nada
-                pass
+    def _apply_profile(self, connection: sqlite3.Connection, report: bool = False):
+        """
+        Aplica los PRAGMAs del perfil de almacenamiento a una conexión.
+        
+        Args:
+            connection: Conexión a configurar
+            report: Si es True, imprime los valores efectivos
+        """
+        settings = STORAGE_PROFILES[self.profile]
+        
+        for pragma, value in settings.items():
+            connection.execute(f"PRAGMA {pragma} = {value}")
+        
+        if report:
+            # Leer los valores efectivos (p. ej. journal_mode es 'memory' en ':memory:',
+            # donde mmap_size no retorna ninguna fila)
+            rows = {pragma: connection.execute(f"PRAGMA {pragma}").fetchone() for pragma in settings}
+            effective = ", ".join(
+                f"{pragma}={row[0] if row else '-'}" for pragma, row in rows.items()
+            )
+            print(f"✓ Perfil de almacenamiento '{self.profile}': {effective}")
+    
+    def open_thread_connection(self, read_only: bool = False):
+        """
+        Abre una conexión propia para el hilo actual.
+        
+        A partir de esta llamada, todas las operaciones de esta instancia
+        (y por lo tanto de los modelos) ejecutadas desde el hilo usan esa
+        conexión. Debe cerrarse con close_thread_connection() en el mismo hilo.
+        
+        Args:
+            read_only: Si es True, la conexión rechaza cualquier escritura
             
-            # Tabla de notas
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS notes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    content TEXT,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """)
+        Raises:
+            sqlite3.ProgrammingError: Si la base de datos es ':memory:'
+        """
+        if getattr(self._local, 'connection', None) is not None:
+            return
+        
+        self.require_file("Una conexión propia del hilo")
+        
+        self._local.connection = self._open_connection(read_only)
+    
+    def close_thread_connection(self):
+        """Cierra la conexión abierta con open_thread_connection() en el hilo actual."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+    
+    def _open_connection(self, read_only: bool, shared: bool = False) -> sqlite3.Connection:
+        """
+        Abre una conexión adicional con el perfil de almacenamiento.
+        
+        Args:
+            read_only: Si es True, la conexión rechaza cualquier escritura
+            shared: Si es True, la conexión puede pasar de un hilo a otro (pool)
             
-            self.connection.commit()
-            print("✓ Tabla 'tasks' verificada/creada correctamente")
-            print("✓ Tabla 'notes' verificada/creada correctamente")
+        Returns:
+            Conexión nueva
+        """
+        connection = sqlite3.connect(self.db_path, check_same_thread=not shared,
+                                     timeout=READ_BUSY_TIMEOUT if read_only else WRITE_BUSY_TIMEOUT,
+                                     cached_statements=self.statement_cache_size)
+        connection.row_factory = sqlite3.Row
+        self._apply_profile(connection)
+        if read_only:
+            connection.execute("PRAGMA query_only = ON")
+        return connection
+    
+    def _read_connection(self) -> sqlite3.Connection:
+        """
+        Conexión para las lecturas del hilo actual.
+        
+        Dentro de transaction() se lee con la conexión que escribe (ve sus
+        propios cambios). Los hilos sin conexión propia toman una del pool de
+        lectura.
+        
+        Raises:
+            sqlite3.ProgrammingError: Si la base de datos es ':memory:' y el hilo
+                                      no es el de la conexión principal
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            return connection
+        if threading.get_ident() == self._main_thread or self._transaction_depth > 0:
+            return self._main_connection
+        
+        self.require_file("Leer desde otro hilo")
+        reader = getattr(self._local, 'reader', None)
+        if reader is None:
+            reader = self._acquire_reader()
+            self._local.reader = reader
+        return reader
+    
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Toma una conexión de lectura del pool (o abre una) para el hilo actual."""
+        with self._pool_lock:
+            self._reclaim_readers()
+            reader = self._idle_readers.pop() if self._idle_readers else None
+        
+        if reader is None:
+            reader = self._open_connection(read_only=True, shared=True)
+        
+        with self._pool_lock:
+            self._busy_readers[threading.current_thread()] = reader
+        return reader
+    
+    def _reclaim_readers(self):
+        """Devuelve al pool las conexiones de hilos que ya terminaron (con _pool_lock tomado)."""
+        for thread in [thread for thread in self._busy_readers if not thread.is_alive()]:
+            self._park_reader(self._busy_readers.pop(thread))
+    
+    def _park_reader(self, reader: sqlite3.Connection):
+        """Deja una conexión de lectura ociosa, o la cierra si el pool está lleno (con _pool_lock tomado)."""
+        if reader.in_transaction:
+            reader.rollback()  # Un read_snapshot() que no terminó
+        if len(self._idle_readers) < READ_POOL_SIZE:
+            self._idle_readers.append(reader)
+        else:
+            reader.close()
+    
+    def release_read_connection(self):
+        """
+        Devuelve al pool la conexión de lectura del hilo actual.
+        
+        Conviene llamarla al terminar el trabajo de un hilo; si no, la conexión
+        se recupera cuando el hilo termina y otro hilo pide una.
+        """
+        reader = getattr(self._local, 'reader', None)
+        if reader is None:
+            return
+        self._local.reader = None
+        
+        with self._pool_lock:
+            self._busy_readers.pop(threading.current_thread(), None)
+            self._park_reader(reader)
+    
+    @contextmanager
+    def read_snapshot(self):
+        """
+        Agrupa varias lecturas sobre una misma versión de la base de datos.
+        
+        Con WAL, las escrituras que se confirmen durante el bloque no se ven
+        hasta salir de él. Solo para lecturas. Fuera del hilo de la conexión
+        principal necesita una base de datos en archivo.
+        
+        Ejemplo:
+            with db.read_snapshot():
+                initial = db.fetch_all(...)
+                events = db.fetch_all(...)
+        """
+        connection = self._read_connection()
+        started = not connection.in_transaction
+        if started:
+            connection.execute("BEGIN")  # Diferida: la versión se fija en la primera lectura
+        
+        try:
+            yield self
+        finally:
+            if started:
+                connection.commit()
+    
+    def _create_tables(self):
+        """Crea o actualiza el esquema aplicando las migraciones pendientes."""
+        try:
+            migrations.migrate(self.connection)
         except sqlite3.Error as e:
             print(f"✗ Error al crear las tablas: {e}")
             raise
@@ -89,15 +414,120 @@ class Database:
         Returns:
             Cursor con el resultado de la consulta
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
+        with self._write_lock:
+            try:
+                connection = self.connection
+                cursor = connection.cursor()
+                self._count_query()
+                cursor.execute(query, params)
+                self._commit_if_autocommit()
+                return cursor
+            except sqlite3.Error as e:
+                print(f"✗ Error al ejecutar la consulta: {e}")
+                self._rollback_if_autocommit()
+                raise
+    
+    def execute_returning(self, query: str, params: tuple = ()) -> Optional[dict]:
+        """
+        Ejecuta una sentencia con cláusula RETURNING y retorna la fila escrita.
+        
+        Evita tener que volver a leer la fila después de escribirla.
+        
+        Args:
+            query: Sentencia INSERT/UPDATE con RETURNING
+            params: Parámetros para la consulta (tupla)
+            
+        Returns:
+            Diccionario con la fila retornada o None si no se afectó ninguna fila
+        """
+        with self._write_lock:
+            try:
+                connection = self.connection
+                cursor = connection.cursor()
+                self._count_query()
+                cursor.execute(query, params)
+                row = cursor.fetchone()
+                cursor.fetchall()  # Terminar la sentencia antes del commit
+                self._commit_if_autocommit()
+                return dict(row) if row else None
+            except sqlite3.Error as e:
+                print(f"✗ Error al ejecutar la consulta: {e}")
+                self._rollback_if_autocommit()
+                raise
+    
+    def executemany(self, query: str, params_list: Iterable[tuple]) -> sqlite3.Cursor:
+        """
+        Ejecuta una misma sentencia SQL para cada tupla de parámetros.
+        
+        La sentencia se prepara una sola vez y todas las filas se confirman
+        en un único commit.
+        
+        Args:
+            query: Sentencia SQL a ejecutar
+            params_list: Secuencia de tuplas de parámetros
+            
+        Returns:
+            Cursor con el resultado (rowcount es el total de filas afectadas)
+        """
+        with self._write_lock:
+            try:
+                connection = self.connection
+                cursor = connection.cursor()
+                self._count_query()
+                cursor.executemany(query, params_list)
+                self._commit_if_autocommit()
+                return cursor
+            except sqlite3.Error as e:
+                print(f"✗ Error al ejecutar la consulta en lote: {e}")
+                self._rollback_if_autocommit()
+                raise
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Agrupa varias escrituras en una sola transacción (un solo commit).
+        
+        Dentro del bloque, execute() y executemany() no confirman cada
+        sentencia. Si el bloque termina con una excepción se deshace todo.
+        Los bloques anidados se unen a la transacción exterior.
+        
+        Ejemplo:
+            with db.transaction():
+                db.execute(...)
+                db.execute(...)
+        """
+        # Las demás conexiones de la instancia esperan al lock, no a SQLite
+        with self._write_lock:
+            if self._transaction_depth == 0:
+                # Tomar el bloqueo de escritura desde el inicio
+                self.connection.execute("BEGIN IMMEDIATE")
+            self._transaction_depth += 1
+            
+            try:
+                yield self
+            except BaseException:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self.connection.rollback()
+                raise
+            else:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self.connection.commit()
+    
+    def in_transaction(self) -> bool:
+        """Indica si hay un bloque transaction() abierto."""
+        return self._transaction_depth > 0
+    
+    def _commit_if_autocommit(self):
+        """Confirma la sentencia si no hay un bloque transaction() abierto."""
+        if self._transaction_depth == 0:
             self.connection.commit()
-            return cursor
-        except sqlite3.Error as e:
-            print(f"✗ Error al ejecutar la consulta: {e}")
+    
+    def _rollback_if_autocommit(self):
+        """Deshace la sentencia fallida si no hay un bloque transaction() abierto."""
+        if self._transaction_depth == 0:
             self.connection.rollback()
-            raise
     
     def fetch_all(self, query: str, params: tuple = ()) -> list:
         """
@@ -111,13 +541,17 @@ class Database:
             Lista de diccionarios con los resultados
         """
         try:
-            cursor = self.connection.cursor()
+            connection = self._read_connection()
+            cursor = connection.cursor()
+            self._count_query()
             cursor.execute(query, params)
             rows = cursor.fetchall()
             # Convertir Row objects a diccionarios
             return [dict(row) for row in rows]
         except sqlite3.Error as e:
-            print(f"✗ Error al obtener los resultados: {e}")
+            # Las lecturas canceladas por QueryScheduler no son errores
+            if not _is_interrupted(e):
+                print(f"✗ Error al obtener los resultados: {e}")
             raise
     
     def fetch_one(self, query: str, params: tuple = ()) -> Optional[dict]:
@@ -132,21 +566,153 @@ class Database:
             Diccionario con el resultado o None si no hay resultados
         """
         try:
-            cursor = self.connection.cursor()
+            connection = self._read_connection()
+            cursor = connection.cursor()
+            self._count_query()
             cursor.execute(query, params)
             row = cursor.fetchone()
             return dict(row) if row else None
         except sqlite3.Error as e:
-            print(f"✗ Error al obtener el resultado: {e}")
+            # Las lecturas canceladas por QueryScheduler no son errores
+            if not _is_interrupted(e):
+                print(f"✗ Error al obtener el resultado: {e}")
             raise
     
     def close(self):
-        """Cierra la conexión con la base de datos."""
-        if self.connection:
-            self.connection.close()
+        """Cierra la conexión principal y las conexiones del pool de lectura."""
+        with self._pool_lock:
+            for reader in self._idle_readers + list(self._busy_readers.values()):
+                reader.close()
+            self._idle_readers.clear()
+            self._busy_readers.clear()
+        
+        if self._main_connection:
+            self._main_connection.close()
             print("✓ Conexión con la base de datos cerrada")
 
 
-# Instancia global de la base de datos
-db = Database()
+# ==================== INSTANCIA POR DEFECTO ====================
+
+_default_database: Optional[Database] = None
+_default_settings = {"db_path": None, "profile": None}
+_default_lock = threading.Lock()
+
+
+def configure(db_path: str = None, profile: str = None):
+    """
+    Define la ruta y el perfil de la base de datos por defecto.
+    
+    Debe llamarse antes del primer uso (p. ej. al procesar la línea de
+    comandos); si la base de datos por defecto ya estaba abierta, se cierra
+    y se vuelve a abrir con la nueva configuración en el próximo uso.
+    
+    Args:
+        db_path: Ruta al archivo SQLite (None para TASKS_DB_PATH o "tasks.db")
+        profile: Perfil de almacenamiento (None para TASKS_DB_PROFILE o "balanced")
+    """
+    global _default_database
+    
+    with _default_lock:
+        _default_settings["db_path"] = db_path
+        _default_settings["profile"] = profile
+        if _default_database is not None:
+            _default_database.close()
+            _default_database = None
+
+
+def configure_from_args(argv: List[str]) -> str:
+    """
+    Configura la base de datos por defecto con la opción --db RUTA (o --db=RUTA)
+    de la línea de comandos.
+    
+    Args:
+        argv: Argumentos del programa (p. ej. sys.argv)
+        
+    Returns:
+        Ruta efectiva de la base de datos por defecto
+    """
+    db_path = None
+    for i, arg in enumerate(argv):
+        if arg == "--db" and i + 1 < len(argv):
+            db_path = argv[i + 1]
+        elif arg.startswith("--db="):
+            db_path = arg[len("--db="):]
+    
+    if db_path:
+        configure(db_path, _default_settings["profile"])
+    return resolve_db_path(_default_settings["db_path"])
+
+
+def get_database() -> Database:
+    """
+    Retorna la base de datos por defecto, abriéndola en el primer uso.
+    
+    La primera llamada debe hacerse desde el hilo de la interfaz: la conexión
+    principal pertenece al hilo que la abre.
+    
+    Returns:
+        Instancia de Database
+    """
+    global _default_database
+    
+    with _default_lock:
+        if _default_database is None:
+            _default_database = Database(**_default_settings)
+        return _default_database
+
+
+def set_database(database: Optional[Database]) -> Optional[Database]:
+    """
+    Reemplaza la base de datos por defecto (sin cerrar la anterior).
+    
+    Args:
+        database: Nueva instancia (None para volver a abrirla en el próximo uso)
+        
+    Returns:
+        Instancia reemplazada (None si todavía no se había abierto)
+    """
+    global _default_database
+    
+    with _default_lock:
+        previous, _default_database = _default_database, database
+        return previous
+
+
+@contextmanager
+def use_database(database: Database):
+    """
+    Usa otra base de datos como instancia por defecto dentro del bloque.
+    
+    Ejemplo (código que todavía usa la instancia por defecto):
+        with use_database(Database(str(tmp_path / "tasks.db"))):
+            TaskModel.create("Tarea")
+    
+    Args:
+        database: Instancia a usar; se cierra al salir del bloque
+    """
+    previous = set_database(database)
+    try:
+        yield database
+    finally:
+        set_database(previous)
+        database.close()
+
+
+class _DefaultDatabase:
+    """
+    Referencia a la base de datos por defecto.
+    
+    Reenvía cada atributo a get_database(), así importar los modelos no abre
+    el archivo ni aplica las migraciones.
+    """
+    
+    def __getattr__(self, name: str):
+        return getattr(get_database(), name)
+    
+    def __repr__(self) -> str:
+        return f"<base de datos por defecto: {_default_database.db_path if _default_database else 'sin abrir'}>"
+
+
+# Instancia global de la base de datos (se abre en el primer uso)
+db = _DefaultDatabase()
 
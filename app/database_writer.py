@@ -0,0 +1,132 @@
+"""
+Módulo de escritura en segundo plano.
+Ejecuta las escrituras en un hilo dedicado, con su propia conexión, para que
+el bucle de eventos de Qt nunca se bloquee esperando a SQLite.
+"""
+
+import itertools
+import queue
+import threading
+import traceback
+from typing import Callable, Dict, Optional, Tuple
+from PyQt5.QtCore import QObject, pyqtSignal
+from app.database import Database, get_database
+
+
+class DatabaseWriter(QObject):
+    """
+    Cola de escrituras atendida por un hilo de trabajo.
+
+    Los trabajos se ejecutan en orden de llegada (FIFO), de modo que las
+    escrituras de un mismo usuario nunca se reordenan. Los resultados vuelven
+    al hilo de la interfaz a través de señales de Qt.
+    """
+
+    # Señal cuando un trabajo termina: job_id, valor retornado
+    job_finished = pyqtSignal(int, object)
+
+    # Señal cuando un trabajo lanza una excepción: job_id, mensaje de error
+    job_failed = pyqtSignal(int, str)
+
+    _STOP = object()  # Marca para detener el hilo
+
+    def __init__(self, database: Database = None, parent=None):
+        """
+        Inicializa el escritor y arranca su hilo.
+
+        Args:
+            database: Base de datos sobre la que se escribe (None para la instancia
+                      por defecto, que se abre aquí y no en el hilo de trabajo)
+            parent: Objeto padre
+
+        Raises:
+            sqlite3.ProgrammingError: Si la base de datos es ':memory:' (el hilo
+                                      no podría abrir su conexión)
+        """
+        super().__init__(parent)
+        self.database = database if database is not None else get_database()
+        self.database.require_file("DatabaseWriter")
+        self._queue = queue.Queue()
+        self._job_ids = itertools.count(1)
+        # {job_id: (on_finished, on_error)}; solo se usa desde el hilo de la interfaz
+        self._callbacks: Dict[int, Tuple[Optional[Callable], Optional[Callable]]] = {}
+
+        # Las señales emitidas desde el hilo de trabajo se entregan en el hilo
+        # de este QObject (la interfaz) mediante conexiones en cola
+        self.job_finished.connect(self._on_job_finished)
+        self.job_failed.connect(self._on_job_failed)
+
+        self._thread = threading.Thread(target=self._run, name="DatabaseWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, function: Callable, *args, on_finished: Callable = None,
+               on_error: Callable = None, **kwargs) -> int:
+        """
+        Encola un trabajo de escritura.
+
+        Args:
+            function: Función a ejecutar en el hilo de trabajo (p. ej. un método
+                      del controlador); los modelos usarán la conexión del hilo
+            *args: Argumentos posicionales para la función
+            on_finished: Callback (en el hilo de la interfaz) con el valor retornado
+            on_error: Callback (en el hilo de la interfaz) con el mensaje de error
+            **kwargs: Argumentos con nombre para la función
+
+        Returns:
+            ID del trabajo encolado
+        """
+        job_id = next(self._job_ids)
+        self._callbacks[job_id] = (on_finished, on_error)
+        self._queue.put((job_id, function, args, kwargs))
+        return job_id
+
+    def pending_jobs(self) -> int:
+        """Retorna la cantidad de trabajos encolados o en ejecución."""
+        return len(self._callbacks)
+
+    def stop(self, wait: bool = True):
+        """
+        Detiene el hilo después de procesar los trabajos ya encolados.
+
+        Args:
+            wait: Si es True, espera a que el hilo termine
+        """
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            if wait:
+                self._thread.join()
+
+    def _run(self):
+        """Bucle del hilo de trabajo."""
+        self.database.open_thread_connection()
+
+        try:
+            while True:
+                job = self._queue.get()
+                if job is self._STOP:
+                    break
+
+                job_id, function, args, kwargs = job
+                try:
+                    result = function(*args, **kwargs)
+                except Exception as e:
+                    traceback.print_exc()
+                    self.job_failed.emit(job_id, str(e))
+                else:
+                    self.job_finished.emit(job_id, result)
+        finally:
+            self.database.close_thread_connection()
+
+    def _on_job_finished(self, job_id: int, result):
+        """Entrega el resultado al callback del trabajo (hilo de la interfaz)."""
+        on_finished, _ = self._callbacks.pop(job_id, (None, None))
+        if on_finished:
+            on_finished(result)
+
+    def _on_job_failed(self, job_id: int, message: str):
+        """Entrega el error al callback del trabajo (hilo de la interfaz)."""
+        _, on_error = self._callbacks.pop(job_id, (None, None))
+        if on_error:
+            on_error(message)
+        else:
+            print(f"✗ Error en la escritura en segundo plano: {message}")
@@ -0,0 +1,129 @@
+"""
+Módulo de eventos de la aplicación.
+Define los eventos de cambio que publican los controladores y el bus que los
+entrega a las vistas, para que cada una aplique solo lo que cambió.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Type
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+# ==================== EVENTOS DE TAREAS ====================
+
+@dataclass(frozen=True)
+class TaskCreated:
+    """Se creó una tarea."""
+    task: Dict
+
+
+@dataclass(frozen=True)
+class TaskUpdated:
+    """Cambiaron los datos de una tarea (previous_status solo si pudo cambiar el estado)."""
+    task: Dict
+    previous_status: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TaskMoved:
+    """Una tarea cambió de estado (task es None en los cambios múltiples)."""
+    task_id: int
+    status: str
+    task: Optional[Dict] = None
+    previous_status: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TaskDeleted:
+    """Se eliminó una tarea (status es el estado que tenía)."""
+    task_id: int
+    status: Optional[str] = None
+
+
+# ==================== EVENTOS DE NOTAS ====================
+
+@dataclass(frozen=True)
+class NoteCreated:
+    """Se creó una nota."""
+    note: Dict
+
+
+@dataclass(frozen=True)
+class NoteUpdated:
+    """Cambiaron los datos de una nota."""
+    note: Dict
+
+
+@dataclass(frozen=True)
+class NoteDeleted:
+    """Se eliminó una nota."""
+    note_id: int
+
+
+# ==================== BUS ====================
+
+class EventBus(QObject):
+    """
+    Bus de eventos con suscripción por tipo de evento.
+
+    Los eventos pueden publicarse desde cualquier hilo (p. ej. el de
+    DatabaseWriter); los suscriptores siempre los reciben en el hilo del bus
+    (la interfaz), en el orden en que se publicaron.
+    """
+
+    # Señal interna: conexión directa desde el mismo hilo, en cola desde otro
+    _published = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        """
+        Inicializa el bus sin suscriptores.
+
+        Args:
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+        self._subscribers: Dict[Type, List[Callable]] = {}  # {tipo_evento: [handlers]}
+        self._published.connect(self._dispatch)
+
+    def subscribe(self, event_type: Type, handler: Callable):
+        """
+        Suscribe un manejador a un tipo de evento.
+
+        Args:
+            event_type: Clase del evento (p. ej. TaskCreated)
+            handler: Función que recibe el evento
+        """
+        self._subscribers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: Type, handler: Callable):
+        """
+        Quita un manejador de un tipo de evento.
+
+        Args:
+            event_type: Clase del evento
+            handler: Función suscrita
+        """
+        handlers = self._subscribers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def publish(self, event):
+        """
+        Publica un evento. Puede llamarse desde cualquier hilo.
+
+        Args:
+            event: Instancia de uno de los eventos de este módulo
+        """
+        self._published.emit(event)
+
+    def _dispatch(self, event):
+        """Entrega el evento a sus suscriptores (hilo del bus)."""
+        for handler in list(self._subscribers.get(type(event), ())):
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"✗ Error al procesar el evento {type(event).__name__}: {e}")
+
+
+# Instancia global del bus de eventos
+event_bus = EventBus()
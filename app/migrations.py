@@ -0,0 +1,294 @@
+"""
+Módulo de migraciones del esquema.
+Aplica una sola vez los pasos de esquema pendientes según PRAGMA user_version.
+"""
+
+import sqlite3
+from typing import Callable, List, Tuple
+from app.positions import key_between
+
+
+def _create_base_tables(connection: sqlite3.Connection):
+    """Crea las tablas tasks y notes (y agrega due_date a bases de datos antiguas)."""
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            status TEXT NOT NULL DEFAULT 'todo',
+            created_at TEXT NOT NULL,
+            due_date TEXT
+        )
+    """)
+
+    # Bases de datos creadas antes de que existiera la columna due_date
+    columns = [row[1] for row in connection.execute("PRAGMA table_info(tasks)")]
+    if "due_date" not in columns:
+        connection.execute("ALTER TABLE tasks ADD COLUMN due_date TEXT")
+
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS notes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            content TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+
+def _create_indexes(connection: sqlite3.Connection):
+    """Crea los índices secundarios usados por TaskModel y NoteModel."""
+    # Columnas del Kanban: WHERE status = ? ORDER BY created_at DESC, id DESC.
+    # Se recorre en sentido inverso, así el rowid implícito también queda DESC.
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_created_at ON tasks (status, created_at)")
+    # Listado general: ORDER BY created_at DESC
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at)")
+    # Calendario: rangos sobre due_date (solo tareas con fecha)
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date) WHERE due_date IS NOT NULL")
+    # Bloc de notas: ORDER BY updated_at DESC
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_notes_updated_at ON notes (updated_at)")
+
+
+def _create_task_events(connection: sqlite3.Connection):
+    """
+    Crea el historial de cambios de estado de las tareas.
+    
+    Los triggers registran cada alta, cambio de estado y eliminación, sin
+    importar qué método de TaskModel haga la escritura (incluidas las
+    operaciones múltiples con executemany).
+    """
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS task_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id INTEGER NOT NULL,
+            from_status TEXT,
+            to_status TEXT,
+            occurred_at TEXT NOT NULL
+        )
+    """)
+    # from_status es NULL al crear la tarea y to_status es NULL al eliminarla
+    
+    # Ventanas de tiempo: WHERE occurred_at >= ? AND occurred_at < ?
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_task_events_occurred_at ON task_events (occurred_at)")
+    # Historial de una tarea (lead time y cycle time)
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_task_events_task_id ON task_events (task_id, occurred_at)")
+    # Tareas terminadas en una ventana: WHERE to_status = 'done' AND occurred_at ...
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_task_events_to_status ON task_events (to_status, occurred_at)")
+    
+    # Mismo formato que datetime.now().isoformat() (hora local)
+    now = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+    
+    connection.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_event_insert AFTER INSERT ON tasks
+        BEGIN
+            INSERT INTO task_events (task_id, from_status, to_status, occurred_at)
+            VALUES (NEW.id, NULL, NEW.status, NEW.created_at);
+        END
+    """)
+    connection.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_event_status AFTER UPDATE OF status ON tasks
+        WHEN OLD.status IS NOT NEW.status
+        BEGIN
+            INSERT INTO task_events (task_id, from_status, to_status, occurred_at)
+            VALUES (NEW.id, OLD.status, NEW.status, {now});
+        END
+    """)
+    connection.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_event_delete AFTER DELETE ON tasks
+        BEGIN
+            INSERT INTO task_events (task_id, from_status, to_status, occurred_at)
+            VALUES (OLD.id, OLD.status, NULL, {now});
+        END
+    """)
+    
+    # Las tareas existentes no tienen historial: se registra su alta en el estado actual
+    connection.execute("""
+        INSERT INTO task_events (task_id, from_status, to_status, occurred_at)
+        SELECT id, NULL, status, created_at FROM tasks
+    """)
+
+
+def _create_fts_index(connection: sqlite3.Connection, table: str, columns: Tuple[str, ...]):
+    """
+    Crea un índice FTS5 de contenido externo sobre una tabla y los triggers
+    que lo mantienen sincronizado.
+    
+    Args:
+        connection: Conexión SQLite
+        table: Tabla indexada (su rowid es la columna id)
+        columns: Columnas de texto a indexar
+    """
+    fts = f"{table}_fts"
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"NEW.{column}" for column in columns)
+    old_values = ", ".join(f"OLD.{column}" for column in columns)
+    
+    # remove_diacritics: "cancion" encuentra "canción"
+    connection.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+            {column_list},
+            content='{table}', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    
+    connection.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{fts}_insert AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO {fts} (rowid, {column_list}) VALUES (NEW.id, {new_values});
+        END
+    """)
+    connection.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{fts}_delete AFTER DELETE ON {table}
+        BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', OLD.id, {old_values});
+        END
+    """)
+    # Solo cuando cambia el texto: mover una tarea no toca el índice
+    connection.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{fts}_update AFTER UPDATE OF {column_list} ON {table}
+        BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', OLD.id, {old_values});
+            INSERT INTO {fts} (rowid, {column_list}) VALUES (NEW.id, {new_values});
+        END
+    """)
+    
+    # Indexar las filas existentes
+    connection.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+
+def _create_search_indexes(connection: sqlite3.Connection):
+    """Crea los índices de búsqueda de texto completo de tareas y notas."""
+    _create_fts_index(connection, "tasks", ("title", "description"))
+    _create_fts_index(connection, "notes", ("title", "content"))
+
+
+def _add_task_positions(connection: sqlite3.Connection):
+    """
+    Agrega la posición manual de cada tarea dentro de su columna.
+    
+    La posición es una clave de app.positions: reordenar una tarjeta escribe
+    solo su fila. Las tareas existentes conservan el orden que mostraba el
+    tablero (más recientes primero).
+    """
+    columns = [row[1] for row in connection.execute("PRAGMA table_info(tasks)")]
+    if "position" not in columns:
+        connection.execute("ALTER TABLE tasks ADD COLUMN position TEXT")
+    
+    # Claves crecientes en el orden anterior; como solo se comparan dentro de
+    # un mismo estado, una sola secuencia sirve para las tres columnas
+    rows = connection.execute("SELECT id FROM tasks ORDER BY created_at DESC, id DESC").fetchall()
+    key = None
+    positions = []
+    for (task_id,) in rows:
+        key = key_between(key, None)
+        positions.append((key, task_id))
+    connection.executemany("UPDATE tasks SET position = ? WHERE id = ?", positions)
+    
+    # Columnas del Kanban: WHERE status = ? ORDER BY position, id
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_position ON tasks (status, position)")
+
+
+def _guard_fts_update_triggers(connection: sqlite3.Connection):
+    """
+    Limita la reindexación FTS5 a los cambios reales de texto.
+    
+    "UPDATE OF title, ..." dispara aunque el valor no cambie: el diálogo de
+    edición guarda siempre el título y la descripción (o el contenido), así
+    que cambiar solo la fecha de una tarea, o guardar sin cambios, borraba
+    y volvía a insertar su entrada FTS5.
+    """
+    for table, columns in (("tasks", ("title", "description")), ("notes", ("title", "content"))):
+        fts = f"{table}_fts"
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"NEW.{column}" for column in columns)
+        old_values = ", ".join(f"OLD.{column}" for column in columns)
+        changed = " OR ".join(f"OLD.{column} IS NOT NEW.{column}" for column in columns)
+        
+        connection.execute(f"DROP TRIGGER IF EXISTS trg_{fts}_update")
+        connection.execute(f"""
+            CREATE TRIGGER trg_{fts}_update AFTER UPDATE OF {column_list} ON {table}
+            WHEN {changed}
+            BEGIN
+                INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', OLD.id, {old_values});
+                INSERT INTO {fts} (rowid, {column_list}) VALUES (NEW.id, {new_values});
+            END
+        """)
+
+
+def _drop_status_created_at_index(connection: sqlite3.Connection):
+    """
+    Elimina el índice (status, created_at) de la migración 2.
+    
+    Desde la migración 5 las columnas del Kanban y count_by_status usan
+    (status, position); el índice anterior ya no lo usa ninguna consulta y
+    solo encarecía cada alta y cada cambio de estado.
+    """
+    connection.execute("DROP INDEX IF EXISTS idx_tasks_status_created_at")
+
+
+# Lista ordenada de migraciones: (versión, descripción, función que aplica el paso).
+# Nunca se modifica un paso ya publicado: los cambios nuevos se agregan al final.
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "Tablas 'tasks' y 'notes'", _create_base_tables),
+    (2, "Índices secundarios de tareas y notas", _create_indexes),
+    (3, "Historial de estados 'task_events'", _create_task_events),
+    (4, "Búsqueda de texto completo (FTS5) en tareas y notas", _create_search_indexes),
+    (5, "Posición manual de las tareas en su columna", _add_task_positions),
+    (6, "Reindexar FTS5 solo cuando cambia el texto", _guard_fts_update_triggers),
+    (7, "Quitar el índice (status, created_at) sin uso", _drop_status_created_at_index),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_version(connection: sqlite3.Connection) -> int:
+    """
+    Obtiene la versión del esquema guardada en la base de datos.
+
+    Args:
+        connection: Conexión SQLite
+
+    Returns:
+        Valor de PRAGMA user_version
+    """
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(connection: sqlite3.Connection) -> List[int]:
+    """
+    Aplica las migraciones pendientes, cada una en su propia transacción.
+
+    Con el esquema al día solo se lee PRAGMA user_version.
+
+    Args:
+        connection: Conexión SQLite
+
+    Returns:
+        Lista con las versiones aplicadas (vacía si el esquema estaba al día)
+    """
+    current = get_version(connection)
+    if current >= SCHEMA_VERSION:
+        return []
+
+    applied = []
+
+    for version, description, apply in MIGRATIONS:
+        if version <= current:
+            continue
+
+        # El paso y el nuevo user_version se confirman juntos o no se confirman
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            apply(connection)
+            connection.execute(f"PRAGMA user_version = {version}")
+            connection.commit()
+        except sqlite3.Error:
+            connection.rollback()
+            raise
+
+        print(f"✓ Migración {version} aplicada: {description}")
+        applied.append(version)
+
+    return applied
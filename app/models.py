@@ -3,9 +3,11 @@ Módulo de modelos de datos.
 Define la clase TaskModel para gestionar las tareas.
 """
 
-from datetime import datetime
+from datetime import datetime, date, timedelta
 from typing import List, Optional, Dict
-from app.database import db
+from app.database import Database, db, SUPPORTS_RETURNING
+from app.utils import build_fts_query
+from app.positions import key_between, keys_between
 
 
 class TaskModel:
@@ -17,10 +19,33 @@ class TaskModel:
     
     VALID_STATUSES = [STATUS_TODO, STATUS_DOING, STATUS_DONE]
     
-    @staticmethod
-    def create(title: str, description: str = "", status: str = STATUS_TODO, due_date: str = None) -> int:
+    # Cantidad de tareas por página en la carga incremental
+    PAGE_SIZE = 50
+    
+    # Cantidad máxima de resultados de una búsqueda
+    SEARCH_LIMIT = 200
+    
+    # Base de datos que usan los métodos: la instancia por defecto de
+    # app.database (se abre en el primer uso) o la indicada con bind()
+    db: Database = db
+    
+    @classmethod
+    def bind(cls, database: Database) -> type:
+        """
+        Crea una variante del modelo que trabaja sobre otra base de datos.
+        
+        Args:
+            database: Base de datos a usar (p. ej. una ':memory:' en pruebas)
+            
+        Returns:
+            Subclase de TaskModel cuyos métodos usan esa base de datos
+        """
+        return type(cls.__name__, (cls,), {"db": database})
+    
+    @classmethod
+    def create(cls, title: str, description: str = "", status: str = STATUS_TODO, due_date: str = None) -> Dict:
         """
-        Crea una nueva tarea en la base de datos.
+        Crea una nueva tarea en la base de datos, al principio de su columna.
         
         Args:
             title: Título de la tarea
@@ -29,24 +54,83 @@ class TaskModel:
             due_date: Fecha programada/vencimiento en formato ISO (opcional)
             
         Returns:
-            ID de la tarea creada
+            Diccionario con la tarea creada (incluye su ID)
         """
-        if status not in TaskModel.VALID_STATUSES:
-            status = TaskModel.STATUS_TODO
+        if status not in cls.VALID_STATUSES:
+            status = cls.STATUS_TODO
         
         created_at = datetime.now().isoformat()
         
         query = """
-            INSERT INTO tasks (title, description, status, created_at, due_date)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT INTO tasks (title, description, status, created_at, due_date, position)
+            VALUES (?, ?, ?, ?, ?, ?)
         """
-        params = (title, description, status, created_at, due_date)
         
-        cursor = db.execute(query, params)
-        return cursor.lastrowid
+        # La posición depende de la primera tarjeta actual: leer y escribir juntos
+        with cls.db.transaction():
+            position = key_between(None, cls._first_position(status))
+            params = (title, description, status, created_at, due_date, position)
+            
+            if SUPPORTS_RETURNING:
+                return cls.db.execute_returning(query + " RETURNING *", params)
+            
+            # Sin RETURNING: componer la fila con los valores insertados
+            cursor = cls.db.execute(query, params)
+            return {
+                'id': cursor.lastrowid,
+                'title': title,
+                'description': description,
+                'status': status,
+                'created_at': created_at,
+                'due_date': due_date,
+                'position': position
+            }
     
-    @staticmethod
-    def get_all() -> List[Dict]:
+    @classmethod
+    def bulk_create(cls, tasks: List[Dict]) -> List[Dict]:
+        """
+        Crea varias tareas en una sola transacción, al principio de su columna
+        (la última de la lista queda primera, como si se crearan de a una).
+        
+        Args:
+            tasks: Lista de diccionarios con title y, opcionalmente,
+                   description, status y due_date
+            
+        Returns:
+            Lista con las tareas creadas (filas persistidas), en el mismo orden
+        """
+        if not tasks:
+            return []
+        
+        created_at = datetime.now().isoformat()
+        
+        query = """
+            INSERT INTO tasks (title, description, status, created_at, due_date, position)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """
+        
+        with cls.db.transaction():
+            first_positions = {}  # {status: posición de la primera tarjeta}
+            rows = []
+            for task in tasks:
+                status = task.get('status', cls.STATUS_TODO)
+                if status not in cls.VALID_STATUSES:
+                    status = cls.STATUS_TODO
+                if status not in first_positions:
+                    first_positions[status] = cls._first_position(status)
+                first_positions[status] = key_between(None, first_positions[status])
+                rows.append((task['title'], task.get('description', ''), status,
+                             created_at, task.get('due_date'), first_positions[status]))
+            
+            cls.db.executemany(query, rows)
+            # El bloqueo de escritura se mantiene hasta el commit, así que
+            # los últimos IDs asignados son los de este lote
+            created = cls.db.fetch_all("SELECT * FROM tasks ORDER BY id DESC LIMIT ?", (len(rows),))
+        
+        return list(reversed(created))
+    
+    @classmethod
+    def get_all(cls) -> List[Dict]:
         """
         Obtiene todas las tareas de la base de datos.
         
@@ -54,10 +138,10 @@ class TaskModel:
             Lista de diccionarios con las tareas
         """
         query = "SELECT * FROM tasks ORDER BY created_at DESC"
-        return db.fetch_all(query)
+        return cls.db.fetch_all(query)
     
-    @staticmethod
-    def get_by_id(task_id: int) -> Optional[Dict]:
+    @classmethod
+    def get_by_id(cls, task_id: int) -> Optional[Dict]:
         """
         Obtiene una tarea por su ID.
         
@@ -68,28 +152,206 @@ class TaskModel:
             Diccionario con los datos de la tarea o None si no existe
         """
         query = "SELECT * FROM tasks WHERE id = ?"
-        return db.fetch_one(query, (task_id,))
+        return cls.db.fetch_one(query, (task_id,))
     
-    @staticmethod
-    def get_by_status(status: str) -> List[Dict]:
+    @classmethod
+    def get_by_status(cls, status: str) -> List[Dict]:
         """
         Obtiene todas las tareas con un estado específico.
         
         Args:
             status: Estado de las tareas a buscar
             
+        Returns:
+            Lista de diccionarios con las tareas, en el orden de su columna
+        """
+        query = "SELECT * FROM tasks WHERE status = ? ORDER BY position, id"
+        return cls.db.fetch_all(query, (status,))
+    
+    @classmethod
+    def get_page(cls, status: str, after_position: str = None, after_id: int = None,
+                 limit: int = PAGE_SIZE) -> List[Dict]:
+        """
+        Obtiene una página de las tareas de una columna usando paginación por cursor (keyset).
+        
+        Las tareas se ordenan por (position, id). Para pedir la página
+        siguiente se pasan position e id de la última tarea recibida, de modo
+        que el costo no depende de cuántas páginas se hayan leído.
+        
+        Args:
+            status: Estado de las tareas a buscar (las posiciones solo se
+                    comparan dentro de una columna)
+            after_position: position de la última tarea de la página anterior
+            after_id: ID de la última tarea de la página anterior
+            limit: Cantidad máxima de tareas a retornar
+            
         Returns:
             Lista de diccionarios con las tareas
         """
-        query = "SELECT * FROM tasks WHERE status = ? ORDER BY created_at DESC"
-        return db.fetch_all(query, (status,))
+        conditions = ["status = ?"]
+        params = [status]
+        
+        if after_position is not None and after_id is not None:
+            conditions.append("(position, id) > (?, ?)")
+            params.extend([after_position, after_id])
+        
+        query = f"SELECT * FROM tasks WHERE {' AND '.join(conditions)} ORDER BY position, id LIMIT ?"
+        params.append(limit)
+        
+        return cls.db.fetch_all(query, tuple(params))
+    
+    @classmethod
+    def search(cls, text: str, status: str = None, limit: int = SEARCH_LIMIT) -> List[Dict]:
+        """
+        Busca tareas por título y descripción con el índice FTS5.
+        
+        Args:
+            text: Texto escrito por el usuario (cada palabra se busca como prefijo)
+            status: Estado de las tareas a buscar (None para todos)
+            limit: Cantidad máxima de resultados
+            
+        Returns:
+            Lista de tareas ordenadas por relevancia (coincidencias en el título primero)
+        """
+        match = build_fts_query(text)
+        if match is None:
+            return []
+        
+        params = [match]
+        status_filter = ""
+        if status is not None:
+            status_filter = "AND tasks.status = ?"
+            params.append(status)
+        params.append(limit)
+        
+        query = f"""
+            SELECT tasks.* FROM tasks_fts
+            JOIN tasks ON tasks.id = tasks_fts.rowid
+            WHERE tasks_fts MATCH ? {status_filter}
+            ORDER BY bm25(tasks_fts, 10.0, 1.0)
+            LIMIT ?
+        """
+        return cls.db.fetch_all(query, tuple(params))
+    
+    @classmethod
+    def count_by_status(cls) -> Dict[str, int]:
+        """
+        Cuenta las tareas de cada estado con una sola consulta agregada.
+        
+        GROUP BY status recorre el índice (status, position), que cubre la
+        consulta: no se lee ninguna fila de la tabla.
+        
+        Returns:
+            Diccionario {status: cantidad} con todos los estados válidos
+        """
+        counts = {status: 0 for status in cls.VALID_STATUSES}
+        for row in cls.db.fetch_all("SELECT status, COUNT(*) AS count FROM tasks GROUP BY status"):
+            counts[row['status']] = row['count']
+        return counts
+    
+    @classmethod
+    def get_statuses(cls, task_ids: List[int]) -> Dict[int, str]:
+        """
+        Obtiene el estado actual de varias tareas.
+        
+        Args:
+            task_ids: Lista de IDs de las tareas
+            
+        Returns:
+            Diccionario {task_id: status} (las tareas inexistentes no aparecen)
+        """
+        if not task_ids:
+            return {}
+        
+        placeholders = ", ".join("?" for _ in task_ids)
+        query = f"SELECT id, status FROM tasks WHERE id IN ({placeholders})"
+        return {row['id']: row['status'] for row in cls.db.fetch_all(query, tuple(task_ids))}
     
-    @staticmethod
-    def update(task_id: int, title: str = None, description: str = None, 
-               status: str = None, due_date: str = None) -> bool:
+    @classmethod
+    def get_events(cls, start: str, end: str) -> List[Dict]:
+        """
+        Obtiene los cambios de estado registrados en el rango [start, end).
+        
+        Args:
+            start: Instante inicial incluido en formato ISO
+            end: Instante final excluido en formato ISO
+            
+        Returns:
+            Lista de eventos (task_id, from_status, to_status, occurred_at) en orden cronológico
+        """
+        query = """
+            SELECT task_id, from_status, to_status, occurred_at FROM task_events
+            WHERE occurred_at >= ? AND occurred_at < ?
+            ORDER BY occurred_at, id
+        """
+        return cls.db.fetch_all(query, (start, end))
+    
+    @classmethod
+    def get_events_of_completed(cls, start: str, end: str) -> List[Dict]:
+        """
+        Obtiene el historial completo de las tareas que llegaron a 'done' en [start, end).
+        
+        Args:
+            start: Instante inicial incluido en formato ISO
+            end: Instante final excluido en formato ISO
+            
+        Returns:
+            Lista de eventos (task_id, from_status, to_status, occurred_at) en orden cronológico
+        """
+        query = """
+            SELECT task_id, from_status, to_status, occurred_at FROM task_events
+            WHERE task_id IN (
+                SELECT task_id FROM task_events
+                WHERE to_status = ? AND occurred_at >= ? AND occurred_at < ?
+            )
+            ORDER BY occurred_at, id
+        """
+        return cls.db.fetch_all(query, (cls.STATUS_DONE, start, end))
+    
+    @classmethod
+    def count_by_status_at(cls, moment: str) -> Dict[str, int]:
+        """
+        Reconstruye cuántas tareas había en cada estado en un instante.
+        
+        Parte de los conteos actuales y deshace los eventos desde moment: solo
+        lee el historial posterior (la ventana de las métricas), así el costo
+        no crece con todo el historial. Los triggers registran cada alta,
+        cambio de estado y eliminación, de modo que los conteos actuales son
+        la suma de todos los eventos.
+        
+        Args:
+            moment: Instante en formato ISO (se cuentan los eventos anteriores)
+            
+        Returns:
+            Diccionario {status: cantidad} con todos los estados válidos
+        """
+        counts = cls.count_by_status()
+        
+        # Cada evento sumó una tarea a to_status y restó una a from_status
+        entered = cls.db.fetch_all(
+            "SELECT to_status AS status, COUNT(*) AS count FROM task_events "
+            "WHERE to_status IS NOT NULL AND occurred_at >= ? GROUP BY to_status", (moment,))
+        left = cls.db.fetch_all(
+            "SELECT from_status AS status, COUNT(*) AS count FROM task_events "
+            "WHERE from_status IS NOT NULL AND occurred_at >= ? GROUP BY from_status", (moment,))
+        
+        for row in entered:
+            if row['status'] in counts:
+                counts[row['status']] -= row['count']
+        for row in left:
+            if row['status'] in counts:
+                counts[row['status']] += row['count']
+        
+        return counts
+    
+    @classmethod
+    def update(cls, task_id: int, title: str = None, description: str = None, 
+               status: str = None, due_date: str = None) -> Optional[Dict]:
         """
         Actualiza una tarea existente.
         
+        Si cambia el estado, la tarjeta queda primera en su nueva columna.
+        
         Args:
             task_id: ID de la tarea a actualizar
             title: Nuevo título (opcional)
@@ -98,58 +360,225 @@ class TaskModel:
             due_date: Nueva fecha programada/vencimiento en formato ISO (opcional)
             
         Returns:
-            True si la actualización fue exitosa, False en caso contrario
+            Diccionario con la tarea actualizada o None si no se pudo actualizar
         """
-        # Construir la consulta dinámicamente basándose en los campos proporcionados
-        updates = []
-        params = []
+        if status not in cls.VALID_STATUSES:
+            status = None  # Un estado inválido no se modifica
         
-        if title is not None:
-            updates.append("title = ?")
-            params.append(title)
+        values = {'title': title, 'description': description, 'status': status,
+                  'due_date': due_date, 'position': None}
+        if all(value is None for value in values.values()):
+            return None
         
-        if description is not None:
-            updates.append("description = ?")
-            params.append(description)
+        try:
+            if status is None:
+                return cls._write_update(task_id, values)
+            
+            # El estado anterior se lee en la misma transacción que la escritura
+            with cls.db.transaction():
+                if cls.get_statuses([task_id]).get(task_id) != status:
+                    # Al cambiar de columna la tarjeta queda primera, como al crearla
+                    values['position'] = key_between(None, cls._first_position(status))
+                return cls._write_update(task_id, values)
+        except Exception as e:
+            print(f"✗ Error al actualizar la tarea: {e}")
+            return None
+    
+    @classmethod
+    def _write_update(cls, task_id: int, values: Dict) -> Optional[Dict]:
+        """
+        Escribe los campos indicados de una tarea.
         
-        if status is not None:
-            if status in TaskModel.VALID_STATUSES:
-                updates.append("status = ?")
-                params.append(status)
+        Args:
+            task_id: ID de la tarea
+            values: Diccionario {campo: valor}; los campos en None no se modifican
+            
+        Returns:
+            Diccionario con la tarea actualizada o None si no existe
+        """
+        # Los campos van siempre en el mismo orden, así cada combinación tiene
+        # un único texto SQL y sqlite3 reutiliza su sentencia preparada
+        fields = [field for field, value in values.items() if value is not None]
+        params = tuple(values[field] for field in fields) + (task_id,)
+        query = f"UPDATE tasks SET {', '.join(f'{field} = ?' for field in fields)} WHERE id = ?"
         
-        if due_date is not None:
-            updates.append("due_date = ?")
-            params.append(due_date)
+        if SUPPORTS_RETURNING:
+            return cls.db.execute_returning(query + " RETURNING *", params)
         
-        if not updates:
-            return False
+        with cls.db.transaction():
+            cls.db.execute(query, params)
+            return cls.get_by_id(task_id)
+    
+    @classmethod
+    def move(cls, task_id: int, status: str, previous_id: int = None) -> Optional[Dict]:
+        """
+        Mueve una tarea a una columna y la ubica después de otra tarjeta.
+        
+        Solo se escribe la fila de la tarea: su nueva posición es una clave
+        entre las de sus nuevas vecinas, sin renumerar la columna.
+        
+        Args:
+            task_id: ID de la tarea
+            status: Estado (columna) de destino; puede ser el actual
+            previous_id: ID de la tarjeta que queda justo arriba (None para
+                         ubicarla primera en la columna)
+            
+        Returns:
+            Diccionario con la tarea actualizada o None si no se pudo mover
+        """
+        if status not in cls.VALID_STATUSES:
+            return None
         
-        params.append(task_id)
-        query = f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?"
+        query = "UPDATE tasks SET status = ?, position = ? WHERE id = ?"
         
         try:
-            db.execute(query, tuple(params))
-            return True
+            # Las vecinas se leen en la misma transacción que la escritura
+            with cls.db.transaction():
+                previous = None
+                if previous_id is not None:
+                    row = cls.db.fetch_one("SELECT position FROM tasks WHERE id = ? AND status = ?",
+                                       (previous_id, status))
+                    previous = row['position'] if row else None
+                
+                following = cls._next_position(status, previous, [task_id])
+                params = (status, key_between(previous, following), task_id)
+                
+                if SUPPORTS_RETURNING:
+                    return cls.db.execute_returning(query + " RETURNING *", params)
+                
+                cls.db.execute(query, params)
+                return cls.get_by_id(task_id)
         except Exception as e:
-            print(f"✗ Error al actualizar la tarea: {e}")
-            return False
+            print(f"✗ Error al mover la tarea: {e}")
+            return None
     
-    @staticmethod
-    def update_status(task_id: int, status: str) -> bool:
+    @classmethod
+    def move_many(cls, task_ids: List[int], status: str, previous_id: int = None) -> List[Dict]:
+        """
+        Mueve varias tareas juntas a una columna, en una sola transacción.
+        
+        Las tareas quedan seguidas, en el orden de task_ids, después de
+        previous_id; solo se escriben sus filas.
+        
+        Args:
+            task_ids: Lista de IDs de las tareas, en el orden en que deben quedar
+            status: Estado (columna) de destino
+            previous_id: ID de la tarjeta que queda justo arriba (None para
+                         ubicarlas primeras en la columna)
+            
+        Returns:
+            Lista con las tareas actualizadas (vacía si no se pudieron mover)
+        """
+        if not task_ids or status not in cls.VALID_STATUSES:
+            return []
+        
+        query = "UPDATE tasks SET status = ?, position = ? WHERE id = ?"
+        
+        try:
+            with cls.db.transaction():
+                previous = None
+                if previous_id is not None and previous_id not in task_ids:
+                    row = cls.db.fetch_one("SELECT position FROM tasks WHERE id = ? AND status = ?",
+                                       (previous_id, status))
+                    previous = row['position'] if row else None
+                
+                following = cls._next_position(status, previous, task_ids)
+                positions = keys_between(previous, following, len(task_ids))
+                cls.db.executemany(query, [(status, position, task_id)
+                                       for task_id, position in zip(task_ids, positions)])
+                
+                placeholders = ", ".join("?" for _ in task_ids)
+                rows = cls.db.fetch_all(f"SELECT * FROM tasks WHERE id IN ({placeholders})", tuple(task_ids))
+        except Exception as e:
+            print(f"✗ Error al mover las tareas: {e}")
+            return []
+        
+        by_id = {row['id']: row for row in rows}
+        return [by_id[task_id] for task_id in task_ids if task_id in by_id]
+    
+    @classmethod
+    def _first_position(cls, status: str) -> Optional[str]:
+        """Posición de la primera tarjeta de una columna (None si está vacía)."""
+        return cls._next_position(status, None)
+    
+    @classmethod
+    def _next_position(cls, status: str, position: Optional[str], exclude_ids: List[int] = ()) -> Optional[str]:
+        """
+        Obtiene la posición de la tarjeta que sigue a una posición en su columna.
+        
+        Args:
+            status: Estado (columna)
+            position: Posición de referencia (None para la primera tarjeta)
+            exclude_ids: IDs de tareas a ignorar (las que se están moviendo)
+            
+        Returns:
+            Posición siguiente o None si no hay más tarjetas
+        """
+        conditions = ["status = ?", "position IS NOT NULL"]
+        params = [status]
+        
+        if position is not None:
+            conditions.append("position > ?")
+            params.append(position)
+        if exclude_ids:
+            conditions.append(f"id NOT IN ({', '.join('?' for _ in exclude_ids)})")
+            params.extend(exclude_ids)
+        
+        query = f"SELECT position FROM tasks WHERE {' AND '.join(conditions)} ORDER BY position LIMIT 1"
+        row = cls.db.fetch_one(query, tuple(params))
+        return row['position'] if row else None
+    
+    @classmethod
+    def update_status(cls, task_id: int, status: str) -> Optional[Dict]:
         """
         Actualiza solo el estado de una tarea.
         
+        Si la tarea cambia de columna queda primera en la nueva.
+        
         Args:
             task_id: ID de la tarea
             status: Nuevo estado
             
+        Returns:
+            Diccionario con la tarea actualizada o None si no se pudo actualizar
+        """
+        return cls.update(task_id, status=status)
+    
+    @classmethod
+    def bulk_update_status(cls, task_ids: List[int], status: str) -> bool:
+        """
+        Actualiza el estado de varias tareas en una sola transacción.
+        
+        Las tareas que cambian de columna quedan primeras en la nueva, en el
+        orden de task_ids; las que ya estaban en ella no se mueven.
+        
+        Args:
+            task_ids: Lista de IDs de las tareas
+            status: Nuevo estado
+            
         Returns:
             True si la actualización fue exitosa, False en caso contrario
         """
-        return TaskModel.update(task_id, status=status)
+        if not task_ids or status not in cls.VALID_STATUSES:
+            return False
+        
+        query = "UPDATE tasks SET status = ?, position = ? WHERE id = ?"
+        
+        try:
+            with cls.db.transaction():
+                previous = cls.get_statuses(task_ids)
+                moving = [task_id for task_id in dict.fromkeys(task_ids)
+                          if task_id in previous and previous[task_id] != status]
+                positions = keys_between(None, cls._first_position(status), len(moving))
+                cls.db.executemany(query, [(status, position, task_id)
+                                       for task_id, position in zip(moving, positions)])
+            return True
+        except Exception as e:
+            print(f"✗ Error al actualizar el estado de las tareas: {e}")
+            return False
     
-    @staticmethod
-    def delete(task_id: int) -> bool:
+    @classmethod
+    def delete(cls, task_id: int) -> bool:
         """
         Elimina una tarea de la base de datos.
         
@@ -162,14 +591,37 @@ class TaskModel:
         query = "DELETE FROM tasks WHERE id = ?"
         
         try:
-            db.execute(query, (task_id,))
+            cls.db.execute(query, (task_id,))
             return True
         except Exception as e:
             print(f"✗ Error al eliminar la tarea: {e}")
             return False
     
-    @staticmethod
-    def get_by_due_date(due_date: str) -> List[Dict]:
+    @classmethod
+    def bulk_delete(cls, task_ids: List[int]) -> bool:
+        """
+        Elimina varias tareas en una sola transacción.
+        
+        Args:
+            task_ids: Lista de IDs de las tareas a eliminar
+            
+        Returns:
+            True si la eliminación fue exitosa, False en caso contrario
+        """
+        if not task_ids:
+            return False
+        
+        query = "DELETE FROM tasks WHERE id = ?"
+        
+        try:
+            cls.db.executemany(query, [(task_id,) for task_id in task_ids])
+            return True
+        except Exception as e:
+            print(f"✗ Error al eliminar las tareas: {e}")
+            return False
+    
+    @classmethod
+    def get_by_due_date(cls, due_date: str) -> List[Dict]:
         """
         Obtiene todas las tareas con una fecha de vencimiento específica.
         
@@ -179,11 +631,40 @@ class TaskModel:
         Returns:
             Lista de diccionarios con las tareas
         """
-        query = "SELECT * FROM tasks WHERE date(due_date) = date(?) ORDER BY created_at DESC"
-        return db.fetch_all(query, (due_date,))
+        # Rango semiabierto [día, día siguiente) en lugar de date(due_date) = ?,
+        # para que la consulta pueda usar el índice sobre due_date
+        day = date.fromisoformat(due_date[:10])
+        start = day.isoformat()
+        end = (day + timedelta(days=1)).isoformat()
+        
+        query = """
+            SELECT * FROM tasks
+            WHERE due_date >= ? AND due_date < ?
+            ORDER BY created_at DESC
+        """
+        return cls.db.fetch_all(query, (start, end))
+    
+    @classmethod
+    def get_by_due_date_range(cls, start: str, end: str) -> List[Dict]:
+        """
+        Obtiene las tareas con fecha de vencimiento dentro de un rango.
+        
+        Args:
+            start: Fecha inicial incluida en formato ISO (YYYY-MM-DD)
+            end: Fecha final excluida en formato ISO (YYYY-MM-DD)
+            
+        Returns:
+            Lista de diccionarios con las tareas ordenadas por fecha
+        """
+        query = """
+            SELECT * FROM tasks
+            WHERE due_date >= ? AND due_date < ?
+            ORDER BY due_date ASC
+        """
+        return cls.db.fetch_all(query, (start, end))
     
-    @staticmethod
-    def get_tasks_with_due_dates() -> List[Dict]:
+    @classmethod
+    def get_tasks_with_due_dates(cls) -> List[Dict]:
         """
         Obtiene todas las tareas que tienen una fecha de vencimiento asignada.
         
@@ -191,5 +672,5 @@ class TaskModel:
             Lista de diccionarios con las tareas
         """
         query = "SELECT * FROM tasks WHERE due_date IS NOT NULL ORDER BY due_date ASC"
-        return db.fetch_all(query)
+        return cls.db.fetch_all(query)
 
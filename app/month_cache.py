@@ -0,0 +1,264 @@
+"""
+Módulo de caché de tareas por mes.
+Carga las tareas con fecha de vencimiento por meses, solo los que se piden,
+y conserva los más recientes en una caché LRU.
+"""
+
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from PyQt5.QtCore import QObject, pyqtSignal
+from app.models import TaskModel
+from app.events import EventBus, TaskCreated, TaskDeleted, TaskMoved, TaskUpdated, event_bus
+
+Month = Tuple[int, int]  # (año, mes)
+
+
+def due_date_key(due_date: Optional[str]) -> Optional[str]:
+    """
+    Normaliza una fecha de vencimiento a la clave de día (YYYY-MM-DD).
+
+    Args:
+        due_date: Fecha en formato ISO, con o sin hora
+
+    Returns:
+        Fecha sin hora o None si la tarea no tiene fecha
+    """
+    if not due_date:
+        return None
+    return due_date.split('T')[0]
+
+
+def month_of(day: str) -> Month:
+    """
+    Obtiene el mes de una fecha ISO.
+
+    Args:
+        day: Fecha en formato ISO (YYYY-MM-DD)
+
+    Returns:
+        Tupla (año, mes)
+    """
+    return int(day[0:4]), int(day[5:7])
+
+
+def shift_month(month: Month, offset: int) -> Month:
+    """
+    Desplaza un mes hacia adelante o hacia atrás.
+
+    Args:
+        month: Tupla (año, mes)
+        offset: Cantidad de meses (negativa para ir hacia atrás)
+
+    Returns:
+        Tupla (año, mes) resultante
+    """
+    index = month[0] * 12 + (month[1] - 1) + offset
+    return index // 12, index % 12 + 1
+
+
+class MonthTaskCache(QObject):
+    """
+    Tareas con fecha de vencimiento agrupadas en meses cargados bajo demanda.
+
+    Cada mes se lee con TaskModel.get_by_due_date_range (una consulta por
+    grupo de meses faltantes) y se guarda en una caché LRU. Los eventos del
+    bus actualizan los meses ya cargados sin volver a consultar la base de
+    datos; los meses que no están en la caché se leen cuando se pidan.
+    """
+
+    # Señal cuando cambian las tareas de algunos días cargados: {YYYY-MM-DD}
+    days_changed = pyqtSignal(set)
+
+    # Señal cuando se descarta toda la caché
+    reloaded = pyqtSignal()
+
+    # Cantidad máxima de meses en la caché
+    CAPACITY = 12
+
+    def __init__(self, model=TaskModel, bus: EventBus = event_bus, parent=None):
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            model: Modelo desde el que se cargan las tareas
+            bus: Bus de eventos del que recibe los cambios
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+        self.model = model
+        # {(año, mes): {YYYY-MM-DD: {task_id: tarea}}}, del menos al más usado
+        self._months: "OrderedDict[Month, Dict[str, Dict[int, Dict]]]" = OrderedDict()
+        self._task_days: Dict[int, str] = {}  # {task_id: día} de las tareas en caché
+
+        self.bus = bus
+        # [(tipo_evento, handler)] para poder desuscribirse en close()
+        self._subscriptions = [
+            (TaskCreated, lambda event: self._apply_put(event.task)),
+            (TaskUpdated, lambda event: self._apply_put(event.task)),
+            (TaskMoved, self._on_task_moved),
+            (TaskDeleted, lambda event: self._apply_remove(event.task_id)),
+        ]
+        for event_type, handler in self._subscriptions:
+            bus.subscribe(event_type, handler)
+
+    # ==================== CARGA ====================
+
+    def ensure_months(self, months: Iterable[Month]):
+        """
+        Carga los meses que falten con una sola consulta de rango.
+
+        Args:
+            months: Meses que se van a usar
+        """
+        months = list(months)
+        missing = sorted(month for month in months if month not in self._months)
+
+        if missing:
+            start = date(missing[0][0], missing[0][1], 1).isoformat()
+            end_month = shift_month(missing[-1], 1)
+            end = date(end_month[0], end_month[1], 1).isoformat()
+
+            try:
+                tasks = self.model.get_by_due_date_range(start, end)
+            except Exception as e:
+                print(f"✗ Error al cargar las tareas del calendario: {e}")
+                return
+
+            # El rango puede incluir meses ya cargados: esos no se tocan
+            for month in missing:
+                self._months[month] = {}
+            missing = set(missing)
+            for task in tasks:
+                day = due_date_key(task.get('due_date'))
+                if day and month_of(day) in missing:
+                    self._add(day, task)
+
+        # Marcar como usados los meses pedidos y descartar los más viejos
+        for month in months:
+            self._months.move_to_end(month)
+        while len(self._months) > max(self.CAPACITY, len(months)):
+            self._evict(next(iter(self._months)))
+
+    def close(self):
+        """Deja de recibir los eventos del bus."""
+        for event_type, handler in self._subscriptions:
+            self.bus.unsubscribe(event_type, handler)
+        self._subscriptions = []
+
+    def is_loaded(self, month: Month) -> bool:
+        """Indica si un mes está en la caché."""
+        return month in self._months
+
+    def reload(self):
+        """Descarta todos los meses; se vuelven a leer cuando se pidan."""
+        self._months.clear()
+        self._task_days.clear()
+        self.reloaded.emit()
+
+    # ==================== CONSULTAS ====================
+
+    def get_by_due_date(self, day: str) -> List[Dict]:
+        """
+        Obtiene las tareas programadas para un día (carga su mes si hace falta).
+
+        Args:
+            day: Fecha en formato ISO (YYYY-MM-DD)
+
+        Returns:
+            Lista de tareas ordenadas por fecha de creación (más recientes primero)
+        """
+        month = month_of(day)
+        if month not in self._months:
+            self.ensure_months([month])
+
+        tasks = list(self._months.get(month, {}).get(day, {}).values())
+        tasks.sort(key=lambda task: (task.get('created_at') or '', task.get('id')), reverse=True)
+        return tasks
+
+    def has_tasks(self, day: str) -> bool:
+        """
+        Indica si un día de un mes cargado tiene tareas.
+
+        Args:
+            day: Fecha en formato ISO (YYYY-MM-DD)
+
+        Returns:
+            True si el día tiene tareas (False también si su mes no está cargado)
+        """
+        return bool(self._months.get(month_of(day), {}).get(day))
+
+    def days_with_tasks(self, months: Iterable[Month]) -> Set[str]:
+        """
+        Retorna los días con tareas de los meses indicados que están cargados.
+
+        Args:
+            months: Meses a consultar
+
+        Returns:
+            Conjunto de fechas ISO (YYYY-MM-DD)
+        """
+        days = set()
+        for month in months:
+            days.update(self._months.get(month, {}).keys())
+        return days
+
+    # ==================== CAMBIOS ====================
+
+    def _on_task_moved(self, event: TaskMoved):
+        """Aplica un cambio de estado (con o sin la fila persistida)."""
+        if event.task is not None:
+            self._apply_put(event.task)
+            return
+
+        day = self._task_days.get(event.task_id)
+        if day is not None:
+            task = self._months[month_of(day)][day][event.task_id]
+            self._apply_put({**task, 'status': event.status})
+
+    def _apply_put(self, task: Dict):
+        """Agrega, mueve o reemplaza una tarea ya persistida en los meses cargados."""
+        task_id = task.get('id')
+        changed = set()
+
+        previous_day = self._task_days.get(task_id)
+        if previous_day is not None:
+            self._remove(previous_day, task_id)
+            changed.add(previous_day)
+
+        day = due_date_key(task.get('due_date'))
+        if day and month_of(day) in self._months:
+            self._add(day, task)
+            changed.add(day)
+
+        if changed:
+            self.days_changed.emit(changed)
+
+    def _apply_remove(self, task_id: int):
+        """Quita una tarea ya eliminada de la base de datos."""
+        day = self._task_days.get(task_id)
+        if day is not None:
+            self._remove(day, task_id)
+            self.days_changed.emit({day})
+
+    # ==================== ÍNDICES ====================
+
+    def _add(self, day: str, task: Dict):
+        """Agrega una tarea al día de un mes cargado."""
+        self._months[month_of(day)].setdefault(day, {})[task.get('id')] = task
+        self._task_days[task.get('id')] = day
+
+    def _remove(self, day: str, task_id: int):
+        """Quita una tarea de su día."""
+        self._task_days.pop(task_id, None)
+        days = self._months.get(month_of(day), {})
+        if day in days:
+            days[day].pop(task_id, None)
+            if not days[day]:
+                del days[day]
+
+    def _evict(self, month: Month):
+        """Descarta un mes de la caché."""
+        for tasks in self._months.pop(month).values():
+            for task_id in tasks:
+                self._task_days.pop(task_id, None)
@@ -4,17 +4,34 @@ Puente entre la UI y los modelos de notas.
 """
 
 from typing import List, Dict, Optional
+from app.database import Database
 from app.note_model import NoteModel
+from app.events import EventBus, NoteCreated, NoteDeleted, NoteUpdated, event_bus
 
 
 class NoteController:
-    """Controlador para gestionar las operaciones de notas."""
+    """
+    Controlador para gestionar las operaciones de notas.
     
-    def __init__(self):
-        """Inicializa el controlador."""
-        self.model = NoteModel
+    Cada escritura exitosa publica un evento en el bus de la aplicación.
+    """
     
-    def create_note(self, title: str, content: str = "") -> Optional[int]:
+    def __init__(self, bus: EventBus = None, database: Database = None):
+        """
+        Inicializa el controlador.
+        
+        Args:
+            bus: Bus de eventos en el que se publican los cambios (None para el
+                 bus global, o uno propio si se indica la base de datos)
+            database: Base de datos de las notas (None para la instancia por defecto)
+        """
+        if bus is None:
+            bus = EventBus() if database is not None else event_bus
+        self.database = database
+        self.model = NoteModel.bind(database) if database is not None else NoteModel
+        self.bus = bus
+    
+    def create_note(self, title: str, content: str = "") -> Optional[Dict]:
         """
         Crea una nueva nota.
         
@@ -23,17 +40,45 @@ class NoteController:
             content: Contenido de la nota
             
         Returns:
-            ID de la nota creada o None si hubo un error
+            Diccionario con la nota creada o None si hubo un error
         """
         if not title or not title.strip():
             return None
         
         try:
-            note_id = self.model.create(title.strip(), content.strip())
-            return note_id
+            note = self.model.create(title.strip(), content.strip())
         except Exception as e:
             print(f"✗ Error al crear la nota: {e}")
             return None
+        
+        self.bus.publish(NoteCreated(note))
+        return note
+    
+    def create_notes(self, notes: List[Dict]) -> List[Dict]:
+        """
+        Crea varias notas con un solo commit.
+        
+        Args:
+            notes: Lista de diccionarios con title y content
+            
+        Returns:
+            Lista con las notas creadas (vacía si hubo un error)
+        """
+        valid_notes = []
+        for note in notes:
+            title = (note.get('title') or '').strip()
+            if title:
+                valid_notes.append({'title': title, 'content': (note.get('content') or '').strip()})
+        
+        try:
+            created = self.model.bulk_create(valid_notes)
+        except Exception as e:
+            print(f"✗ Error al crear las notas: {e}")
+            return []
+        
+        for note in created:
+            self.bus.publish(NoteCreated(note))
+        return created
     
     def get_all_notes(self) -> List[Dict]:
         """
@@ -48,6 +93,22 @@ class NoteController:
             print(f"✗ Error al obtener las notas: {e}")
             return []
     
+    def search(self, text: str) -> List[Dict]:
+        """
+        Busca notas por título y contenido.
+        
+        Args:
+            text: Texto de búsqueda
+            
+        Returns:
+            Lista de notas ordenadas por relevancia
+        """
+        try:
+            return self.model.search(text)
+        except Exception as e:
+            print(f"✗ Error al buscar notas: {e}")
+            return []
+    
     def get_note(self, note_id: int) -> Optional[Dict]:
         """
         Obtiene una nota por su ID.
@@ -64,7 +125,7 @@ class NoteController:
             print(f"✗ Error al obtener la nota: {e}")
             return None
     
-    def update_note(self, note_id: int, title: str = None, content: str = None) -> bool:
+    def update_note(self, note_id: int, title: str = None, content: str = None) -> Optional[Dict]:
         """
         Actualiza una nota.
         
@@ -74,13 +135,17 @@ class NoteController:
             content: Nuevo contenido (opcional)
             
         Returns:
-            True si la actualización fue exitosa, False en caso contrario
+            Diccionario con la nota actualizada o None si hubo un error
         """
         try:
-            return self.model.update(note_id, title, content)
+            note = self.model.update(note_id, title, content)
         except Exception as e:
             print(f"✗ Error al actualizar la nota: {e}")
-            return False
+            return None
+        
+        if note:
+            self.bus.publish(NoteUpdated(note))
+        return note
     
     def delete_note(self, note_id: int) -> bool:
         """
@@ -93,8 +158,32 @@ class NoteController:
             True si la eliminación fue exitosa, False en caso contrario
         """
         try:
-            return self.model.delete(note_id)
+            success = self.model.delete(note_id)
         except Exception as e:
             print(f"✗ Error al eliminar la nota: {e}")
             return False
-
+        
+        if success:
+            self.bus.publish(NoteDeleted(note_id))
+        return success
+    
+    def delete_notes(self, note_ids: List[int]) -> bool:
+        """
+        Elimina varias notas con un solo commit.
+        
+        Args:
+            note_ids: Lista de IDs de las notas a eliminar
+            
+        Returns:
+            True si la eliminación fue exitosa, False en caso contrario
+        """
+        try:
+            success = self.model.bulk_delete(note_ids)
+        except Exception as e:
+            print(f"✗ Error al eliminar las notas: {e}")
+            return False
+        
+        if success:
+            for note_id in note_ids:
+                self.bus.publish(NoteDeleted(note_id))
+        return success
@@ -5,14 +5,35 @@ Define la clase NoteModel para gestionar las notas.
 
 from datetime import datetime
 from typing import List, Optional, Dict
-from app.database import db
+from app.database import Database, db, SUPPORTS_RETURNING
+from app.utils import build_fts_query
 
 
 class NoteModel:
     """Modelo para gestionar las notas en la base de datos."""
     
-    @staticmethod
-    def create(title: str, content: str = "") -> int:
+    # Cantidad máxima de resultados de una búsqueda
+    SEARCH_LIMIT = 200
+    
+    # Base de datos que usan los métodos: la instancia por defecto de
+    # app.database (se abre en el primer uso) o la indicada con bind()
+    db: Database = db
+    
+    @classmethod
+    def bind(cls, database: Database) -> type:
+        """
+        Crea una variante del modelo que trabaja sobre otra base de datos.
+        
+        Args:
+            database: Base de datos a usar (p. ej. una ':memory:' en pruebas)
+            
+        Returns:
+            Subclase de NoteModel cuyos métodos usan esa base de datos
+        """
+        return type(cls.__name__, (cls,), {"db": database})
+    
+    @classmethod
+    def create(cls, title: str, content: str = "") -> Dict:
         """
         Crea una nueva nota en la base de datos.
         
@@ -21,7 +42,7 @@ class NoteModel:
             content: Contenido de la nota
             
         Returns:
-            ID de la nota creada
+            Diccionario con la nota creada (incluye su ID)
         """
         created_at = datetime.now().isoformat()
         updated_at = created_at
@@ -32,11 +53,51 @@ class NoteModel:
         """
         params = (title, content, created_at, updated_at)
         
-        cursor = db.execute(query, params)
-        return cursor.lastrowid
+        if SUPPORTS_RETURNING:
+            return cls.db.execute_returning(query + " RETURNING *", params)
+        
+        # Sin RETURNING: componer la fila con los valores insertados
+        cursor = cls.db.execute(query, params)
+        return {
+            'id': cursor.lastrowid,
+            'title': title,
+            'content': content,
+            'created_at': created_at,
+            'updated_at': updated_at
+        }
     
-    @staticmethod
-    def get_all() -> List[Dict]:
+    @classmethod
+    def bulk_create(cls, notes: List[Dict]) -> List[Dict]:
+        """
+        Crea varias notas en una sola transacción.
+        
+        Args:
+            notes: Lista de diccionarios con title y, opcionalmente, content
+            
+        Returns:
+            Lista con las notas creadas (filas persistidas), en el mismo orden
+        """
+        if not notes:
+            return []
+        
+        created_at = datetime.now().isoformat()
+        rows = [(note['title'], note.get('content', ''), created_at, created_at) for note in notes]
+        
+        query = """
+            INSERT INTO notes (title, content, created_at, updated_at)
+            VALUES (?, ?, ?, ?)
+        """
+        
+        with cls.db.transaction():
+            cls.db.executemany(query, rows)
+            # El bloqueo de escritura se mantiene hasta el commit, así que
+            # los últimos IDs asignados son los de este lote
+            created = cls.db.fetch_all("SELECT * FROM notes ORDER BY id DESC LIMIT ?", (len(rows),))
+        
+        return list(reversed(created))
+    
+    @classmethod
+    def get_all(cls) -> List[Dict]:
         """
         Obtiene todas las notas de la base de datos.
         
@@ -44,10 +105,10 @@ class NoteModel:
             Lista de diccionarios con las notas
         """
         query = "SELECT * FROM notes ORDER BY updated_at DESC"
-        return db.fetch_all(query)
+        return cls.db.fetch_all(query)
     
-    @staticmethod
-    def get_by_id(note_id: int) -> Optional[Dict]:
+    @classmethod
+    def get_by_id(cls, note_id: int) -> Optional[Dict]:
         """
         Obtiene una nota por su ID.
         
@@ -58,10 +119,35 @@ class NoteModel:
             Diccionario con los datos de la nota o None si no existe
         """
         query = "SELECT * FROM notes WHERE id = ?"
-        return db.fetch_one(query, (note_id,))
+        return cls.db.fetch_one(query, (note_id,))
     
-    @staticmethod
-    def update(note_id: int, title: str = None, content: str = None) -> bool:
+    @classmethod
+    def search(cls, text: str, limit: int = SEARCH_LIMIT) -> List[Dict]:
+        """
+        Busca notas por título y contenido con el índice FTS5.
+        
+        Args:
+            text: Texto escrito por el usuario (cada palabra se busca como prefijo)
+            limit: Cantidad máxima de resultados
+            
+        Returns:
+            Lista de notas ordenadas por relevancia (coincidencias en el título primero)
+        """
+        match = build_fts_query(text)
+        if match is None:
+            return []
+        
+        query = """
+            SELECT notes.* FROM notes_fts
+            JOIN notes ON notes.id = notes_fts.rowid
+            WHERE notes_fts MATCH ?
+            ORDER BY bm25(notes_fts, 10.0, 1.0)
+            LIMIT ?
+        """
+        return cls.db.fetch_all(query, (match, limit))
+    
+    @classmethod
+    def update(cls, note_id: int, title: str = None, content: str = None) -> Optional[Dict]:
         """
         Actualiza una nota existente.
         
@@ -71,7 +157,7 @@ class NoteModel:
             content: Nuevo contenido (opcional)
             
         Returns:
-            True si la actualización fue exitosa, False en caso contrario
+            Diccionario con la nota actualizada o None si no se pudo actualizar
         """
         updates = []
         params = []
@@ -85,7 +171,7 @@ class NoteModel:
             params.append(content)
         
         if not updates:
-            return False
+            return None
         
         # Siempre actualizar updated_at
         updates.append("updated_at = ?")
@@ -95,14 +181,18 @@ class NoteModel:
         query = f"UPDATE notes SET {', '.join(updates)} WHERE id = ?"
         
         try:
-            db.execute(query, tuple(params))
-            return True
+            if SUPPORTS_RETURNING:
+                return cls.db.execute_returning(query + " RETURNING *", tuple(params))
+            
+            with cls.db.transaction():
+                cls.db.execute(query, tuple(params))
+                return cls.get_by_id(note_id)
         except Exception as e:
             print(f"✗ Error al actualizar la nota: {e}")
-            return False
+            return None
     
-    @staticmethod
-    def delete(note_id: int) -> bool:
+    @classmethod
+    def delete(cls, note_id: int) -> bool:
         """
         Elimina una nota de la base de datos.
         
@@ -115,9 +205,31 @@ class NoteModel:
         query = "DELETE FROM notes WHERE id = ?"
         
         try:
-            db.execute(query, (note_id,))
+            cls.db.execute(query, (note_id,))
             return True
         except Exception as e:
             print(f"✗ Error al eliminar la nota: {e}")
             return False
-
+    
+    @classmethod
+    def bulk_delete(cls, note_ids: List[int]) -> bool:
+        """
+        Elimina varias notas en una sola transacción.
+        
+        Args:
+            note_ids: Lista de IDs de las notas a eliminar
+            
+        Returns:
+            True si la eliminación fue exitosa, False en caso contrario
+        """
+        if not note_ids:
+            return False
+        
+        query = "DELETE FROM notes WHERE id = ?"
+        
+        try:
+            cls.db.executemany(query, [(note_id,) for note_id in note_ids])
+            return True
+        except Exception as e:
+            print(f"✗ Error al eliminar las notas: {e}")
+            return False
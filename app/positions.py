@@ -0,0 +1,209 @@
+"""
+Módulo de claves de posición.
+Genera claves de texto que se ordenan lexicográficamente (con la comparación
+BINARY de SQLite) y permiten insertar una tarjeta entre otras dos sin
+renumerar la columna.
+
+Formato de una clave: parte entera de largo variable + parte fraccionaria.
+El primer carácter de la parte entera indica su largo ('a'..'z' para los
+enteros no negativos, 'A'..'Z' para los negativos), así los enteros más
+chicos también ordenan antes. La parte fraccionaria nunca termina en '0'.
+"""
+
+from typing import List, Optional
+
+# Dígitos en base 62, en orden ASCII (el mismo orden que usa SQLite)
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+# Clave de una columna vacía
+FIRST_KEY = "a0"
+
+_SMALLEST_INTEGER = "A" + DIGITS[0] * 26
+
+
+def _integer_length(head: str) -> int:
+    """Largo de la parte entera según su primer carácter."""
+    if "a" <= head <= "z":
+        return ord(head) - ord("a") + 2
+    if "A" <= head <= "Z":
+        return ord("Z") - ord(head) + 2
+    raise ValueError(f"Clave de posición inválida: cabecera '{head}'")
+
+
+def _integer_part(key: str) -> str:
+    """Parte entera de una clave."""
+    length = _integer_length(key[0])
+    if length > len(key):
+        raise ValueError(f"Clave de posición inválida: '{key}'")
+    return key[:length]
+
+
+def _increment_integer(integer: str) -> Optional[str]:
+    """Entero siguiente (None si ya es el mayor representable)."""
+    head, digits = integer[0], list(integer[1:])
+
+    for i in reversed(range(len(digits))):
+        value = DIGITS.index(digits[i]) + 1
+        if value < len(DIGITS):
+            digits[i] = DIGITS[value]
+            return head + "".join(digits)
+        digits[i] = DIGITS[0]
+
+    # Se desbordaron todos los dígitos: pasar al largo siguiente
+    if head == "Z":
+        return "a" + DIGITS[0]
+    if head == "z":
+        return None
+    head = chr(ord(head) + 1)
+    if head > "a":
+        digits.append(DIGITS[0])
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+
+def _decrement_integer(integer: str) -> Optional[str]:
+    """Entero anterior (None si ya es el menor representable)."""
+    head, digits = integer[0], list(integer[1:])
+
+    for i in reversed(range(len(digits))):
+        value = DIGITS.index(digits[i]) - 1
+        if value >= 0:
+            digits[i] = DIGITS[value]
+            return head + "".join(digits)
+        digits[i] = DIGITS[-1]
+
+    if head == "a":
+        return "Z" + DIGITS[-1]
+    if head == "A":
+        return None
+    head = chr(ord(head) - 1)
+    if head < "Z":
+        digits.append(DIGITS[-1])
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    """
+    Fracción estrictamente entre dos fracciones.
+
+    Args:
+        low: Fracción inferior ("" equivale a 0)
+        high: Fracción superior (None equivale a 1)
+
+    Returns:
+        Dígitos de la fracción intermedia (sin '0' al final)
+    """
+    if high is not None:
+        # Conservar el prefijo común
+        n = 0
+        while n < len(high) and (low[n] if n < len(low) else DIGITS[0]) == high[n]:
+            n += 1
+        if n > 0:
+            return high[:n] + _midpoint(low[n:], high[n:])
+
+    digit_low = DIGITS.index(low[0]) if low else 0
+    digit_high = DIGITS.index(high[0]) if high is not None else len(DIGITS)
+
+    if digit_high - digit_low > 1:
+        return DIGITS[(digit_low + digit_high + 1) // 2]
+
+    # Dígitos consecutivos
+    if high is not None and len(high) > 1:
+        return high[:1]
+    return DIGITS[digit_low] + _midpoint(low[1:], None)
+
+
+def key_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Genera una clave que ordena entre dos claves existentes.
+
+    Insertar siempre al principio o al final solo cambia la parte entera, así
+    las claves crecen de forma logarítmica con la cantidad de inserciones.
+
+    Args:
+        before: Clave de la tarjeta anterior (None si se inserta al principio)
+        after: Clave de la tarjeta siguiente (None si se inserta al final)
+
+    Returns:
+        Clave nueva, mayor que before y menor que after
+
+    Raises:
+        ValueError: Si before no es menor que after o alguna clave es inválida
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Claves de posición fuera de orden: '{before}' >= '{after}'")
+
+    if before is None and after is None:
+        return FIRST_KEY
+
+    if before is None:
+        integer = _integer_part(after)
+        fraction = after[len(integer):]
+        if integer == _SMALLEST_INTEGER:
+            return integer + _midpoint("", fraction)
+        if integer < after:
+            return integer  # after tiene fracción: el entero solo ya es menor
+        smaller = _decrement_integer(integer)
+        if smaller is None:
+            raise ValueError("No quedan claves de posición menores")
+        return smaller
+
+    integer = _integer_part(before)
+    fraction = before[len(integer):]
+
+    if after is None:
+        larger = _increment_integer(integer)
+        return larger if larger is not None else integer + _midpoint(fraction, None)
+
+    if integer == _integer_part(after):
+        return integer + _midpoint(fraction, after[len(integer):])
+
+    larger = _increment_integer(integer)
+    if larger is not None and larger < after:
+        return larger
+    return integer + _midpoint(fraction, None)
+
+
+def keys_between(before: Optional[str], after: Optional[str], count: int) -> List[str]:
+    """
+    Genera varias claves consecutivas entre dos claves existentes (p. ej. al
+    soltar varias tarjetas juntas).
+
+    Las claves intermedias se reparten por bisección, así su largo crece de
+    forma logarítmica con la cantidad.
+
+    Args:
+        before: Clave de la tarjeta anterior (None si se inserta al principio)
+        after: Clave de la tarjeta siguiente (None si se inserta al final)
+        count: Cantidad de claves
+
+    Returns:
+        Lista de claves en orden creciente
+    """
+    if count <= 0:
+        return []
+    if count == 1:
+        return [key_between(before, after)]
+
+    if after is None:
+        keys = []
+        key = before
+        for _ in range(count):
+            key = key_between(key, None)
+            keys.append(key)
+        return keys
+
+    if before is None:
+        keys = []
+        key = after
+        for _ in range(count):
+            key = key_between(None, key)
+            keys.append(key)
+        return list(reversed(keys))
+
+    middle = count // 2
+    key = key_between(before, after)
+    return keys_between(before, key, middle) + [key] + keys_between(key, after, count - middle - 1)
@@ -0,0 +1,108 @@
+"""
+Módulo de planes de consulta.
+Ejecuta cada consulta de lectura de los modelos y obtiene su EXPLAIN QUERY
+PLAN, para detectar recorridos completos de tabla (lo usan las pruebas y
+view_database.py --plans).
+"""
+
+from datetime import datetime
+from typing import Callable, List, Tuple
+from app.database import Database
+from app.models import TaskModel
+from app.note_model import NoteModel
+
+
+def model_queries(task_model=TaskModel, note_model=NoteModel) -> List[Tuple[str, Callable]]:
+    """
+    Consultas de lectura de los modelos que deben usar índices.
+
+    Args:
+        task_model: Modelo de tareas (p. ej. una variante de bind())
+        note_model: Modelo de notas
+
+    Returns:
+        Lista de tuplas (nombre, función que ejecuta la consulta)
+    """
+    today = datetime.now().date().isoformat()
+    now = datetime.now().isoformat()
+    todo = task_model.STATUS_TODO
+
+    return [
+        ("TaskModel.get_all", lambda: task_model.get_all()),
+        ("TaskModel.get_by_id", lambda: task_model.get_by_id(1)),
+        ("TaskModel.get_by_status", lambda: task_model.get_by_status(todo)),
+        ("TaskModel.get_page", lambda: task_model.get_page(todo)),
+        ("TaskModel.get_page (cursor)", lambda: task_model.get_page(todo, "a0", 1)),
+        # Lecturas de TaskModel.move: vecina siguiente de una posición
+        ("TaskModel._next_position", lambda: task_model._next_position(todo, "a0", [1])),
+        ("TaskModel.move_many", lambda: task_model._next_position(todo, "a0", [1, 2])),
+        ("TaskModel.count_by_status", lambda: task_model.count_by_status()),
+        ("TaskModel.get_statuses", lambda: task_model.get_statuses([1, 2])),
+        ("TaskModel.get_events", lambda: task_model.get_events(today, now)),
+        ("TaskModel.get_events_of_completed", lambda: task_model.get_events_of_completed(today, now)),
+        ("TaskModel.count_by_status_at", lambda: task_model.count_by_status_at(now)),
+        ("TaskModel.get_by_due_date", lambda: task_model.get_by_due_date(today)),
+        ("TaskModel.get_by_due_date_range", lambda: task_model.get_by_due_date_range(today, today)),
+        ("TaskModel.get_tasks_with_due_dates", lambda: task_model.get_tasks_with_due_dates()),
+        ("TaskModel.search", lambda: task_model.search("tarea")),
+        ("TaskModel.search (estado)", lambda: task_model.search("tarea", todo)),
+        ("NoteModel.get_all", lambda: note_model.get_all()),
+        ("NoteModel.get_by_id", lambda: note_model.get_by_id(1)),
+        ("NoteModel.search", lambda: note_model.search("nota")),
+    ]
+
+
+def is_full_scan(detail: str) -> bool:
+    """Indica si una fila de EXPLAIN QUERY PLAN es un recorrido completo de tabla."""
+    if "VIRTUAL TABLE INDEX" in detail:
+        # Tablas FTS5: "INDEX 0:" sin restricciones recorre todo el índice
+        return detail.endswith(":")
+    return detail.startswith("SCAN") and "USING" not in detail
+
+
+def explain(database: Database, run_query: Callable) -> List[Tuple[str, List[str]]]:
+    """
+    Ejecuta una consulta de los modelos y obtiene el plan de cada sentencia.
+
+    Debe llamarse desde el hilo de la conexión principal de la base de datos.
+
+    Args:
+        database: Base de datos que usan los modelos de la consulta
+        run_query: Función que ejecuta la consulta
+
+    Returns:
+        Lista de tuplas (sentencia, filas de EXPLAIN QUERY PLAN)
+    """
+    # Capturar el SQL (con los parámetros ya sustituidos) que ejecuta el modelo
+    statements = []
+    database.connection.set_trace_callback(statements.append)
+    try:
+        run_query()
+    finally:
+        database.connection.set_trace_callback(None)
+
+    plans = []
+    for statement in statements:
+        # Las consultas internas de FTS5 llegan comentadas con "--" o con
+        # el esquema entre comillas ('main'.tabla)
+        if statement.startswith("--") or "'main'." in statement:
+            continue
+        rows = database.connection.execute(f"EXPLAIN QUERY PLAN {statement}").fetchall()
+        plans.append((statement, [row[3] for row in rows]))
+    return plans
+
+
+def explain_model_queries(database: Database) -> List[Tuple[str, str, List[str]]]:
+    """
+    Obtiene el plan de cada consulta de model_queries() sobre una base de datos.
+
+    Args:
+        database: Base de datos a usar (los modelos se enlazan a ella)
+
+    Returns:
+        Lista de tuplas (nombre de la consulta, sentencia, filas del plan)
+    """
+    queries = model_queries(TaskModel.bind(database), NoteModel.bind(database))
+    return [(name, statement, details)
+            for name, run_query in queries
+            for statement, details in explain(database, run_query)]
@@ -0,0 +1,206 @@
+"""
+Módulo de consultas en segundo plano.
+Ejecuta consultas de lectura (búsquedas, filtros) en un hilo de trabajo con
+una conexión de solo lectura, agrupando las teclas seguidas y cancelando las
+consultas que quedaron viejas.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+import traceback
+from typing import Callable, Optional, Tuple
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from app.database import Database, get_database
+
+
+class QueryScheduler(QObject):
+    """
+    Programa consultas de lectura con espera (debounce) y cancelación.
+
+    Solo importa la última consulta pedida: cada llamada a schedule() reemplaza
+    la pendiente y, si había una ejecutándose, la interrumpe con el progress
+    handler de SQLite. Los resultados vuelven al hilo de la interfaz a través
+    de señales de Qt.
+    """
+
+    # Señal con el resultado de la última consulta: resultado, latencia en ms
+    # desde la última llamada a schedule() hasta la entrega
+    results_ready = pyqtSignal(object, float)
+
+    # Señal cuando la última consulta lanza una excepción: mensaje de error
+    query_failed = pyqtSignal(str)
+
+    # Señales internas desde el hilo de trabajo: generación, resultado o mensaje
+    _finished = pyqtSignal(int, object)
+    _failed = pyqtSignal(int, str)
+
+    # Espera (ms) desde la última llamada a schedule() antes de ejecutar
+    DEFAULT_DELAY = 250
+
+    # Instrucciones de la VM de SQLite entre cada revisión de cancelación
+    PROGRESS_STEPS = 1000
+
+    _STOP = object()  # Marca para detener el hilo
+
+    def __init__(self, database: Database = None, delay: int = DEFAULT_DELAY, parent=None):
+        """
+        Inicializa el programador y arranca su hilo.
+
+        Args:
+            database: Base de datos de la que se abre la conexión de lectura
+                      (None o db para la instancia por defecto, que se abre
+                      aquí y no en el hilo de trabajo)
+            delay: Espera en ms antes de ejecutar la consulta pedida
+            parent: Objeto padre
+
+        Raises:
+            sqlite3.ProgrammingError: Si la base de datos es ':memory:' (el hilo
+                                      no podría abrir su conexión)
+        """
+        super().__init__(parent)
+        self.database = database if isinstance(database, Database) else get_database()
+        self.database.require_file("QueryScheduler")
+        self._queue = queue.Queue()
+        self._generation = 0  # Aumenta con cada consulta pedida o cancelada
+        self._running = 0  # Generación que se está ejecutando en el hilo
+        self._pending: Optional[Tuple[int, Callable, tuple, dict]] = None
+        self._requested_at = 0.0  # Instante (perf_counter) de la última petición
+        self.last_latency_ms: Optional[float] = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._dispatch)
+
+        self._finished.connect(self._on_finished)
+        self._failed.connect(self._on_failed)
+
+        self._thread = threading.Thread(target=self._run, name="QueryScheduler", daemon=True)
+        self._thread.start()
+
+    def bind_model(self, model):
+        """
+        Retorna el modelo atado a la base de datos de este programador.
+
+        La cancelación solo alcanza a la conexión del hilo de trabajo, que es
+        la de self.database: un modelo de otra base de datos leería con otra
+        conexión y sus consultas viejas correrían hasta el final.
+
+        Args:
+            model: Clase del modelo (p. ej. TaskModel o una variante de bind())
+
+        Returns:
+            El mismo modelo si ya usa esta base de datos, o una variante atada a ella
+        """
+        database = model.db if isinstance(model.db, Database) else get_database()
+        return model if database is self.database else model.bind(self.database)
+
+    def schedule(self, function: Callable, *args, **kwargs):
+        """
+        Pide una consulta; se ejecuta cuando pase la espera sin otra petición.
+
+        Args:
+            function: Función de lectura a ejecutar en el hilo de trabajo (p. ej.
+                      un método de un modelo de bind_model()); usará la conexión
+                      de solo lectura
+            *args: Argumentos posicionales para la función
+            **kwargs: Argumentos con nombre para la función
+        """
+        self._generation += 1
+        self._pending = (self._generation, function, args, kwargs)
+        self._requested_at = time.perf_counter()
+        self._timer.start()
+
+    def run_now(self, function: Callable, *args, **kwargs):
+        """
+        Pide una consulta sin espera (p. ej. al confirmar con Enter).
+
+        Args:
+            function: Función de lectura a ejecutar en el hilo de trabajo
+            *args: Argumentos posicionales para la función
+            **kwargs: Argumentos con nombre para la función
+        """
+        self.schedule(function, *args, **kwargs)
+        self._timer.stop()
+        self._dispatch()
+
+    def cancel(self):
+        """Descarta la consulta pendiente e interrumpe la que se esté ejecutando."""
+        self._generation += 1
+        self._pending = None
+        self._timer.stop()
+
+    def stop(self, wait: bool = True):
+        """
+        Cancela las consultas y detiene el hilo.
+
+        Args:
+            wait: Si es True, espera a que el hilo termine
+        """
+        self.cancel()
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            if wait:
+                self._thread.join()
+
+    def _dispatch(self):
+        """Envía la consulta pendiente al hilo de trabajo."""
+        if self._pending is not None:
+            self._queue.put(self._pending)
+            self._pending = None
+
+    def _is_stale(self) -> bool:
+        """
+        Progress handler de SQLite: un valor verdadero interrumpe la consulta
+        en curso porque ya se pidió otra.
+        """
+        return self._running != self._generation
+
+    def _run(self):
+        """Bucle del hilo de trabajo."""
+        self.database.open_thread_connection(read_only=True)
+        self.database.connection.set_progress_handler(self._is_stale, self.PROGRESS_STEPS)
+
+        try:
+            while True:
+                job = self._queue.get()
+                if job is self._STOP:
+                    break
+
+                generation, function, args, kwargs = job
+                if generation != self._generation:
+                    continue  # Ya se pidió otra consulta
+
+                self._running = generation
+                try:
+                    result = function(*args, **kwargs)
+                except sqlite3.OperationalError as e:
+                    if self._is_stale():
+                        continue  # Interrumpida por una consulta más reciente
+                    traceback.print_exc()
+                    self._failed.emit(generation, str(e))
+                except Exception as e:
+                    traceback.print_exc()
+                    self._failed.emit(generation, str(e))
+                else:
+                    self._finished.emit(generation, result)
+        finally:
+            self.database.close_thread_connection()
+
+    def _on_finished(self, generation: int, result):
+        """Entrega el resultado si sigue siendo el de la última petición (hilo de la interfaz)."""
+        if generation != self._generation:
+            return
+
+        self.last_latency_ms = (time.perf_counter() - self._requested_at) * 1000
+        self.results_ready.emit(result, self.last_latency_ms)
+
+    def _on_failed(self, generation: int, message: str):
+        """Informa el error si corresponde a la última petición (hilo de la interfaz)."""
+        if generation != self._generation:
+            return
+
+        print(f"✗ Error en la consulta en segundo plano: {message}")
+        self.query_failed.emit(message)
@@ -0,0 +1,104 @@
+"""
+Módulo de contadores de tareas.
+Mantiene la cantidad de tareas por estado sin recorrer la tabla en cada consulta.
+"""
+
+from typing import Dict, Optional
+from PyQt5.QtCore import QObject, pyqtSignal
+from app.models import TaskModel
+from app.events import EventBus, TaskCreated, TaskDeleted, TaskMoved, TaskUpdated, event_bus
+
+
+class TaskCounters(QObject):
+    """
+    Conteo de tareas por estado, mantenido de forma incremental.
+
+    Se inicializa una sola vez con una consulta agregada (GROUP BY status) y
+    después aplica +1/-1 con cada evento del bus, de modo que leer los
+    conteos cuesta O(1) sin importar cuántas tareas haya.
+    """
+
+    # Señal cuando cambia algún conteo: {status: cantidad}
+    changed = pyqtSignal(dict)
+
+    def __init__(self, model=TaskModel, bus: EventBus = event_bus, parent=None):
+        """
+        Inicializa los contadores (la carga se hace bajo demanda).
+
+        Args:
+            model: Modelo desde el que se cuentan las tareas
+            bus: Bus de eventos del que recibe los cambios
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+        self.model = model
+        self.bus = bus
+        self._counts: Optional[Dict[str, int]] = None  # None hasta la primera carga
+
+        # [(tipo_evento, handler)] para poder desuscribirse en close()
+        self._subscriptions = [
+            (TaskCreated, lambda event: self._apply({event.task.get('status'): 1})),
+            (TaskUpdated, lambda event: self._on_status_changed(event.previous_status,
+                                                                event.task.get('status'))),
+            (TaskMoved, lambda event: self._on_status_changed(event.previous_status, event.status)),
+            (TaskDeleted, lambda event: self._apply({event.status: -1})),
+        ]
+        for event_type, handler in self._subscriptions:
+            bus.subscribe(event_type, handler)
+
+    def close(self):
+        """Deja de recibir los eventos del bus."""
+        for event_type, handler in self._subscriptions:
+            self.bus.unsubscribe(event_type, handler)
+        self._subscriptions = []
+
+    def ensure_loaded(self):
+        """Cuenta las tareas en la base de datos si todavía no se contaron."""
+        if self._counts is None:
+            self.reload()
+
+    def reload(self):
+        """Vuelve a contar las tareas con la consulta agregada."""
+        try:
+            self._counts = self.model.count_by_status()
+        except Exception as e:
+            print(f"✗ Error al contar las tareas: {e}")
+            return
+
+        self.changed.emit(self.counts())
+
+    def counts(self) -> Dict[str, int]:
+        """Retorna una copia de los conteos por estado (todos los estados válidos)."""
+        self.ensure_loaded()
+        counts = {status: 0 for status in TaskModel.VALID_STATUSES}
+        counts.update(self._counts or {})
+        return counts
+
+    def total(self) -> int:
+        """Retorna la cantidad total de tareas."""
+        self.ensure_loaded()
+        return sum((self._counts or {}).values())
+
+    def _on_status_changed(self, previous_status: Optional[str], status: Optional[str]):
+        """Pasa una tarea de un estado a otro."""
+        if previous_status and status and previous_status != status:
+            self._apply({previous_status: -1, status: 1})
+
+    def _apply(self, deltas: Dict[Optional[str], int]):
+        """
+        Aplica variaciones a los conteos y avisa si alguno cambió.
+
+        Args:
+            deltas: Diccionario {status: variación}; los estados desconocidos se ignoran
+        """
+        if self._counts is None:
+            return  # La primera carga ya incluirá el cambio
+
+        changed = False
+        for status, delta in deltas.items():
+            if status in self._counts and delta:
+                self._counts[status] = max(0, self._counts[status] + delta)
+                changed = True
+
+        if changed:
+            self.changed.emit(self.counts())
@@ -3,6 +3,7 @@ Módulo de utilidades.
 Funciones auxiliares para la aplicación.
 """
 
+import re
 from datetime import datetime
 from typing import Optional
 
@@ -43,3 +44,22 @@ def truncate_text(text: str, max_length: int = 50) -> str:
     
     return text[:max_length - 3] + "..."
 
+
+def build_fts_query(text: str) -> Optional[str]:
+    """
+    Convierte lo que escribe el usuario en una consulta FTS5 segura.
+    
+    Cada palabra se busca como prefijo ("impl" encuentra "implementar") y
+    todas deben aparecer. Las comillas y operadores de FTS5 se descartan para
+    que ninguna entrada produzca un error de sintaxis.
+    
+    Args:
+        text: Texto de búsqueda
+        
+    Returns:
+        Expresión para MATCH o None si no hay palabras que buscar
+    """
+    words = re.findall(r"\w+", text or "")
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
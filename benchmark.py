@@ -0,0 +1,541 @@
+"""
+Script de benchmarks de la aplicación.
+Mide el costo de las operaciones de la base de datos sobre archivos temporales
+(nunca abre tasks.db).
+
+Uso: python benchmark.py [--profiles | --stats-redraw | --search | --reorder | --updates | --concurrency] ...
+"""
+
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+
+def _percentile(values: list, percent: float) -> float:
+    """Retorna el percentil indicado (0-100) de una lista de valores."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _print_latencies(label: str, latencies_ms: list):
+    """Imprime una fila con las estadísticas de latencia en milisegundos."""
+    print(f"   {label:<22} media {statistics.mean(latencies_ms):8.3f} ms   "
+          f"p50 {_percentile(latencies_ms, 50):8.3f} ms   "
+          f"p99 {_percentile(latencies_ms, 99):8.3f} ms")
+
+
+def benchmark_storage_profiles(writes: int = 500):
+    """
+    Mide la latencia de escritura (un commit por sentencia, como Database.execute)
+    con cada perfil de almacenamiento.
+
+    Args:
+        writes: Cantidad de inserciones y de cambios de estado por perfil
+    """
+    from app.database import Database, STORAGE_PROFILES
+
+    print("=" * 70)
+    print(f"LATENCIA DE ESCRITURA POR PERFIL ({writes} escrituras)")
+    print("=" * 70)
+
+    results = {}
+
+    for profile in STORAGE_PROFILES:
+        with tempfile.TemporaryDirectory() as directory:
+            database = Database(os.path.join(directory, "bench.db"), profile=profile)
+
+            insert_latencies = []
+            for i in range(writes):
+                start = time.perf_counter()
+                database.execute(
+                    "INSERT INTO tasks (title, description, status, created_at, due_date) VALUES (?, ?, ?, ?, ?)",
+                    (f"Tarea {i}", "", "todo", datetime.now().isoformat(), None)
+                )
+                insert_latencies.append((time.perf_counter() - start) * 1000)
+
+            move_latencies = []
+            for task_id in range(1, writes + 1):
+                start = time.perf_counter()
+                database.execute("UPDATE tasks SET status = ? WHERE id = ?", ("doing", task_id))
+                move_latencies.append((time.perf_counter() - start) * 1000)
+
+            database.close()
+            results[profile] = (insert_latencies, move_latencies)
+
+    print()
+    for profile, (insert_latencies, move_latencies) in results.items():
+        print(f"📌 {profile}")
+        _print_latencies("crear tarea", insert_latencies)
+        _print_latencies("mover tarea", move_latencies)
+    print("=" * 70)
+
+
+def _close_view(app, view, controller):
+    """
+    Cierra una vista de benchmark y su controlador, esperando antes a que
+    terminen los cálculos de métricas de flujo en curso (usan conexiones
+    del pool de lectura de la base de datos temporal).
+    """
+    analytics = getattr(view, 'analytics', None)
+    deadline = time.perf_counter() + 10
+    while analytics is not None and analytics._running and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    
+    view.close()
+    controller.close()
+
+
+def _rebuild_chart(figure, canvas, counts: dict):
+    """Redibujo anterior de StatsView: limpia la figura y la reconstruye completa."""
+    from matplotlib.ticker import MaxNLocator
+    
+    figure.clear()
+    ax = figure.add_subplot(111)
+    valores = [counts["todo"], counts["doing"], counts["done"]]
+    bars = ax.bar(["Por Hacer", "En Progreso", "Hecho"], valores,
+                  color=["#2196F3", "#FF9800", "#4CAF50"], alpha=0.8, edgecolor='black', linewidth=1.5)
+    ax.set_ylabel('Cantidad de Tareas', fontsize=12, fontweight='bold')
+    ax.set_xlabel('Estado', fontsize=12, fontweight='bold')
+    ax.set_title('Distribución de Tareas por Estado', fontsize=14, fontweight='bold', pad=20)
+    for bar, valor in zip(bars, valores):
+        ax.text(bar.get_x() + bar.get_width()/2., bar.get_height(), f'{valor}',
+                ha='center', va='bottom', fontsize=11, fontweight='bold')
+    ax.set_ylim(bottom=0)
+    ax.set_ylim(top=max(max(valores) + 1, 5))
+    ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    figure.tight_layout()
+    canvas.draw()
+
+
+def benchmark_stats_redraw(iterations: int = 100):
+    """
+    Compara el redibujo del gráfico de StatsView reconstruyendo la figura
+    (antes) con la actualización de las barras existentes (ahora).
+    
+    Args:
+        iterations: Cantidad de actualizaciones medidas en cada caso
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    
+    from app.controller import TaskController
+    from app.database import Database
+    from ui.stats_view import StatsView
+    
+    print("=" * 70)
+    print(f"REDIBUJO DEL GRÁFICO DE ESTADÍSTICAS ({iterations} actualizaciones)")
+    print("=" * 70)
+    
+    directory = tempfile.TemporaryDirectory()
+    database = Database(os.path.join(directory.name, "bench.db"), profile="fast")
+    controller = TaskController(database=database)
+    
+    view = StatsView(controller)
+    view.resize(1000, 700)
+    view.show()
+    app.processEvents()
+    
+    # Cada iteración cambia los conteos para que siempre haya algo que dibujar
+    samples = [{"todo": i % 7, "doing": (i * 3) % 11, "done": i % 5 + 1} for i in range(iterations)]
+    
+    rebuild_latencies = []
+    for counts in samples:
+        start = time.perf_counter()
+        _rebuild_chart(view.figure, view.canvas, counts)
+        rebuild_latencies.append((time.perf_counter() - start) * 1000)
+    
+    # Volver a los artistas persistentes de la vista
+    view.figure.clear()
+    view._setup_chart()
+    
+    update_latencies = []
+    for counts in samples:
+        start = time.perf_counter()
+        view._update_chart(counts)
+        app.processEvents()  # Ejecuta el draw_idle pendiente
+        update_latencies.append((time.perf_counter() - start) * 1000)
+    
+    # Conteos repetidos: no debería dibujarse nada
+    unchanged_latencies = []
+    for _ in samples:
+        start = time.perf_counter()
+        view._update_chart(samples[-1])
+        app.processEvents()
+        unchanged_latencies.append((time.perf_counter() - start) * 1000)
+    
+    _close_view(app, view, controller)
+    database.close()
+    directory.cleanup()
+    
+    print()
+    _print_latencies("reconstruir figura", rebuild_latencies)
+    _print_latencies("actualizar artistas", update_latencies)
+    _print_latencies("sin cambios", unchanged_latencies)
+    print("=" * 70)
+
+
+def benchmark_search_latency(typing_interval_ms: int = 80, tasks_count: int = 20000):
+    """
+    Simula escribir en la caja de búsqueda del tablero Kanban y mide el
+    bloqueo de la interfaz por tecla y la latencia desde la última tecla
+    hasta que llegan los resultados, sobre una base de datos temporal.
+    
+    Args:
+        typing_interval_ms: Tiempo entre teclas simuladas
+        tasks_count: Cantidad de tareas de la base de datos temporal
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    
+    from app.controller import TaskController
+    from app.database import Database
+    from ui.kanban_view import KanbanView
+    
+    words = ["tarea", "implementar", "revisar", "documentacion", "prueba"]
+    
+    print("=" * 70)
+    print(f"BÚSQUEDA MIENTRAS SE ESCRIBE ({len(words)} palabras, una tecla cada {typing_interval_ms} ms)")
+    print("=" * 70)
+    
+    directory = tempfile.TemporaryDirectory()
+    database = Database(os.path.join(directory.name, "bench.db"), profile="fast")
+    controller = TaskController(database=database)
+    tasks = controller.model
+    # Cada palabra (salvo "tarea", que está en todas) aparece en una de cada cuatro tareas
+    tasks.bulk_create([{'title': f"Tarea {i}", 'description': f"{words[1 + i % 4]} pendiente",
+                        'status': tasks.VALID_STATUSES[i % 3]} for i in range(tasks_count)])
+    
+    view = KanbanView(controller)
+    view.show()
+    app.processEvents()
+    
+    delivered = []
+    view.search_scheduler.results_ready.connect(lambda result, latency: delivered.append(latency))
+    
+    def wait(milliseconds: float):
+        deadline = time.perf_counter() + milliseconds / 1000
+        while time.perf_counter() < deadline:
+            app.processEvents()
+            time.sleep(0.001)
+    
+    # Antes: una consulta síncrona en el hilo de la interfaz por cada tecla
+    sync_latencies = []
+    for word in words:
+        for end in range(1, len(word) + 1):
+            start = time.perf_counter()
+            tasks.search(word[:end])
+            sync_latencies.append((time.perf_counter() - start) * 1000)
+    
+    keystroke_latencies = []
+    result_latencies = []
+    for word in words:
+        view.search_edit.clear()
+        wait(typing_interval_ms)
+        delivered.clear()
+        
+        for end in range(1, len(word) + 1):
+            start = time.perf_counter()
+            view.search_edit.setText(word[:end])
+            keystroke_latencies.append((time.perf_counter() - start) * 1000)
+            wait(typing_interval_ms)
+        
+        # Esperar los resultados de la última tecla
+        deadline = time.perf_counter() + 10
+        while not delivered and time.perf_counter() < deadline:
+            wait(1)
+        if delivered:
+            result_latencies.append(delivered[-1])
+    
+    view.search_scheduler.stop()
+    _close_view(app, view, controller)
+    database.close()
+    directory.cleanup()
+    
+    print(f"\n   Tareas en la base de datos: {tasks_count}")
+    print(f"   Espera (debounce): {view.SEARCH_DELAY} ms\n")
+    _print_latencies("consulta síncrona", sync_latencies)
+    _print_latencies("bloqueo por tecla", keystroke_latencies)
+    if result_latencies:
+        _print_latencies("tecla → resultados", result_latencies)
+    print("=" * 70)
+
+
+def benchmark_reorder(cards: int = 10000, moves: int = 500):
+    """
+    Reordena tarjetas al azar dentro de una columna y cuenta las filas que
+    escribe cada movimiento (total_changes de SQLite). Como referencia,
+    calcula las filas que escribiría una numeración densa (0, 1, 2, ...),
+    que debe renumerar todas las tarjetas desplazadas.
+    
+    Args:
+        cards: Cantidad de tarjetas en la columna
+        moves: Cantidad de movimientos
+    """
+    import random
+    from app.database import Database
+    from app.models import TaskModel
+    
+    print("=" * 70)
+    print(f"REORDENAR UNA COLUMNA DE {cards} TARJETAS ({moves} movimientos)")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(os.path.join(directory, "bench.db"), profile="fast")
+        
+        # Variante del modelo sobre el archivo temporal (la base de datos por defecto no se abre)
+        tasks = TaskModel.bind(database)
+        
+        tasks.bulk_create([{'title': f"Tarea {i}"} for i in range(cards)])
+        order = [task['id'] for task in tasks.get_by_status(TaskModel.STATUS_TODO)]
+        
+        rng = random.Random(42)
+        rows_written = []
+        dense_rows = []
+        latencies = []
+        
+        for _ in range(moves):
+            old_index = rng.randrange(len(order))
+            task_id = order.pop(old_index)
+            new_index = rng.randrange(len(order) + 1)
+            previous_id = order[new_index - 1] if new_index > 0 else None
+            
+            changes_before = database.connection.total_changes
+            start = time.perf_counter()
+            tasks.move(task_id, TaskModel.STATUS_TODO, previous_id)
+            latencies.append((time.perf_counter() - start) * 1000)
+            rows_written.append(database.connection.total_changes - changes_before)
+            dense_rows.append(abs(old_index - new_index) + 1)
+            
+            order.insert(new_index, task_id)
+        
+        stored = tasks.get_by_status(TaskModel.STATUS_TODO)
+        consistent = [task['id'] for task in stored] == order
+        longest_key = max(len(task['position']) for task in stored)
+        
+        database.close()
+    
+    print(f"\n   Filas escritas por movimiento: media {statistics.mean(rows_written):.2f}, "
+          f"máximo {max(rows_written)}")
+    print(f"   Numeración densa (referencia): media {statistics.mean(dense_rows):.0f}, "
+          f"máximo {max(dense_rows)}")
+    print(f"   Clave de posición más larga: {longest_key} caracteres")
+    print(f"   Orden guardado igual al esperado: {'sí' if consistent else 'NO'}\n")
+    _print_latencies("mover tarjeta", latencies)
+    print("=" * 70)
+
+
+def benchmark_updates(updates: int = 6000, rounds: int = 30):
+    """
+    Mide TaskModel.update, con combinaciones de campos al azar, sin caché de
+    sentencias preparadas (cached_statements=0: SQLite compila cada UPDATE)
+    y con la caché de STATEMENT_CACHE_SIZE sentencias que usa la aplicación.
+    
+    Los dos casos se alternan por rondas (ABAB..., BABA...), cada uno sobre una
+    conexión nueva, así ninguno aprovecha la caché ni la página calentada por
+    el otro. Los cambios de estado no se incluyen: también reubican la tarjeta
+    y su costo tapa el de preparar la sentencia.
+    
+    Args:
+        updates: Cantidad de actualizaciones en cada caso
+        rounds: Cantidad de rondas en que se reparten
+    """
+    import random
+    from app.database import Database, STATEMENT_CACHE_SIZE
+    from app.models import TaskModel
+    
+    print("=" * 70)
+    print(f"ACTUALIZACIONES CON CAMPOS VARIABLES ({updates} por caso, {rounds} rondas)")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(os.path.join(directory, "bench.db"), profile="fast")
+        tasks = TaskModel.bind(database)
+        tasks.bulk_create([{'title': f"Tarea {i}"} for i in range(1000)])
+        
+        rng = random.Random(42)
+        samples = []
+        for i in range(updates):
+            fields = {}
+            # Cada campo se incluye con probabilidad 1/2 (al menos uno)
+            while not fields:
+                if rng.random() < 0.5:
+                    fields['title'] = f"Tarea {i}"
+                if rng.random() < 0.5:
+                    fields['description'] = f"Descripción {i}"
+                if rng.random() < 0.5:
+                    fields['due_date'] = f"2026-01-{i % 28 + 1:02d}"
+            samples.append((rng.randint(1, 1000), fields))
+        
+        def with_suffix(fields: dict, suffix: str) -> dict:
+            # Valores distintos en cada caso: el segundo no encuentra el texto ya
+            # indexado (los triggers FTS5 solo reindexan si el texto cambia)
+            return {field: value if field == 'due_date' else f"{value} {suffix}"
+                    for field, value in fields.items()}
+        
+        variants = (("sin caché", 0, "a"),
+                    (f"caché de {STATEMENT_CACHE_SIZE}", STATEMENT_CACHE_SIZE, "b"))
+        
+        results = {label: [] for label, _, _ in variants}
+        round_means = {label: [] for label, _, _ in variants}
+        per_round = max(1, updates // rounds)
+        
+        for round_index in range(rounds):
+            chunk = samples[round_index * per_round:(round_index + 1) * per_round]
+            order = variants if round_index % 2 == 0 else variants[::-1]
+            for label, cache_size, suffix in order:
+                # La conexión del hilo se abre con el tamaño de caché del caso
+                database.statement_cache_size = cache_size
+                database.open_thread_connection()
+                latencies = []
+                for task_id, fields in chunk:
+                    start = time.perf_counter()
+                    tasks.update(task_id, **with_suffix(fields, suffix))
+                    latencies.append((time.perf_counter() - start) * 1000)
+                database.close_thread_connection()
+                
+                results[label].extend(latencies)
+                round_means[label].append(statistics.mean(latencies))
+        
+        database.close()
+    
+    print()
+    for label, latencies in results.items():
+        _print_latencies(label, latencies)
+    
+    # Diferencia por ronda: separa el efecto de la caché del ruido entre rondas
+    (before_label, _, _), (after_label, _, _) = variants
+    differences = [(after - before) * 1000 for before, after
+                   in zip(round_means[before_label], round_means[after_label])]
+    faster = sum(1 for difference in differences if difference < 0)
+    print(f"\n   Diferencia por ronda (con caché - sin caché): media {statistics.mean(differences):+.1f} µs, "
+          f"desvío {statistics.stdev(differences) if len(differences) > 1 else 0:.1f} µs; "
+          f"con caché fue más rápido en {faster} de {len(differences)} rondas")
+    print("=" * 70)
+
+
+def benchmark_concurrency(readers: int = 4, seconds: float = 3.0, tasks_count: int = 20000):
+    """
+    Prueba de carga: varios hilos leen (páginas de columnas, conteos y
+    búsquedas) con las conexiones del pool mientras un hilo escritor mueve
+    tarjetas con su propia conexión. Reporta la latencia de cada lado y los
+    errores (p. ej. "database is locked").
+    
+    Args:
+        readers: Cantidad de hilos lectores
+        seconds: Duración de la prueba
+        tasks_count: Cantidad de tareas de la base de datos temporal
+    """
+    import random
+    import threading
+    from app.database import Database
+    from app.models import TaskModel
+    
+    print("=" * 70)
+    print(f"LECTURAS CONCURRENTES ({readers} lectores + 1 escritor, {seconds:.0f} s, {tasks_count} tareas)")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(os.path.join(directory, "bench.db"))
+        tasks = TaskModel.bind(database)
+        # Cada palabra aparece en una de cada diez tareas
+        words = ["revisar", "documentacion", "prueba", "cliente", "informe",
+                 "reunion", "diseño", "error", "servidor", "factura"]
+        tasks.bulk_create([{'title': f"Tarea {i}", 'description': f"{words[i % 10]} pendiente",
+                            'status': TaskModel.VALID_STATUSES[i % 3]} for i in range(tasks_count)])
+        task_ids = [task['id'] for task in tasks.get_all()]
+        
+        stop = threading.Event()
+        read_latencies = [[] for _ in range(readers)]
+        write_latencies = []
+        errors = []
+        
+        def read_loop(latencies: list, seed: int):
+            rng = random.Random(seed)
+            queries = [
+                lambda: tasks.get_page(rng.choice(TaskModel.VALID_STATUSES)),
+                lambda: tasks.count_by_status(),
+                lambda: tasks.search(rng.choice(words)),
+            ]
+            try:
+                while not stop.is_set():
+                    query = rng.choice(queries)
+                    start = time.perf_counter()
+                    query()
+                    latencies.append((time.perf_counter() - start) * 1000)
+            except Exception as e:
+                errors.append(f"lector: {e}")
+            finally:
+                database.release_read_connection()
+        
+        def write_loop():
+            rng = random.Random(0)
+            database.open_thread_connection()
+            try:
+                while not stop.is_set():
+                    status = rng.choice(TaskModel.VALID_STATUSES)
+                    start = time.perf_counter()
+                    tasks.move(rng.choice(task_ids), status, rng.choice(task_ids))
+                    write_latencies.append((time.perf_counter() - start) * 1000)
+            except Exception as e:
+                errors.append(f"escritor: {e}")
+            finally:
+                database.close_thread_connection()
+        
+        threads = [threading.Thread(target=read_loop, args=(read_latencies[i], i)) for i in range(readers)]
+        threads.append(threading.Thread(target=write_loop))
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        
+        database.close()
+    
+    all_reads = [latency for latencies in read_latencies for latency in latencies]
+    print(f"\n   Lecturas: {len(all_reads)} ({len(all_reads) / seconds:.0f}/s)   "
+          f"Escrituras: {len(write_latencies)} ({len(write_latencies) / seconds:.0f}/s)   "
+          f"Errores: {len(errors)}\n")
+    if all_reads:
+        _print_latencies("lectura (pool)", all_reads)
+    if write_latencies:
+        _print_latencies("escritura", write_latencies)
+    for error in errors[:5]:
+        print(f"   ✗ {error}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    import sys
+
+    benchmarks = {
+        "--profiles": benchmark_storage_profiles,
+        "--stats-redraw": benchmark_stats_redraw,
+        "--search": benchmark_search_latency,
+        "--reorder": benchmark_reorder,
+        "--updates": benchmark_updates,
+        "--concurrency": benchmark_concurrency,
+    }
+
+    usage = f"Uso: python benchmark.py [{' | '.join(benchmarks)}] ... (sin opciones: todos)"
+    args = sys.argv[1:]
+
+    if "-h" in args or "--help" in args:
+        print(usage)
+        sys.exit(0)
+
+    unknown = [arg for arg in args if arg not in benchmarks]
+    if unknown:
+        print(f"✗ Opción desconocida: {' '.join(unknown)}")
+        print(usage)
+        sys.exit(2)
+
+    for name in args or list(benchmarks):
+        benchmarks[name]()
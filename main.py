@@ -4,9 +4,80 @@ Organizador de Tareas estilo Kanban.
 """
 
 import sys
+import time
+
+# Inicio del proceso para --profile-startup (antes de las importaciones pesadas)
+_START_TIME = time.perf_counter()
+
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QEvent
+
+_IMPORTS_START = time.perf_counter()
+from app.database import configure_from_args
 from ui.main_window import MainWindow
+_IMPORTS_END = time.perf_counter()
+
+
+class StartupProfiler(QObject):
+    """
+    Mide las etapas del arranque hasta el primer pintado de la ventana
+    y las imprime con la opción --profile-startup.
+    """
+    
+    # Módulos pesados que no deberían cargarse antes de mostrar la ventana
+    HEAVY_MODULES = ("matplotlib", "numpy")
+    
+    def __init__(self):
+        """Inicializa el perfilador con las marcas de las importaciones."""
+        super().__init__()
+        self.marks = [
+            ("Importar PyQt5", _IMPORTS_START),
+            ("Importar la interfaz", _IMPORTS_END),
+        ]
+        self._reported = False
+    
+    def mark(self, label: str):
+        """
+        Registra el fin de una etapa.
+        
+        Args:
+            label: Nombre de la etapa
+        """
+        self.marks.append((label, time.perf_counter()))
+    
+    def watch_first_paint(self, widget):
+        """
+        Espera el primer evento de pintado del widget para cerrar la medición.
+        
+        Args:
+            widget: Ventana cuyo primer pintado se mide
+        """
+        widget.installEventFilter(self)
+    
+    def eventFilter(self, obj, event) -> bool:
+        """Detecta el primer pintado e imprime el reporte."""
+        if event.type() == QEvent.Paint and not self._reported:
+            self._reported = True
+            obj.removeEventFilter(self)
+            self.mark("Primer pintado")
+            self.report()
+        return False
+    
+    def report(self):
+        """Imprime la duración de cada etapa y el tiempo total hasta el primer pintado."""
+        print("=" * 60)
+        print("⏱  ARRANQUE DE LA APLICACIÓN")
+        print("=" * 60)
+        
+        previous = _START_TIME
+        for label, timestamp in self.marks:
+            print(f"   {label:<28} {(timestamp - previous) * 1000:9.1f} ms"
+                  f"   (acumulado {(timestamp - _START_TIME) * 1000:9.1f} ms)")
+            previous = timestamp
+        
+        loaded = [name for name in self.HEAVY_MODULES if name in sys.modules]
+        print(f"   Módulos pesados cargados: {', '.join(loaded) if loaded else 'ninguno'}")
+        print("=" * 60)
 
 
 def load_styles(app: QApplication):
@@ -29,6 +100,11 @@ def load_styles(app: QApplication):
 
 def main():
     """Función principal que inicia la aplicación."""
+    profiler = StartupProfiler() if "--profile-startup" in sys.argv else None
+    
+    # Archivo de la base de datos: --db RUTA, TASKS_DB_PATH o "tasks.db"
+    configure_from_args(sys.argv)
+    
     # Habilitar alta DPI scaling
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
@@ -37,11 +113,17 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Organizador de Tareas Kanban")
     
+    if profiler:
+        profiler.mark("Crear QApplication")
+    
     # Cargar estilos
     load_styles(app)
     
     # Crear y mostrar la ventana principal
-    window = MainWindow()
+    window = MainWindow(profile_views="--profile-views" in sys.argv)
+    if profiler:
+        profiler.mark("Construir MainWindow")
+        profiler.watch_first_paint(window)
     window.show()
     
     # Ejecutar el bucle de eventos
@@ -0,0 +1,56 @@
+"""
+Fixtures compartidas por las pruebas.
+
+Cada prueba trabaja sobre su propia base de datos en un archivo temporal, así
+las pruebas pueden correr en paralelo y nunca tocan el tasks.db del usuario.
+"""
+
+import os
+
+import pytest
+
+# Las vistas se crean sin ventana (antes de importar PyQt5)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from app import database as database_module
+from app.database import Database
+
+
+@pytest.fixture
+def default_database_guard(tmp_path, monkeypatch):
+    """
+    Falla la prueba si abre la base de datos por defecto.
+
+    El directorio de trabajo pasa a uno vacío, así un tasks.db creado por
+    error también queda a la vista.
+    """
+    workdir = tmp_path / "cwd"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    monkeypatch.delenv(database_module.DB_PATH_ENV, raising=False)
+    monkeypatch.setattr(database_module, "_default_database", None)
+
+    yield
+
+    opened = database_module._default_database
+    if opened is not None:
+        opened.close()
+    assert opened is None, "La prueba abrió la base de datos por defecto"
+    assert not (workdir / database_module.DEFAULT_DB_PATH).exists()
+
+
+@pytest.fixture
+def database(tmp_path, default_database_guard):
+    """Base de datos aislada en un archivo temporal (con las migraciones aplicadas)."""
+    database = Database(str(tmp_path / "tasks.db"), profile="fast")
+    yield database
+    database.close()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """QApplication compartida por las pruebas que crean widgets."""
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    yield app
@@ -0,0 +1,51 @@
+"""
+Pruebas de la reconstrucción de conteos y de las métricas de flujo.
+"""
+
+import time
+from datetime import datetime
+
+from app.analytics import compute_flow_metrics
+from app.controller import TaskController
+
+
+def now_between_events() -> str:
+    """Instante separado de los eventos vecinos (los triggers guardan milisegundos)."""
+    time.sleep(0.005)
+    moment = datetime.now().isoformat()
+    time.sleep(0.005)
+    return moment
+
+
+def test_count_by_status_at_replays_history(database):
+    controller = TaskController(database=database)
+    model = controller.model
+    created = controller.create_tasks([{'title': f"Tarea {i}"} for i in range(6)])
+    ids = [task['id'] for task in created]
+    controller.update_tasks_status(ids[:3], "doing")
+
+    moment = now_between_events()
+    expected = model.count_by_status()
+
+    controller.update_task_status(ids[0], "done")
+    controller.move_tasks(ids[3:5], "done")
+    controller.delete_task(ids[1])
+    controller.create_task("Nueva", status="doing")
+
+    assert model.count_by_status_at(moment) == expected == {'todo': 3, 'doing': 3, 'done': 0}
+    assert model.count_by_status_at(now_between_events()) == model.count_by_status()
+    controller.close()
+
+
+def test_flow_metrics_end_at_current_counts(database):
+    controller = TaskController(database=database)
+    created = controller.create_tasks([{'title': f"Tarea {i}"} for i in range(5)])
+    controller.update_task_status(created[0]['id'], "doing")
+    controller.update_task_status(created[1]['id'], "done")
+
+    metrics = compute_flow_metrics(7, controller.model)
+
+    counts = controller.model.count_by_status()
+    assert {status: int(values[-1]) for status, values in metrics.cumulative.items()} == counts
+    assert int(metrics.throughput.sum()) == 1
+    controller.close()
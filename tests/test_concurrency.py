@@ -0,0 +1,116 @@
+"""
+Prueba de carga: un hilo escritor y varios lectores sobre la misma base de datos.
+
+Falla si algún hilo recibe "database is locked" o un ProgrammingError, o si un
+lector ve a medias un lote de bulk_create() o de move_many().
+"""
+
+import random
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+
+from app.database import Database
+from app.models import TaskModel
+
+READERS = 4
+SECONDS = 1.5
+BATCH_SIZE = 5
+
+# Tareas de los lotes del escritor: "lote-<n>-<i>"
+BATCH_QUERY = "SELECT title, status FROM tasks WHERE title LIKE 'lote-%'"
+
+
+def torn_batches(rows: list) -> list:
+    """Lotes incompletos o con tareas en distintas columnas."""
+    batches = defaultdict(list)
+    for row in rows:
+        batches[row['title'].rsplit('-', 1)[0]].append(row['status'])
+    return [(batch, statuses) for batch, statuses in batches.items()
+            if len(statuses) != BATCH_SIZE or len(set(statuses)) != 1]
+
+
+def test_readers_and_writer_run_concurrently(database):
+    tasks = TaskModel.bind(database)
+    tasks.bulk_create([{'title': f"Tarea {i}", 'description': "revisar pendiente",
+                        'status': TaskModel.VALID_STATUSES[i % 3]} for i in range(600)])
+
+    stop = threading.Event()
+    errors = []
+    reads = [0] * READERS
+    batches = []  # [[task_id]] creados por el escritor
+
+    def read_loop(index: int):
+        rng = random.Random(index)
+        queries = [
+            lambda: tasks.get_page(rng.choice(TaskModel.VALID_STATUSES)),
+            lambda: tasks.count_by_status(),
+            lambda: tasks.search("revisar"),
+        ]
+        try:
+            while not stop.is_set():
+                rng.choice(queries)()
+                # Una sola sentencia: ve cada lote entero o no lo ve
+                torn = torn_batches(database.fetch_all(BATCH_QUERY))
+                if torn:
+                    errors.append(f"lector {index}: lotes a medias {torn}")
+                reads[index] += 1
+        except sqlite3.Error as e:
+            errors.append(f"lector {index}: {type(e).__name__}: {e}")
+        finally:
+            database.release_read_connection()
+
+    def write_loop():
+        rng = random.Random(0)
+        database.open_thread_connection()
+        try:
+            while not stop.is_set():
+                created = tasks.bulk_create([{'title': f"lote-{len(batches)}-{i}"}
+                                             for i in range(BATCH_SIZE)])
+                batches.append([task['id'] for task in created])
+
+                # Mover un lote entero a otra columna
+                batch = rng.choice(batches)
+                if len(tasks.move_many(batch, rng.choice(TaskModel.VALID_STATUSES))) != BATCH_SIZE:
+                    errors.append("escritor: move_many no movió el lote completo")
+        except sqlite3.Error as e:
+            errors.append(f"escritor: {type(e).__name__}: {e}")
+        finally:
+            database.close_thread_connection()
+
+    threads = [threading.Thread(target=read_loop, args=(i,)) for i in range(READERS)]
+    threads.append(threading.Thread(target=write_loop))
+    for thread in threads:
+        thread.start()
+    time.sleep(SECONDS)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(batches) > 10
+    assert all(count > 10 for count in reads)
+
+
+def test_memory_database_refuses_foreign_threads():
+    database = Database(":memory:")
+    failures = []
+
+    def read():
+        try:
+            database.fetch_all("SELECT id FROM tasks")
+        except sqlite3.ProgrammingError as e:
+            failures.append(e)
+
+    try:
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+        assert len(failures) == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            database.open_thread_connection()
+    finally:
+        database.close()
@@ -0,0 +1,51 @@
+"""
+Pruebas de TaskController sobre una base de datos inyectada.
+"""
+
+from app.controller import TaskController
+from app.events import TaskCreated, TaskDeleted, TaskMoved, event_bus
+
+
+def test_controller_writes_to_injected_database(database):
+    controller = TaskController(database=database)
+
+    task = controller.create_task("Escribir el informe", "Borrador", "todo")
+    assert task is not None
+    assert controller.update_task_status(task['id'], "doing")['status'] == "doing"
+
+    row = database.fetch_one("SELECT title, status FROM tasks WHERE id = ?", (task['id'],))
+    assert row == {'title': "Escribir el informe", 'status': "doing"}
+    assert controller.get_task_counts() == {'todo': 0, 'doing': 1, 'done': 0}
+
+    controller.close()
+
+
+def test_controller_publishes_on_its_own_bus(database):
+    controller = TaskController(database=database)
+    received, leaked = [], []
+    for event_type in (TaskCreated, TaskMoved, TaskDeleted):
+        controller.bus.subscribe(event_type, received.append)
+        event_bus.subscribe(event_type, leaked.append)
+
+    try:
+        task = controller.create_task("Revisar")
+        controller.update_task_status(task['id'], "done")
+        controller.delete_task(task['id'])
+    finally:
+        for event_type in (TaskCreated, TaskMoved, TaskDeleted):
+            event_bus.unsubscribe(event_type, leaked.append)
+        controller.close()
+
+    assert [type(event) for event in received] == [TaskCreated, TaskMoved, TaskDeleted]
+    assert leaked == []
+
+
+def test_counters_follow_the_controller_bus(database):
+    controller = TaskController(database=database)
+    controller.counters.ensure_loaded()
+
+    controller.create_tasks([{'title': "Uno"}, {'title': "Dos", 'status': "done"}])
+
+    assert controller.counters.counts() == {'todo': 1, 'doing': 0, 'done': 1}
+    assert controller.counters.total() == 2
+    controller.close()
@@ -0,0 +1,42 @@
+"""
+Regresión de planes de consulta: ninguna lectura de los modelos puede volver
+a recorrer una tabla completa.
+"""
+
+import re
+
+import pytest
+
+from app.query_plans import explain_model_queries, is_full_scan, model_queries
+
+QUERY_NAMES = [name for name, _ in model_queries()]
+
+# Recorrido de una tabla de los modelos sin índice ("SCAN tasks", "SCAN task_events"...)
+FULL_SCAN = re.compile(r"^SCAN (tasks|task_events|notes)\b(?! USING)")
+
+
+@pytest.fixture
+def plans(database):
+    """Planes de todas las consultas sobre una base de datos nueva y migrada."""
+    return explain_model_queries(database)
+
+
+def test_every_query_is_explained(plans):
+    assert {name for name, _, _ in plans} == set(QUERY_NAMES)
+
+
+@pytest.mark.parametrize("query_name", QUERY_NAMES)
+def test_query_uses_an_index(plans, query_name):
+    for name, statement, details in plans:
+        if name != query_name:
+            continue
+        assert not any(is_full_scan(detail) for detail in details), (statement, details)
+        assert not any(FULL_SCAN.match(detail) for detail in details), (statement, details)
+
+
+def test_full_scan_detection():
+    assert is_full_scan("SCAN tasks")
+    assert not is_full_scan("SCAN tasks USING INDEX idx_tasks_status_position")
+    assert not is_full_scan("SEARCH tasks USING INTEGER PRIMARY KEY (rowid=?)")
+    assert is_full_scan("SCAN tasks_fts VIRTUAL TABLE INDEX 0:")
+    assert not is_full_scan("SCAN tasks_fts VIRTUAL TABLE INDEX 0:M2")
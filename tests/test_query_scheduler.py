@@ -0,0 +1,52 @@
+"""
+Pruebas de QueryScheduler: modelo atado a su conexión y cancelación.
+"""
+
+import time
+
+from app.database import Database
+from app.models import TaskModel
+from app.query_scheduler import QueryScheduler
+
+# Tarda unos 10 s si nadie la cancela
+SLOW_QUERY = """
+    WITH RECURSIVE counter(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM counter LIMIT 20000000)
+    SELECT count(*) AS total FROM counter
+"""
+
+
+def test_bind_model_uses_the_scheduler_database(qapp, tmp_path, database):
+    other = Database(str(tmp_path / "other.db"), profile="fast")
+    scheduler = QueryScheduler(database, delay=0)
+    try:
+        own_model = TaskModel.bind(database)
+        assert scheduler.bind_model(own_model) is own_model
+        assert scheduler.bind_model(TaskModel.bind(other)).db is database
+    finally:
+        scheduler.stop()
+        other.close()
+
+
+def test_stale_query_is_interrupted(qapp, tmp_path, database):
+    # El modelo de la vista apunta a otra base de datos: la cancelación tiene
+    # que llegar igual a la consulta en curso
+    other = Database(str(tmp_path / "other.db"), profile="fast")
+    scheduler = QueryScheduler(database, delay=0)
+    model = scheduler.bind_model(TaskModel.bind(other))
+    results = []
+    scheduler.results_ready.connect(lambda result, latency: results.append(result))
+
+    try:
+        scheduler.run_now(model.db.fetch_one, SLOW_QUERY)
+        time.sleep(0.2)  # La consulta lenta ya se está ejecutando
+        scheduler.run_now(model.db.fetch_one, "SELECT 42 AS total")
+
+        deadline = time.monotonic() + 5
+        while not results and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+
+        assert results == [{'total': 42}]
+    finally:
+        scheduler.stop()  # Espera al hilo antes de cerrar sus conexiones
+        other.close()
@@ -0,0 +1,46 @@
+"""
+Pruebas de las vistas sobre una base de datos inyectada.
+"""
+
+import time
+
+from app.controller import TaskController
+from app.note_controller import NoteController
+from ui.main_window import MainWindow
+
+
+def wait_for(qapp, condition, timeout: float = 5.0):
+    """Procesa eventos de Qt hasta que se cumpla la condición (o se agote el tiempo)."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def test_views_search_the_injected_database(qapp, database):
+    TaskController(database=database).create_task("Informe trimestral")
+    NoteController(database=database).create_note("Reunión", "Llevar el informe")
+
+    window = MainWindow(database=database)
+    try:
+        for view_name in ("notepad", "stats", "calendar", "kanban"):
+            window._on_view_changed(view_name)
+
+        results = {}
+        window.kanban_view.search_scheduler.results_ready.connect(
+            lambda result, latency: results.__setitem__('tasks', result[1]))
+        window.notepad_view.search_scheduler.results_ready.connect(
+            lambda result, latency: results.__setitem__('notes', result[1]))
+        window.kanban_view.search_edit.setText("informe")
+        window.kanban_view.search_edit.returnPressed.emit()
+        window.notepad_view.search_edit.setText("informe")
+        window.notepad_view.search_edit.returnPressed.emit()
+
+        assert wait_for(qapp, lambda: len(results) == 2)
+        assert [task['title'] for task in results['tasks']] == ["Informe trimestral"]
+        assert [note['title'] for note in results['notes']] == ["Reunión"]
+        assert window.kanban_view.search_scheduler.database is database
+        assert window.notepad_view.search_scheduler.database is database
+    finally:
+        window.close()
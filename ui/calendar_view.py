@@ -6,16 +6,28 @@ Muestra un calendario con las tareas programadas por día.
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QScrollArea, QListWidget,
                              QListWidgetItem, QCalendarWidget, QMessageBox)
-from PyQt5.QtCore import Qt, QDate
+from PyQt5.QtCore import Qt, QDate, pyqtSignal
 from PyQt5.QtGui import QTextCharFormat, QColor, QBrush
 from datetime import datetime
 from ui.task_card import TaskCard
 from app.controller import TaskController
+from app.month_cache import month_of, shift_month
+from ui.refreshable_view import RefreshableView
 
 
-class CalendarView(QWidget):
+class CalendarView(RefreshableView, QWidget):
     """Vista de calendario que muestra las tareas programadas por día."""
     
+    # Señal cuando se solicita editar una tarea del día
+    edit_task_requested = pyqtSignal(int)  # task_id
+    
+    # Señal cuando se solicita eliminar una tarea del día
+    delete_task_requested = pyqtSignal(int)  # task_id
+    
+    # Meses antes y después del visible que se cargan por adelantado (la
+    # cuadrícula muestra días de los meses vecinos)
+    PREFETCH_MONTHS = 1
+    
     def __init__(self, controller: TaskController, parent=None):
         """
         Inicializa la vista de calendario.
@@ -26,11 +38,24 @@ class CalendarView(QWidget):
         """
         super().__init__(parent)
         self.controller = controller
-        self.tasks_by_date = {}  # Diccionario {fecha_iso: [lista de tareas]}
-        self.task_cards = {}  # Diccionario {task_id: TaskCard}
+        self.months = controller.months
+        self.task_cards = {}  # Diccionario {task_id: TaskCard} de las tarjetas visibles
+        self._card_pool = []  # Tarjetas creadas, en el orden del layout (se reutilizan)
+        self._shown_tasks = None  # Tareas que muestra el panel del día (None = nada todavía)
+        self.highlighted_dates = set()  # Fechas ISO resaltadas en el calendario
+        
+        # Formatos de día creados una sola vez
+        self._task_format = QTextCharFormat()
+        self._task_format.setBackground(QBrush(QColor(156, 39, 176, 100)))  # Morado claro
+        self._task_format.setForeground(QBrush(QColor(255, 255, 255)))
+        self._plain_format = QTextCharFormat()
+        
+        # Las tareas se cargan por meses (solo los visibles) y la caché avisa
+        # de los días que cambian
+        self.months.days_changed.connect(self._on_dates_changed)
+        self.months.reloaded.connect(self.refresh_tasks)
         
         self._setup_ui()
-        self._load_tasks()
         self._update_calendar()
     
     def _setup_ui(self):
@@ -55,6 +80,7 @@ class CalendarView(QWidget):
         self.calendar = QCalendarWidget()
         self.calendar.setGridVisible(True)
         self.calendar.selectionChanged.connect(self._on_date_selected)
+        self.calendar.currentPageChanged.connect(lambda year, month: self._update_calendar())
         calendar_container.addWidget(self.calendar)
         
         # Botón para hoy
@@ -87,6 +113,13 @@ class CalendarView(QWidget):
         self.tasks_layout = QVBoxLayout(self.tasks_container)
         self.tasks_layout.setContentsMargins(5, 5, 5, 5)
         self.tasks_layout.setSpacing(10)
+        
+        # Mensaje para los días sin tareas (se muestra u oculta, no se recrea)
+        self.no_tasks_label = QLabel("No hay tareas programadas para este día.")
+        self.no_tasks_label.setAlignment(Qt.AlignCenter)
+        self.no_tasks_label.setObjectName("calendarNoTasksLabel")
+        self.no_tasks_label.hide()
+        self.tasks_layout.addWidget(self.no_tasks_label)
         self.tasks_layout.addStretch()
         
         scroll_area.setWidget(self.tasks_container)
@@ -99,50 +132,70 @@ class CalendarView(QWidget):
         # Seleccionar fecha actual por defecto
         self._go_to_today()
     
-    def _load_tasks(self):
-        """Carga todas las tareas con fechas programadas."""
-        tasks = self.controller.get_tasks_with_due_dates()
-        
-        self.tasks_by_date = {}
-        
-        for task in tasks:
-            due_date = task.get('due_date')
-            if due_date:
-                # Extraer solo la fecha (sin hora) del ISO string
-                try:
-                    if 'T' in due_date:
-                        date_str = due_date.split('T')[0]
-                    else:
-                        date_str = due_date
-                    
-                    if date_str not in self.tasks_by_date:
-                        self.tasks_by_date[date_str] = []
-                    
-                    self.tasks_by_date[date_str].append(task)
-                except Exception as e:
-                    print(f"Error al procesar fecha {due_date}: {e}")
+    def _visible_months(self) -> list:
+        """Retorna el mes mostrado y sus vecinos de precarga como tuplas (año, mes)."""
+        shown = (self.calendar.yearShown(), self.calendar.monthShown())
+        return [shift_month(shown, offset)
+                for offset in range(-self.PREFETCH_MONTHS, self.PREFETCH_MONTHS + 1)]
     
     def _update_calendar(self):
-        """Actualiza el calendario para resaltar los días con tareas."""
-        # Formato para días con tareas
-        format_with_tasks = QTextCharFormat()
-        format_with_tasks.setBackground(QBrush(QColor(156, 39, 176, 100)))  # Morado claro
-        format_with_tasks.setForeground(QBrush(QColor(255, 255, 255)))
-        
-        # Aplicar formato a los días con tareas
-        for date_str in self.tasks_by_date.keys():
-            try:
-                year, month, day = map(int, date_str.split('-'))
-                qdate = QDate(year, month, day)
-                if qdate.isValid():
-                    self.calendar.setDateTextFormat(qdate, format_with_tasks)
-            except Exception as e:
-                print(f"Error al formatear fecha {date_str}: {e}")
+        """
+        Resalta los días con tareas de los meses visibles.
+        
+        Solo se cambian los formatos que difieren de los ya aplicados; los días
+        que salen de la ventana pierden el resaltado, así el calendario no
+        acumula formatos de meses que ya no se muestran.
+        """
+        months = self._visible_months()
+        self.months.ensure_months(months)
+        dates = self.months.days_with_tasks(months)
+        
+        for date_str in self.highlighted_dates - dates:
+            self._set_date_format(date_str, False)
+        for date_str in dates - self.highlighted_dates:
+            self._set_date_format(date_str, True)
+    
+    def _update_date_format(self, date_str: str):
+        """
+        Resalta un día si está en la ventana visible y tiene tareas, o le quita
+        el resaltado en caso contrario.
+        
+        Args:
+            date_str: Fecha en formato ISO (YYYY-MM-DD)
+        """
+        highlight = month_of(date_str) in self._visible_months() and self.months.has_tasks(date_str)
+        if highlight != (date_str in self.highlighted_dates):
+            self._set_date_format(date_str, highlight)
+    
+    def _set_date_format(self, date_str: str, highlight: bool):
+        """
+        Aplica o quita el formato de día con tareas.
+        
+        Args:
+            date_str: Fecha en formato ISO (YYYY-MM-DD)
+            highlight: True para resaltar el día
+        """
+        qdate = QDate.fromString(date_str, Qt.ISODate)
+        if not qdate.isValid():
+            print(f"Error al formatear fecha {date_str}")
+            return
+        
+        if highlight:
+            self.calendar.setDateTextFormat(qdate, self._task_format)
+            self.highlighted_dates.add(date_str)
+        else:
+            self.calendar.setDateTextFormat(qdate, self._plain_format)
+            self.highlighted_dates.discard(date_str)
+    
+    def _selected_date_str(self) -> str:
+        """Retorna la fecha seleccionada en formato ISO (YYYY-MM-DD)."""
+        selected_date = self.calendar.selectedDate()
+        return f"{selected_date.year()}-{selected_date.month():02d}-{selected_date.day():02d}"
     
     def _on_date_selected(self):
         """Gestiona la selección de una fecha en el calendario."""
         selected_date = self.calendar.selectedDate()
-        date_str = f"{selected_date.year()}-{selected_date.month():02d}-{selected_date.day():02d}"
+        date_str = self._selected_date_str()
         
         # Actualizar etiqueta de fecha
         date_formatted = selected_date.toString("dddd, dd 'de' MMMM 'de' yyyy")
@@ -152,38 +205,38 @@ class CalendarView(QWidget):
         self._show_tasks_for_date(date_str)
     
     def _show_tasks_for_date(self, date_str: str):
-        """Muestra las tareas para una fecha específica."""
-        # Limpiar tareas actuales
-        self.task_cards.clear()
-        while self.tasks_layout.count() > 1:  # Mantener el stretch
-            item = self.tasks_layout.takeAt(0)
-            if item.widget():
-                widget = item.widget()
-                widget.setParent(None)
-                widget.deleteLater()
+        """
+        Muestra las tareas para una fecha específica.
         
+        Las tarjetas se toman de un pool y se actualizan con update_data; si
+        las tareas son las mismas que ya se muestran no se toca nada.
+        """
         # Obtener tareas para esta fecha
-        tasks = self.tasks_by_date.get(date_str, [])
+        tasks = self.months.get_by_due_date(date_str)
+        if tasks == self._shown_tasks:
+            return
+        self._shown_tasks = tasks
         
-        if not tasks:
-            no_tasks_label = QLabel("No hay tareas programadas para este día.")
-            no_tasks_label.setAlignment(Qt.AlignCenter)
-            no_tasks_label.setObjectName("calendarNoTasksLabel")
-            self.tasks_layout.insertWidget(0, no_tasks_label)
-        else:
-            # Mostrar cada tarea como una tarjeta
-            for task in tasks:
-                task_id = task.get('id')
-                card = TaskCard(task, self.tasks_container)
-                
-                # Conectar señales si existen los handlers
-                if hasattr(self, 'edit_handler'):
-                    card.edit_requested.connect(self.edit_handler)
-                if hasattr(self, 'delete_handler'):
-                    card.delete_requested.connect(self.delete_handler)
-                
-                self.task_cards[task_id] = card
-                self.tasks_layout.insertWidget(self.tasks_layout.count() - 1, card)
+        self.no_tasks_label.setVisible(not tasks)
+        
+        # Crear solo las tarjetas que falten en el pool
+        while len(self._card_pool) < len(tasks):
+            card = TaskCard(tasks[len(self._card_pool)], self.tasks_container)
+            card.edit_requested.connect(self.edit_task_requested.emit)
+            card.delete_requested.connect(self.delete_task_requested.emit)
+            self._card_pool.append(card)
+            self.tasks_layout.insertWidget(self.tasks_layout.count() - 1, card)
+        
+        self.task_cards = {}
+        for card, task in zip(self._card_pool, tasks):
+            if card.task_data != task:
+                card.update_data(task)
+            card.show()
+            self.task_cards[task.get('id')] = card
+        
+        # Ocultar las tarjetas sobrantes
+        for card in self._card_pool[len(tasks):]:
+            card.hide()
     
     def _go_to_today(self):
         """Selecciona la fecha de hoy en el calendario."""
@@ -199,22 +252,31 @@ class CalendarView(QWidget):
             edit_task_handler: Función para manejar editar tarea
             delete_task_handler: Función para manejar eliminar tarea
         """
-        self.edit_handler = edit_task_handler
-        self.delete_handler = delete_task_handler
+        self.edit_task_requested.connect(edit_task_handler)
+        self.delete_task_requested.connect(delete_task_handler)
     
     def refresh_tasks(self):
-        """Recarga las tareas y actualiza el calendario."""
-        self.task_cards.clear()
-        self._load_tasks()
+        """Vuelve a pintar el calendario y el día seleccionado desde la caché de meses."""
         self._update_calendar()
         # Actualizar la vista del día seleccionado
-        selected_date = self.calendar.selectedDate()
-        date_str = f"{selected_date.year()}-{selected_date.month():02d}-{selected_date.day():02d}"
-        self._show_tasks_for_date(date_str)
+        self._show_tasks_for_date(self._selected_date_str())
+    
+    # ==================== CAMBIOS DE LA CACHÉ ====================
+    
+    def _on_dates_changed(self, dates: set):
+        """
+        Actualiza solo los días afectados por un cambio.
+        
+        Args:
+            dates: Conjunto de fechas ISO afectadas
+        """
+        for date_str in dates:
+            self._update_date_format(date_str)
+        
+        if self._selected_date_str() in dates:
+            self.mark_dirty()
     
-    def showEvent(self, event):
-        """Evento que se ejecuta cuando la vista se muestra."""
-        super().showEvent(event)
-        # Actualizar tareas cada vez que se muestra la vista
-        self.refresh_tasks()
+    def _refresh(self):
+        """Vuelve a mostrar las tareas del día seleccionado."""
+        self._show_tasks_for_date(self._selected_date_str())
 
@@ -5,9 +5,13 @@ Widget que representa una columna del tablero Kanban.
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QScrollArea, 
                              QLabel, QPushButton)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QDragMoveEvent
 from ui.task_card import TaskCard
+from ui.task_list_model import TaskListModel
+from ui.task_list_view import TaskListView, TaskCardDelegate
+from ui.task_mime import decode_task_mime, has_task_mime
+from app.positions import keys_between
 
 
 class KanbanColumn(QWidget):
@@ -16,8 +20,11 @@ class KanbanColumn(QWidget):
     # Señal cuando se necesita agregar una nueva tarea en esta columna
     add_task_requested = pyqtSignal(str)  # status
     
-    # Señal cuando se mueve una tarea a esta columna
-    task_moved = pyqtSignal(int, str)  # task_id, new_status
+    # Señal cuando se sueltan una o varias tareas en esta columna (también al
+    # reordenar dentro de ella): IDs de las tareas en orden, estado de origen
+    # (None si el drag no lo indica), new_status, ID de la tarjeta que queda
+    # justo arriba (None si quedan primeras)
+    tasks_moved = pyqtSignal(list, object, str, object)
     
     # Señal cuando se solicita editar una tarea
     edit_task_requested = pyqtSignal(int)  # task_id
@@ -25,7 +32,19 @@ class KanbanColumn(QWidget):
     # Señal cuando se solicita eliminar una tarea
     delete_task_requested = pyqtSignal(int)  # task_id
     
-    def __init__(self, title: str, status: str, parent=None):
+    # Señal cuando el scroll se acerca al final y quedan tareas por cargar
+    load_more_requested = pyqtSignal(str)  # status
+    
+    # Distancia al final (en píxeles) a partir de la cual se pide la página siguiente
+    LOAD_MORE_THRESHOLD = 300
+    
+    # Autoscroll durante un drag: franja sensible junto a los bordes (píxeles),
+    # desplazamiento máximo por paso e intervalo entre pasos (ms)
+    AUTOSCROLL_MARGIN = 40
+    AUTOSCROLL_MAX_STEP = 24
+    AUTOSCROLL_INTERVAL = 30
+    
+    def __init__(self, title: str, status: str, parent=None, virtualized: bool = False):
         """
         Inicializa la columna Kanban.
         
@@ -33,10 +52,24 @@ class KanbanColumn(QWidget):
             title: Título de la columna
             status: Estado asociado a esta columna ("todo", "doing", "done")
             parent: Widget padre
+            virtualized: Si es True, las tareas se muestran en un QListView con un
+                         delegado que pinta las tarjetas en lugar de un TaskCard por tarea
         """
         super().__init__(parent)
         self.status = status
-        self.task_cards = {}  # Diccionario {task_id: TaskCard}
+        self.virtualized = virtualized
+        self.task_cards = {}  # Diccionario {task_id: TaskCard} (solo en modo widgets)
+        
+        # Estado de la carga incremental
+        self.has_more = False
+        self._page_cursor = None  # (position, id) de la última tarea paginada
+        self._loading_more = False
+        
+        # Autoscroll mientras se arrastra cerca del borde superior o inferior
+        self._autoscroll_step = 0
+        self._autoscroll_timer = QTimer(self)
+        self._autoscroll_timer.setInterval(self.AUTOSCROLL_INTERVAL)
+        self._autoscroll_timer.timeout.connect(self._autoscroll)
         
         self._setup_ui(title)
         self._apply_styles()
@@ -63,12 +96,19 @@ class KanbanColumn(QWidget):
         add_button.clicked.connect(lambda: self.add_task_requested.emit(self.status))
         main_layout.addWidget(add_button)
         
+        if self.virtualized:
+            self._setup_task_list(main_layout)
+            self._connect_scroll_bar(self.task_view.verticalScrollBar())
+            self.scroll_viewport = self.task_view.viewport()
+            return
+        
         # Área scrollable para las tarjetas
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setFrameShape(QScrollArea.NoFrame)
+        self._connect_scroll_bar(scroll_area.verticalScrollBar())
         
         # Widget contenedor para las tarjetas
         self.cards_container = QWidget()
@@ -79,6 +119,38 @@ class KanbanColumn(QWidget):
         
         scroll_area.setWidget(self.cards_container)
         main_layout.addWidget(scroll_area)
+        self.scroll_viewport = scroll_area.viewport()
+    
+    def _setup_task_list(self, main_layout: QVBoxLayout):
+        """Configura la lista virtualizada (modelo + delegado) para las tarjetas."""
+        self.task_model = TaskListModel(self)
+        
+        self.task_delegate = TaskCardDelegate(self)
+        self.task_delegate.edit_requested.connect(self.edit_task_requested.emit)
+        self.task_delegate.delete_requested.connect(self.delete_task_requested.emit)
+        
+        self.task_view = TaskListView(self)
+        self.task_view.setModel(self.task_model)
+        self.task_view.setItemDelegate(self.task_delegate)
+        main_layout.addWidget(self.task_view)
+    
+    def _connect_scroll_bar(self, scroll_bar):
+        """Vigila la barra de scroll para pedir más tareas al acercarse al final."""
+        self.scroll_bar = scroll_bar
+        scroll_bar.valueChanged.connect(self._check_load_more)
+        scroll_bar.rangeChanged.connect(self._check_load_more)
+    
+    def _check_load_more(self, *args):
+        """Emite load_more_requested si el scroll está cerca del final."""
+        if not self.has_more or self._loading_more:
+            return
+        
+        if self.scroll_bar.maximum() - self.scroll_bar.value() <= self.LOAD_MORE_THRESHOLD:
+            self._loading_more = True
+            try:
+                self.load_more_requested.emit(self.status)
+            finally:
+                self._loading_more = False
     
     def _apply_styles(self):
         """Aplica estilos a la columna basados en su estado."""
@@ -89,31 +161,105 @@ class KanbanColumn(QWidget):
     
     def add_task_card(self, task_data: dict):
         """
-        Agrega una tarjeta de tarea a la columna.
+        Agrega una tarjeta de tarea en el lugar que indica su posición.
+        
+        Si la tarjeta ya existe se actualiza (y se reubica si cambió su posición).
         
         Args:
             task_data: Diccionario con los datos de la tarea
         """
+        if self.virtualized:
+            self.task_model.add_task(task_data)
+            return
+        
         task_id = task_data.get('id')
+        sort_key = TaskListModel.sort_key(task_data)
         
         # Si la tarjeta ya existe, actualizarla en lugar de crear una nueva
         if task_id in self.task_cards:
-            self.task_cards[task_id].update_data(task_data)
-            return
+            card = self.task_cards[task_id]
+            moved = TaskListModel.sort_key(card.task_data) != sort_key
+            card.update_data(task_data)
+            if not moved:
+                return
+            self.cards_layout.removeWidget(card)
+        else:
+            card = self._create_card(task_data)
         
-        # Crear nueva tarjeta
+        # Primera tarjeta que ordena después (el stretch queda siempre al final)
+        index = 0
+        while (index < self.cards_layout.count() - 1 and
+               TaskListModel.sort_key(self.cards_layout.itemAt(index).widget().task_data) < sort_key):
+            index += 1
+        self.cards_layout.insertWidget(index, card)
+    
+    def _create_card(self, task_data: dict) -> TaskCard:
+        """Crea una tarjeta, conecta sus señales y la registra (no la agrega al layout)."""
         card = TaskCard(task_data, self.cards_container)
         
         # Conectar señales
         card.edit_requested.connect(self.edit_task_requested.emit)
         card.delete_requested.connect(self.delete_task_requested.emit)
         
-        # Agregar al layout (antes del stretch)
-        layout_count = self.cards_layout.count()
-        self.cards_layout.insertWidget(layout_count - 1, card)
-        
         # Guardar referencia
-        self.task_cards[task_id] = card
+        self.task_cards[task_data.get('id')] = card
+        return card
+    
+    def add_task_page(self, tasks: list, has_more: bool):
+        """
+        Agrega al final una página de tareas cargada por cursor (o los
+        resultados de una búsqueda), en el orden recibido.
+        
+        Args:
+            tasks: Lista de diccionarios con las tareas, en el orden de la página
+            has_more: True si pueden quedar más tareas por cargar
+        """
+        if self.virtualized:
+            self.task_model.append_tasks(tasks)
+        else:
+            for task_data in tasks:
+                task_id = task_data.get('id')
+                if task_id in self.task_cards:
+                    self.task_cards[task_id].update_data(task_data)
+                    continue
+                # Agregar al layout (antes del stretch)
+                card = self._create_card(task_data)
+                self.cards_layout.insertWidget(self.cards_layout.count() - 1, card)
+        
+        if tasks:
+            last = tasks[-1]
+            self._page_cursor = (last.get('position'), last.get('id'))
+        self.has_more = has_more
+    
+    def covers(self, task_data: dict) -> bool:
+        """
+        Indica si una tarea cae en el tramo ya cargado de la columna.
+        
+        Mientras queden páginas, las tareas que ordenan después del cursor
+        las trae la paginación; agregarlas antes rompería el orden y las
+        duplicaría al cargar su página.
+        
+        Args:
+            task_data: Diccionario con los datos de la tarea
+            
+        Returns:
+            True si la tarjeta se puede mostrar ya (o si ya se muestra)
+        """
+        if not self.has_more or self.has_task(task_data.get('id')):
+            return True
+        if self._page_cursor is None:
+            return False
+        position, task_id = self._page_cursor
+        return TaskListModel.sort_key(task_data) <= (position or '', task_id or 0)
+    
+    def page_cursor(self):
+        """
+        Retorna el cursor para pedir la página siguiente.
+        
+        Returns:
+            Tupla (position, id) de la última tarea paginada o None
+        """
+        return self._page_cursor
     
     def remove_task_card(self, task_id: int):
         """
@@ -122,6 +268,10 @@ class KanbanColumn(QWidget):
         Args:
             task_id: ID de la tarea a eliminar
         """
+        if self.virtualized:
+            self.task_model.remove_task(task_id)
+            return
+        
         if task_id in self.task_cards:
             card = self.task_cards[task_id]
             self.cards_layout.removeWidget(card)
@@ -131,6 +281,13 @@ class KanbanColumn(QWidget):
     
     def clear_cards(self):
         """Elimina todas las tarjetas de la columna."""
+        self.has_more = False
+        self._page_cursor = None
+        
+        if self.virtualized:
+            self.task_model.clear()
+            return
+        
         for task_id in list(self.task_cards.keys()):
             self.remove_task_card(task_id)
     
@@ -142,40 +299,211 @@ class KanbanColumn(QWidget):
             task_id: ID de la tarea
             
         Returns:
-            TaskCard o None si no existe
+            TaskCard o None si no existe (siempre None en modo virtualizado)
         """
         return self.task_cards.get(task_id)
     
+    def get_task_data(self, task_id: int):
+        """
+        Obtiene los datos mostrados de una tarea, en cualquiera de los dos modos.
+        
+        Args:
+            task_id: ID de la tarea
+            
+        Returns:
+            Diccionario con los datos de la tarea o None si no está en la columna
+        """
+        if self.virtualized:
+            return self.task_model.get_task(task_id)
+        card = self.task_cards.get(task_id)
+        return card.task_data if card else None
+    
+    def task_ids(self) -> list:
+        """Retorna los IDs de las tareas en el orden en que se muestran."""
+        if self.virtualized:
+            return self.task_model.task_ids()
+        return [self.cards_layout.itemAt(i).widget().task_id
+                for i in range(self.cards_layout.count() - 1)]
+    
+    def previous_task_id(self, task_id: int):
+        """
+        Obtiene la tarjeta que se muestra justo arriba de una tarea.
+        
+        Args:
+            task_id: ID de la tarea
+            
+        Returns:
+            ID de la tarjeta anterior o None si la tarea es la primera (o no está)
+        """
+        task_ids = self.task_ids()
+        if task_id not in task_ids:
+            return None
+        row = task_ids.index(task_id)
+        return task_ids[row - 1] if row > 0 else None
+    
+    def positions_after(self, previous_id, count: int = 1, exclude_ids=()) -> list:
+        """
+        Calcula posiciones consecutivas entre una tarjeta y la que se muestra a continuación.
+        
+        Args:
+            previous_id: ID de la tarjeta anterior (None para ubicar al principio)
+            count: Cantidad de posiciones (una por tarjeta que se suelta)
+            exclude_ids: IDs de tareas a ignorar (las que se están moviendo)
+            
+        Returns:
+            Lista de claves de posición en orden creciente (ver app.positions)
+        """
+        exclude_ids = set(exclude_ids)
+        task_ids = [task_id for task_id in self.task_ids() if task_id not in exclude_ids]
+        row = task_ids.index(previous_id) + 1 if previous_id in task_ids else 0
+        
+        before = self.get_task_data(task_ids[row - 1]).get('position') if row > 0 else None
+        after = self.get_task_data(task_ids[row]).get('position') if row < len(task_ids) else None
+        if before is not None and after is not None and before >= after:
+            after = None  # Claves repetidas: basta con ordenar después de la anterior
+        return keys_between(before, after, count)
+    
+    def is_run_after(self, previous_id, task_ids: list) -> bool:
+        """
+        Indica si unas tareas ya se muestran seguidas, en ese orden, después de una tarjeta.
+        
+        Args:
+            previous_id: ID de la tarjeta anterior (None para el principio de la columna)
+            task_ids: IDs de las tareas
+            
+        Returns:
+            True si soltarlas ahí no cambiaría el orden de la columna
+        """
+        shown = self.task_ids()
+        if previous_id is not None and previous_id not in shown:
+            return False
+        start = shown.index(previous_id) + 1 if previous_id is not None else 0
+        return shown[start:start + len(task_ids)] == list(task_ids)
+    
+    def has_task(self, task_id: int) -> bool:
+        """
+        Indica si la tarea está en esta columna, en cualquiera de los dos modos.
+        
+        Args:
+            task_id: ID de la tarea
+            
+        Returns:
+            True si la columna contiene la tarea
+        """
+        if self.virtualized:
+            return self.task_model.has_task(task_id)
+        return task_id in self.task_cards
+    
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Gestiona el evento de entrada de un drag."""
-        if event.mimeData().hasFormat("application/x-task") or event.mimeData().hasText():
+        if has_task_mime(event.mimeData()):
             event.acceptProposedAction()
         else:
             event.ignore()
     
     def dragMoveEvent(self, event):
-        """Gestiona el movimiento durante el drag."""
-        if event.mimeData().hasFormat("application/x-task") or event.mimeData().hasText():
+        """Gestiona el movimiento durante el drag (y el autoscroll cerca de los bordes)."""
+        if has_task_mime(event.mimeData()):
             event.acceptProposedAction()
+            self._update_autoscroll(event.pos())
         else:
             event.ignore()
     
-    def dropEvent(self, event: QDropEvent):
-        """Gestiona el evento de soltar una tarjeta en la columna."""
-        task_id = None
+    def dragLeaveEvent(self, event):
+        """Detiene el autoscroll al salir el drag de la columna."""
+        self._stop_autoscroll()
+        super().dragLeaveEvent(event)
+    
+    def _update_autoscroll(self, pos):
+        """
+        Activa o detiene el autoscroll según la distancia del cursor a los bordes.
         
-        if event.mimeData().hasFormat("application/x-task"):
-            task_id = int(event.mimeData().data("application/x-task").data().decode())
-        elif event.mimeData().hasText():
-            try:
-                task_id = int(event.mimeData().text())
-            except ValueError:
-                event.ignore()
-                return
+        El desplazamiento por paso crece a medida que el cursor se acerca al borde.
+        
+        Args:
+            pos: Punto del drag en coordenadas de la columna
+        """
+        y = self.scroll_viewport.mapFrom(self, pos).y()
+        height = self.scroll_viewport.height()
+        margin = self.AUTOSCROLL_MARGIN
+        
+        if y < margin:
+            step = -self.AUTOSCROLL_MAX_STEP * (margin - max(y, 0)) // margin
+        elif y > height - margin:
+            step = self.AUTOSCROLL_MAX_STEP * (y - (height - margin)) // margin
+        else:
+            step = 0
+        
+        self._autoscroll_step = max(-self.AUTOSCROLL_MAX_STEP, min(self.AUTOSCROLL_MAX_STEP, step))
+        if self._autoscroll_step and not self._autoscroll_timer.isActive():
+            self._autoscroll_timer.start()
+        elif not self._autoscroll_step:
+            self._autoscroll_timer.stop()
+    
+    def _autoscroll(self):
+        """Desplaza la columna un paso; se detiene al llegar a un extremo."""
+        value = self.scroll_bar.value()
+        self.scroll_bar.setValue(value + self._autoscroll_step)
+        if self.scroll_bar.value() == value:
+            self._stop_autoscroll()
+    
+    def _stop_autoscroll(self):
+        """Detiene el autoscroll."""
+        self._autoscroll_step = 0
+        self._autoscroll_timer.stop()
+    
+    def _drop_row(self, pos) -> int:
+        """
+        Calcula la fila de inserción para un punto de la columna.
+        
+        Args:
+            pos: Punto en coordenadas de la columna
+            
+        Returns:
+            Cantidad de tarjetas que quedan arriba del punto
+        """
+        if self.virtualized:
+            view_pos = self.task_view.viewport().mapFrom(self, pos)
+            if view_pos.y() < 0:
+                return 0
+            index = self.task_view.indexAt(view_pos)
+            if not index.isValid():
+                return self.task_model.rowCount()
+            # En la mitad inferior de una tarjeta, se inserta debajo de ella
+            rect = self.task_view.visualRect(index)
+            return index.row() + (1 if view_pos.y() > rect.center().y() else 0)
+        
+        y = self.cards_container.mapFrom(self, pos).y()
+        row = 0
+        for i in range(self.cards_layout.count() - 1):
+            if self.cards_layout.itemAt(i).widget().geometry().center().y() < y:
+                row = i + 1
+        return row
+    
+    def _drop_previous_id(self, pos, task_ids: list):
+        """
+        Obtiene la tarjeta que queda justo arriba al soltar tareas en un punto.
+        
+        Args:
+            pos: Punto en coordenadas de la columna
+            task_ids: IDs de las tareas que se sueltan (no cuentan como vecinas)
+            
+        Returns:
+            ID de la tarjeta anterior o None si las tareas quedan primeras
+        """
+        dragged = set(task_ids)
+        above = [other_id for other_id in self.task_ids()[:self._drop_row(pos)] if other_id not in dragged]
+        return above[-1] if above else None
+    
+    def dropEvent(self, event: QDropEvent):
+        """Gestiona el evento de soltar una o varias tarjetas en la columna."""
+        self._stop_autoscroll()
+        source_status, task_ids = decode_task_mime(event.mimeData())
         
-        if task_id:
-            # Emitir señal para mover la tarea
-            self.task_moved.emit(task_id, self.status)
+        if task_ids:
+            # Emitir señal para mover las tareas al punto donde se soltaron
+            self.tasks_moved.emit(task_ids, source_status, self.status,
+                                  self._drop_previous_id(event.pos(), task_ids))
             event.acceptProposedAction()
         else:
             event.ignore()
@@ -3,35 +3,75 @@ Vista del Tablero Kanban.
 Envuelve el tablero Kanban existente para usarlo dentro del QStackedWidget.
 """
 
-from PyQt5.QtWidgets import QWidget, QHBoxLayout
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLineEdit
 from ui.kanban_column import KanbanColumn
 from app.controller import TaskController
+from app.models import TaskModel
+from app.events import TaskCreated, TaskDeleted, TaskMoved, TaskUpdated
+from app.query_scheduler import QueryScheduler
 
 
 class KanbanView(QWidget):
     """Vista que contiene el tablero Kanban con las tres columnas."""
     
-    def __init__(self, controller: TaskController, parent=None):
+    # Tareas por página al cargar cada columna de forma incremental
+    PAGE_SIZE = TaskModel.PAGE_SIZE
+    
+    # Espera (ms) desde la última tecla antes de ejecutar la búsqueda
+    SEARCH_DELAY = 250
+    
+    def __init__(self, controller: TaskController, parent=None, virtualized: bool = True):
         """
         Inicializa la vista del tablero Kanban.
         
         Args:
             controller: Controlador de tareas
             parent: Widget padre
+            virtualized: Si es True, las columnas pintan las tarjetas con un delegado
+                         (solo las filas visibles tienen costo)
         """
         super().__init__(parent)
         self.controller = controller
+        self.virtualized = virtualized
         self.columns = {}  # Diccionario {status: KanbanColumn}
+        self._search_text = ""  # Búsqueda aplicada a las columnas ("" = sin filtro)
+        
+        # Las búsquedas se ejecutan fuera del hilo de la interfaz: agrupa las
+        # teclas seguidas y descarta las consultas que quedaron viejas
+        self.search_scheduler = QueryScheduler(self.controller.database, delay=self.SEARCH_DELAY, parent=self)
+        self.search_scheduler.results_ready.connect(self._on_search_results)
+        # Las búsquedas leen con la conexión del programador (la que se cancela)
+        self._search_model = self.search_scheduler.bind_model(self.controller.model)
         
         self._setup_ui()
         self._load_tasks()
+        
+        # Los cambios confirmados llegan como eventos del controlador
+        bus = self.controller.bus
+        bus.subscribe(TaskCreated, lambda event: self._apply_persisted_task(event.task))
+        bus.subscribe(TaskUpdated, lambda event: self._apply_persisted_task(event.task))
+        bus.subscribe(TaskMoved, self._on_task_moved_event)
+        bus.subscribe(TaskDeleted, lambda event: self._on_task_deleted_event(event.task_id))
     
     def _setup_ui(self):
         """Configura la interfaz del tablero Kanban."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+        
+        # Caja de búsqueda: filtra las tres columnas mientras se escribe
+        self.search_edit = QLineEdit()
+        self.search_edit.setObjectName("searchBox")
+        self.search_edit.setPlaceholderText("🔍 Buscar tareas...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(lambda text: self._request_search())
+        self.search_edit.returnPressed.connect(lambda: self._request_search(immediate=True))
+        layout.addWidget(self.search_edit)
+        
         # Layout horizontal para las columnas
-        main_layout = QHBoxLayout(self)
-        main_layout.setContentsMargins(10, 10, 10, 10)
+        main_layout = QHBoxLayout()
         main_layout.setSpacing(10)
+        layout.addLayout(main_layout)
         
         # Crear las tres columnas Kanban
         columns_config = [
@@ -41,38 +81,172 @@ class KanbanView(QWidget):
         ]
         
         for title, status in columns_config:
-            column = KanbanColumn(title, status, self)
+            column = KanbanColumn(title, status, self, virtualized=self.virtualized)
+            column.load_more_requested.connect(self._load_next_page)
             self.columns[status] = column
             main_layout.addWidget(column)
     
     def _load_tasks(self):
-        """Carga todas las tareas desde la base de datos y las distribuye en las columnas."""
-        tasks = self.controller.get_all_tasks()
+        """Carga la primera página de tareas de cada columna."""
+        for status, column in self.columns.items():
+            tasks = self.controller.get_tasks_page(status, limit=self.PAGE_SIZE)
+            column.add_task_page(tasks, len(tasks) == self.PAGE_SIZE)
+    
+    def _load_next_page(self, status: str):
+        """
+        Carga la página siguiente de una columna cuando su scroll llega al final.
+        
+        Args:
+            status: Estado de la columna que pide más tareas
+        """
+        column = self.columns.get(status)
+        if not column or not column.page_cursor():
+            return
         
+        after_position, after_id = column.page_cursor()
+        tasks = self.controller.get_tasks_page(status, after_position, after_id, self.PAGE_SIZE)
+        column.add_task_page(tasks, len(tasks) == self.PAGE_SIZE)
+    
+    # ==================== BÚSQUEDA ====================
+    
+    def _request_search(self, immediate: bool = False):
+        """
+        Pide la búsqueda del texto de la caja (o quita el filtro si está vacía).
+        
+        Args:
+            immediate: Si es True, busca sin esperar a que se deje de escribir
+        """
+        text = self.search_edit.text().strip()
+        if not text:
+            self.search_scheduler.cancel()
+            if self._search_text:
+                # Sin filtro: volver a la carga paginada
+                self._search_text = ""
+                self.refresh_tasks()
+            return
+        
+        run = self.search_scheduler.run_now if immediate else self.search_scheduler.schedule
+        run(self._search_tasks, text)
+    
+    def _search_tasks(self, text: str):
+        """
+        Busca las tareas (se ejecuta en el hilo del QueryScheduler).
+        
+        Args:
+            text: Texto de búsqueda
+            
+        Returns:
+            Tupla (texto, tareas ordenadas por relevancia)
+        """
+        return text, self._search_model.search(text)
+    
+    def _on_search_results(self, result: tuple, latency_ms: float):
+        """
+        Muestra en cada columna las tareas encontradas, ordenadas por relevancia.
+        
+        Args:
+            result: Tupla (texto buscado, tareas)
+            latency_ms: Tiempo desde la última tecla hasta los resultados
+        """
+        self._search_text, tasks = result
+        
+        # Una sola consulta para las tres columnas; se reparte por estado
+        results = {status: [] for status in self.columns}
         for task in tasks:
-            status = task.get('status', 'todo')
-            if status in self.columns:
-                self.columns[status].add_task_card(task)
+            if task.get('status') in results:
+                results[task['status']].append(task)
+        
+        for status, column in self.columns.items():
+            column.clear_cards()
+            column.add_task_page(results[status], False)
+    
+    def is_searching(self) -> bool:
+        """Indica si las columnas muestran resultados de búsqueda."""
+        return bool(self._search_text)
+    
+    def find_task_status(self, task_id: int):
+        """
+        Busca en qué columna está una tarea.
+        
+        Args:
+            task_id: ID de la tarea
+            
+        Returns:
+            Estado de la columna que contiene la tarea o None
+        """
+        for status, column in self.columns.items():
+            if column.has_task(task_id):
+                return status
+        return None
     
-    def connect_signals(self, add_task_handler, task_moved_handler, 
+    # ==================== EVENTOS ====================
+    # El tablero se actualiza de forma optimista desde MainWindow; los eventos
+    # traen la fila persistida. Si la tarjeta está en otra columna, el tablero
+    # muestra un cambio más reciente cuya escritura aún no terminó, y se deja
+    # como está: esa escritura lo confirmará o lo deshará. Las tareas que
+    # todavía no se cargaron y ordenan después del cursor de la columna
+    # quedan para la paginación.
+    
+    def _apply_persisted_task(self, task: dict):
+        """
+        Refleja una tarea creada o modificada.
+        
+        Args:
+            task: Diccionario con la tarea persistida
+        """
+        if self.is_searching():
+            # El cambio puede hacer que la tarea entre o salga de los resultados
+            self._request_search()
+            return
+        
+        status = task.get('status')
+        current_status = self.find_task_status(task.get('id'))
+        
+        if (status in self.columns and current_status in (None, status) and
+                self.columns[status].covers(task)):
+            self.columns[status].add_task_card(task)
+    
+    def _on_task_moved_event(self, event: TaskMoved):
+        """Refleja un cambio de estado (con o sin la fila persistida)."""
+        if event.task is not None:
+            self._apply_persisted_task(event.task)
+            return
+        
+        current_status = self.find_task_status(event.task_id)
+        if current_status and current_status != event.status and event.status in self.columns:
+            task = self.columns[current_status].get_task_data(event.task_id)
+            self.columns[current_status].remove_task_card(event.task_id)
+            self.columns[event.status].add_task_card({**task, 'status': event.status})
+    
+    def _on_task_deleted_event(self, task_id: int):
+        """Quita la tarjeta de una tarea eliminada, si sigue en el tablero."""
+        status = self.find_task_status(task_id)
+        if status:
+            self.columns[status].remove_task_card(task_id)
+    
+    def connect_signals(self, add_task_handler, tasks_moved_handler, 
                        edit_task_handler, delete_task_handler):
         """
         Conecta las señales de las columnas con los manejadores de la ventana principal.
         
         Args:
             add_task_handler: Función para manejar agregar tarea
-            task_moved_handler: Función para manejar movimiento de tarea
+            tasks_moved_handler: Función para manejar el movimiento de una o varias tareas
             edit_task_handler: Función para manejar editar tarea
             delete_task_handler: Función para manejar eliminar tarea
         """
         for column in self.columns.values():
             column.add_task_requested.connect(add_task_handler)
-            column.task_moved.connect(task_moved_handler)
+            column.tasks_moved.connect(tasks_moved_handler)
             column.edit_task_requested.connect(edit_task_handler)
             column.delete_task_requested.connect(delete_task_handler)
     
     def refresh_tasks(self):
         """Recarga las tareas desde la base de datos."""
+        if self.is_searching():
+            self._request_search(immediate=True)
+            return
+        
         # Limpiar todas las columnas
         for column in self.columns.values():
             column.clear_cards()
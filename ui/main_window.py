@@ -9,12 +9,13 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QHBoxLayout,
                              QStackedWidget, QDateEdit, QCheckBox)
 from PyQt5.QtCore import Qt, QDate
 from datetime import datetime
+import time
 from ui.sidebar import Sidebar
 from ui.kanban_view import KanbanView
-from ui.notepad_view import NotepadView
-from ui.stats_view import StatsView
-from ui.calendar_view import CalendarView
 from app.controller import TaskController
+from app.note_controller import NoteController
+from app.database import Database, db
+from app.database_writer import DatabaseWriter
 
 
 class TaskDialog(QDialog):
@@ -154,10 +155,29 @@ class TaskDialog(QDialog):
 class MainWindow(QMainWindow):
     """Ventana principal de la aplicación con sidebar y múltiples vistas."""
     
-    def __init__(self):
-        """Inicializa la ventana principal."""
+    def __init__(self, profile_views: bool = False, database: Database = None):
+        """
+        Inicializa la ventana principal.
+        
+        Args:
+            profile_views: Si es True, imprime las consultas y refrescos de cada cambio de vista
+            database: Base de datos de la ventana (None para la instancia por defecto)
+            
+        Raises:
+            sqlite3.ProgrammingError: Si la base de datos es ':memory:'; las
+                                      escrituras, búsquedas y métricas usan
+                                      conexiones de otros hilos
+        """
         super().__init__()
-        self.controller = TaskController()
+        self.profile_views = profile_views
+        self.database = database if database is not None else db
+        self.database.require_file("La ventana principal")
+        self.controller = TaskController(database=database)
+        # Tareas y notas comparten el bus de la ventana
+        self.note_controller = NoteController(bus=self.controller.bus, database=database)
+        
+        # Hilo dedicado a las escrituras: la interfaz nunca espera a SQLite
+        self.writer = DatabaseWriter(database, parent=self)
         
         self.setWindowTitle("Organizador de Tareas - Kanban")
         self.setGeometry(100, 100, 1400, 800)
@@ -192,60 +212,137 @@ class MainWindow(QMainWindow):
         self.stacked_widget.setCurrentWidget(self.kanban_view)
     
     def _create_views(self):
-        """Crea todas las vistas y las agrega al QStackedWidget."""
+        """
+        Crea la vista inicial (Kanban) y registra las demás para construirlas
+        la primera vez que se seleccionen en el sidebar.
+        """
         # Vista del Tablero Kanban
         self.kanban_view = KanbanView(self.controller, self)
         self.kanban_view.connect_signals(
             self._on_add_task_requested,
-            self._on_task_moved,
+            self._on_tasks_moved,
             self._on_edit_task_requested,
             self._on_delete_task_requested
         )
         self.stacked_widget.addWidget(self.kanban_view)
         
-        # Vista del Bloc de Notas
-        self.notepad_view = NotepadView(self)
-        self.stacked_widget.addWidget(self.notepad_view)
+        # Las demás vistas (y sus dependencias, como matplotlib) se importan y
+        # construyen bajo demanda
+        self.notepad_view = None
+        self.stats_view = None
+        self.calendar_view = None
+        
+        # Guardar referencias para acceso rápido: {nombre: función que crea la vista}
+        self.views = {
+            "kanban": lambda: self.kanban_view,
+            "notepad": self._create_notepad_view,
+            "stats": self._create_stats_view,
+            "calendar": self._create_calendar_view
+        }
+    
+    def _create_notepad_view(self):
+        """Crea la vista del Bloc de Notas."""
+        from ui.notepad_view import NotepadView
+        
+        self.notepad_view = NotepadView(self.note_controller, self)
+        return self.notepad_view
+    
+    def _create_stats_view(self):
+        """Crea la vista de Estadísticas."""
+        from ui.stats_view import StatsView
         
-        # Vista de Estadísticas
         self.stats_view = StatsView(self.controller, self)
-        self.stacked_widget.addWidget(self.stats_view)
+        return self.stats_view
+    
+    def _create_calendar_view(self):
+        """Crea la vista de Calendario."""
+        from ui.calendar_view import CalendarView
         
-        # Vista de Calendario
         self.calendar_view = CalendarView(self.controller, self)
         self.calendar_view.connect_signals(
             self._on_edit_task_requested,
             self._on_delete_task_requested
         )
-        self.stacked_widget.addWidget(self.calendar_view)
+        return self.calendar_view
+    
+    def _get_view(self, view_name: str) -> QWidget:
+        """
+        Obtiene una vista, creándola y agregándola al QStackedWidget la primera vez.
         
-        # Guardar referencias para acceso rápido
-        self.views = {
-            "kanban": 0,
-            "notepad": 1,
-            "stats": 2,
-            "calendar": 3
-        }
+        Args:
+            view_name: Nombre de la vista ("kanban", "notepad", "stats", "calendar")
+            
+        Returns:
+            Widget de la vista (Kanban si el nombre no existe)
+        """
+        view = getattr(self, f"{view_name}_view", None)
+        if view is None and view_name in self.views:
+            view = self.views[view_name]()
+            self.stacked_widget.addWidget(view)
+        return view or self.kanban_view
     
     def _on_view_changed(self, view_name: str):
         """
         Gestiona el cambio de vista desde el sidebar.
         
         Args:
-            view_name: Nombre de la vista a mostrar ("kanban", "notepad", "stats")
+            view_name: Nombre de la vista a mostrar ("kanban", "notepad", "stats", "calendar")
         """
-        index = self.views.get(view_name, 0)
-        self.stacked_widget.setCurrentIndex(index)
-        
-        # Si se cambia a estadísticas, actualizar los datos
-        if view_name == "stats":
-            self.stats_view._update_stats()
-        # Si se cambia a calendario, actualizar las tareas
-        elif view_name == "calendar":
-            self.calendar_view.refresh_tasks()
+        # Cada vista se refresca sola al mostrarse si tiene cambios pendientes
+        # (RefreshableView); aquí no se fuerza ninguna recarga
+        if not self.profile_views:
+            self.stacked_widget.setCurrentWidget(self._get_view(view_name))
+            return
+        
+        queries_before = self.database.query_count()
+        start = time.perf_counter()
+        view = self._get_view(view_name)
+        refreshes_before = getattr(view, 'refresh_count', 0)
+        self.stacked_widget.setCurrentWidget(view)
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        refreshes = getattr(view, 'refresh_count', 0) - refreshes_before
+        print(f"↪ Vista '{view_name}': {self.database.query_count() - queries_before} consultas, "
+              f"{refreshes} refrescos, {elapsed_ms:.1f} ms")
+    
+    def closeEvent(self, event):
+        """Espera a que terminen las escrituras pendientes antes de cerrar."""
+        self.writer.stop()
+        self.controller.close()
+        # Las búsquedas en curso se cancelan: sus resultados ya no se mostrarían
+        self.kanban_view.search_scheduler.stop()
+        if self.notepad_view is not None:
+            self.notepad_view.search_scheduler.stop()
+        super().closeEvent(event)
     
     # ==================== MÉTODOS DE GESTIÓN DE TAREAS ====================
-    # Estos métodos mantienen la funcionalidad original del Kanban intacta
+    # Las escrituras se encolan en el hilo de DatabaseWriter. Mover, editar y
+    # eliminar actualizan el tablero de inmediato (optimista) y se deshacen si
+    # la escritura falla. Cuando la escritura se confirma, el controlador
+    # publica un evento en el bus y cada vista aplica el cambio por su cuenta.
+    
+    def _submit_task_write(self, function, *args, rollback=None,
+                           error_message: str = "", **kwargs):
+        """
+        Encola una escritura de tareas en el hilo de la base de datos.
+        
+        Args:
+            function: Método del controlador a ejecutar (retorna un valor falso si falla)
+            *args: Argumentos para el método
+            rollback: Función que deshace el cambio optimista si la escritura falla
+            error_message: Mensaje a mostrar si la escritura falla
+            **kwargs: Argumentos con nombre para el método
+        """
+        def on_error(message=None):
+            if rollback:
+                rollback()
+            QMessageBox.warning(self, "Error", error_message)
+        
+        def on_finished(result):
+            if not result:
+                on_error()
+        
+        self.writer.submit(function, *args, on_finished=on_finished, on_error=on_error, **kwargs)
     
     def _on_add_task_requested(self, status: str):
         """
@@ -258,78 +355,99 @@ class MainWindow(QMainWindow):
         
         if dialog.exec_() == QDialog.Accepted:
             task_data = dialog.get_task_data()
-            task_id = self.controller.create_task(
+            
+            # La tarjeta necesita el ID de la tarea: la agrega el evento TaskCreated
+            self.writer.submit(
+                self.controller.create_task,
                 task_data['title'],
                 task_data['description'],
                 status,
-                task_data.get('due_date')
+                task_data.get('due_date'),
+                on_finished=self._on_task_created,
+                on_error=lambda message: self._on_task_created(None)
             )
-            
-            if task_id:
-                # Obtener la tarea completa desde la BD
-                new_task = self.controller.get_task(task_id)
-                if new_task:
-                    # Agregar a la vista Kanban
-                    kanban_columns = self.kanban_view.columns
-                    if status in kanban_columns:
-                        kanban_columns[status].add_task_card(new_task)
-                    
-                    # Actualizar estadísticas si está visible
-                    if self.stacked_widget.currentWidget() == self.stats_view:
-                        self.stats_view._update_stats()
-                    # Actualizar calendario si está visible
-                    elif self.stacked_widget.currentWidget() == self.calendar_view:
-                        self.calendar_view.refresh_tasks()
-            else:
-                QMessageBox.critical(self, "Error", "No se pudo crear la tarea.")
     
-    def _on_task_moved(self, task_id: int, new_status: str):
+    def _on_task_created(self, new_task):
         """
-        Gestiona el movimiento de una tarea a otra columna.
+        Informa si no se pudo crear una tarea en segundo plano.
         
         Args:
-            task_id: ID de la tarea movida
-            new_status: Nuevo estado de la tarea
+            new_task: Diccionario con la tarea creada o None si hubo un error
         """
-        # Obtener las columnas del Kanban
-        kanban_columns = self.kanban_view.columns
-        
-        # Buscar la tarjeta en todas las columnas
-        task_card = None
-        old_status = None
+        if not new_task:
+            QMessageBox.critical(self, "Error", "No se pudo crear la tarea.")
+    
+    def _on_tasks_moved(self, task_ids: list, source_status, new_status: str, previous_id=None):
+        """
+        Gestiona el movimiento de una o varias tareas a otra columna o dentro de la suya.
         
-        for status, column in kanban_columns.items():
-            card = column.get_task_card(task_id)
-            if card:
-                task_card = card
-                old_status = status
-                break
+        Varias tareas se mueven juntas con una sola escritura.
         
-        if not task_card:
+        Args:
+            task_ids: IDs de las tareas movidas, en el orden en que deben quedar
+            source_status: Estado de origen indicado por el drag (None si no se conoce)
+            new_status: Nuevo estado de las tareas
+            previous_id: ID de la tarjeta que queda justo arriba (None si quedan primeras)
+        """
+        kanban_columns = self.kanban_view.columns
+        if new_status not in kanban_columns:
             return
         
-        # Actualizar el estado en la base de datos
-        if self.controller.update_task_status(task_id, new_status):
-            # Obtener la tarea actualizada
-            updated_task = self.controller.get_task(task_id)
-            
-            if updated_task:
-                # Remover de la columna antigua
-                if old_status and old_status in kanban_columns:
-                    kanban_columns[old_status].remove_task_card(task_id)
-                
-                # Agregar a la nueva columna
-                if new_status in kanban_columns:
-                    kanban_columns[new_status].add_task_card(updated_task)
-                
-                # Actualizar estadísticas si está visible
-                if self.stacked_widget.currentWidget() == self.stats_view:
-                    self.stats_view._update_stats()
-                # Actualizar calendario si está visible (por si cambia la fecha)
-                elif self.stacked_widget.currentWidget() == self.calendar_view:
-                    self.calendar_view.refresh_tasks()
+        # La columna de origen viene en el drag; solo se buscan las tareas
+        # que ya no están en ella
+        old_statuses = {}
+        for task_id in task_ids:
+            if source_status in kanban_columns and kanban_columns[source_status].has_task(task_id):
+                old_statuses[task_id] = source_status
+            else:
+                status = self.kanban_view.find_task_status(task_id)
+                if status:
+                    old_statuses[task_id] = status
+        
+        task_ids = [task_id for task_id in task_ids if task_id in old_statuses]
+        tasks = {task_id: kanban_columns[old_statuses[task_id]].get_task_data(task_id) for task_id in task_ids}
+        
+        if self.kanban_view.is_searching():
+            # Los resultados están ordenados por relevancia: solo cambia el estado
+            task_ids = [task_id for task_id in task_ids if old_statuses[task_id] != new_status]
+            if not task_ids:
+                return
+            moved_tasks = [{**tasks[task_id], 'status': new_status} for task_id in task_ids]
+            if len(task_ids) == 1:
+                write = (self.controller.update_task_status, task_ids[0], new_status)
+            else:
+                write = (self.controller.update_tasks_status, task_ids, new_status)
         else:
-            QMessageBox.warning(self, "Error", "No se pudo actualizar el estado de la tarea.")
+            if not task_ids:
+                return
+            if (all(old_statuses[task_id] == new_status for task_id in task_ids) and
+                    kanban_columns[new_status].is_run_after(previous_id, task_ids)):
+                return  # Se soltaron en el mismo lugar
+            # Posiciones provisorias; las definitivas llegan con los eventos TaskMoved
+            positions = kanban_columns[new_status].positions_after(previous_id, len(task_ids), task_ids)
+            moved_tasks = [{**tasks[task_id], 'status': new_status, 'position': position}
+                           for task_id, position in zip(task_ids, positions)]
+            if len(task_ids) == 1:
+                write = (self.controller.move_task, task_ids[0], new_status, previous_id)
+            else:
+                write = (self.controller.move_tasks, task_ids, new_status, previous_id)
+        
+        # Mover las tarjetas de inmediato sin esperar a la base de datos
+        for moved_task in moved_tasks:
+            kanban_columns[old_statuses[moved_task['id']]].remove_task_card(moved_task['id'])
+            kanban_columns[new_status].add_task_card(moved_task)
+        
+        def rollback():
+            for task_id in task_ids:
+                kanban_columns[new_status].remove_task_card(task_id)
+                kanban_columns[old_statuses[task_id]].add_task_card(tasks[task_id])
+        
+        self._submit_task_write(
+            *write,
+            rollback=rollback,
+            error_message=("No se pudo actualizar el estado de la tarea." if len(task_ids) == 1
+                           else "No se pudo actualizar el estado de las tareas.")
+        )
     
     def _on_edit_task_requested(self, task_id: int):
         """
@@ -338,7 +456,12 @@ class MainWindow(QMainWindow):
         Args:
             task_id: ID de la tarea a editar
         """
-        task = self.controller.get_task(task_id)
+        # Preferir los datos del tablero: incluyen los cambios aún no escritos
+        status = self.kanban_view.find_task_status(task_id)
+        if status:
+            task = self.kanban_view.columns[status].get_task_data(task_id)
+        else:
+            task = self.controller.get_task(task_id)
         
         if not task:
             QMessageBox.warning(self, "Error", "No se pudo cargar la tarea.")
@@ -349,27 +472,33 @@ class MainWindow(QMainWindow):
         if dialog.exec_() == QDialog.Accepted:
             task_data = dialog.get_task_data()
             
-            if self.controller.update_task(
-                task_id,
+            # Mismo criterio que TaskModel.update: due_date None no modifica la fecha
+            updated_task = {
+                **task,
+                'title': task_data['title'],
+                'description': task_data['description'],
+                'due_date': task_data.get('due_date') or task.get('due_date')
+            }
+            
+            # Actualizar la tarjeta solo si ya está en el tablero (la edición
+            # puede venir del calendario o de una tarea que aún no se paginó)
+            status = self.kanban_view.find_task_status(task_id)
+            kanban_columns = self.kanban_view.columns
+            if status:
+                kanban_columns[status].add_task_card(updated_task)
+            
+            def rollback():
+                if status and kanban_columns[status].has_task(task_id):
+                    kanban_columns[status].add_task_card(task)
+            
+            self._submit_task_write(
+                self.controller.update_task, task_id,
                 title=task_data['title'],
                 description=task_data['description'],
-                due_date=task_data.get('due_date')
-            ):
-                # Obtener la tarea actualizada
-                updated_task = self.controller.get_task(task_id)
-                
-                if updated_task:
-                    # Actualizar la tarjeta en la columna correspondiente
-                    status = updated_task.get('status', 'todo')
-                    kanban_columns = self.kanban_view.columns
-                    if status in kanban_columns:
-                        kanban_columns[status].add_task_card(updated_task)
-                    
-                    # Actualizar calendario si está visible
-                    if self.stacked_widget.currentWidget() == self.calendar_view:
-                        self.calendar_view.refresh_tasks()
-            else:
-                QMessageBox.critical(self, "Error", "No se pudo actualizar la tarea.")
+                due_date=task_data.get('due_date'),
+                rollback=rollback,
+                error_message="No se pudo actualizar la tarea."
+            )
     
     def _on_delete_task_requested(self, task_id: int):
         """
@@ -387,25 +516,20 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            # Buscar la tarjeta en todas las columnas para obtener su estado
             kanban_columns = self.kanban_view.columns
-            task_status = None
+            task_status = self.kanban_view.find_task_status(task_id)
+            task = kanban_columns[task_status].get_task_data(task_id) if task_status else None
             
-            for status, column in kanban_columns.items():
-                if column.get_task_card(task_id):
-                    task_status = status
-                    break
+            # Remover la tarjeta de inmediato
+            if task_status:
+                kanban_columns[task_status].remove_task_card(task_id)
             
-            if self.controller.delete_task(task_id):
-                # Remover la tarjeta de la columna
-                if task_status and task_status in kanban_columns:
-                    kanban_columns[task_status].remove_task_card(task_id)
-                
-                # Actualizar estadísticas si está visible
-                if self.stacked_widget.currentWidget() == self.stats_view:
-                    self.stats_view._update_stats()
-                # Actualizar calendario si está visible
-                elif self.stacked_widget.currentWidget() == self.calendar_view:
-                    self.calendar_view.refresh_tasks()
-            else:
-                QMessageBox.critical(self, "Error", "No se pudo eliminar la tarea.")
+            def rollback():
+                if task_status:
+                    kanban_columns[task_status].add_task_card(task)
+            
+            self._submit_task_write(
+                self.controller.delete_task, task_id,
+                rollback=rollback,
+                error_message="No se pudo eliminar la tarea."
+            )
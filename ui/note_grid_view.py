@@ -0,0 +1,222 @@
+"""
+Componente NoteGridView.
+Grilla virtualizada de notas: un QListView en modo íconos cuyas tarjetas se
+pintan con un delegado y se reacomodan según el ancho disponible.
+"""
+
+from PyQt5.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt5.QtCore import Qt, QEvent, QRect, QSize, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen
+from app.utils import format_datetime, truncate_text
+from ui.note_list_model import NoteListModel
+
+
+class NoteCardDelegate(QStyledItemDelegate):
+    """Delegado que pinta una nota con el mismo aspecto que NoteCard."""
+
+    # Señales para comunicar los clics en los botones pintados
+    edit_requested = pyqtSignal(int)  # note_id
+    delete_requested = pyqtSignal(int)  # note_id
+
+    CARD_HEIGHT = 220
+    CARD_MARGIN = 8  # Separación entre tarjetas
+    PADDING = 12
+    BUTTON_WIDTH = 70
+    BUTTON_HEIGHT = 26
+
+    def __init__(self, parent=None):
+        """
+        Inicializa el delegado y sus fuentes.
+
+        Args:
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+
+        self.title_font = QFont()
+        self.title_font.setPixelSize(16)
+        self.title_font.setBold(True)
+
+        self.content_font = QFont()
+        self.content_font.setPixelSize(13)
+
+        self.date_font = QFont()
+        self.date_font.setPixelSize(10)
+        self.date_font.setItalic(True)
+
+        self.button_font = QFont()
+        self.button_font.setPixelSize(11)
+
+    def sizeHint(self, option, index) -> QSize:
+        """Todas las tarjetas ocupan una celda de la grilla de la vista."""
+        view = option.widget
+        if isinstance(view, QListView) and view.gridSize().isValid():
+            return view.gridSize()
+        return QSize(NoteGridView.MIN_CARD_WIDTH, self.CARD_HEIGHT + 2 * self.CARD_MARGIN)
+
+    def _card_rect(self, rect: QRect) -> QRect:
+        """Rectángulo de la tarjeta dentro de su celda."""
+        margin = self.CARD_MARGIN
+        return rect.adjusted(margin, margin, -margin, -margin)
+
+    def _button_rects(self, rect: QRect) -> tuple:
+        """
+        Calcula los rectángulos de los botones Editar y Eliminar.
+
+        Args:
+            rect: Rectángulo de la celda
+
+        Returns:
+            Tupla (rect_editar, rect_eliminar)
+        """
+        card = self._card_rect(rect)
+        top = card.bottom() - self.PADDING - self.BUTTON_HEIGHT + 1
+        edit_rect = QRect(card.left() + self.PADDING, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        delete_rect = QRect(edit_rect.right() + 9, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        return edit_rect, delete_rect
+
+    def paint(self, painter: QPainter, option, index):
+        """Pinta la tarjeta de la nota."""
+        note = index.data(NoteListModel.NoteRole)
+        if not note:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        card = self._card_rect(option.rect)
+        highlighted = option.state & (QStyle.State_MouseOver | QStyle.State_Selected)
+
+        # Fondo y borde de la tarjeta
+        painter.setPen(QPen(QColor("#9C27B0" if highlighted else "#d0d0d0"), 1))
+        painter.setBrush(QColor("#ffffff"))
+        painter.drawRoundedRect(card, 8, 8)
+
+        text_width = card.width() - 2 * self.PADDING
+        left = card.left() + self.PADDING
+        top = card.top() + self.PADDING
+
+        # Título y línea divisoria
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#212121"))
+        metrics = painter.fontMetrics()
+        title = metrics.elidedText(note.get('title') or 'Sin título', Qt.ElideRight, text_width)
+        painter.drawText(QRect(left, top, text_width, metrics.height()), Qt.AlignLeft | Qt.AlignVCenter, title)
+        top += metrics.height() + 8
+        painter.setPen(QColor("#e0e0e0"))
+        painter.drawLine(left, top, left + text_width, top)
+        top += 8
+
+        edit_rect, delete_rect = self._button_rects(option.rect)
+
+        # Fecha de última modificación (encima de los botones)
+        painter.setFont(self.date_font)
+        date_height = painter.fontMetrics().height()
+        date_top = edit_rect.top() - 8 - date_height
+        updated_at = note.get('updated_at') or ''
+        if updated_at:
+            painter.setPen(QColor("#9e9e9e"))
+            painter.drawText(QRect(left, date_top, text_width, date_height),
+                             Qt.AlignLeft | Qt.AlignVCenter, f"Modificado: {format_datetime(updated_at)}")
+
+        # Contenido: varias líneas, recortado al espacio libre
+        content = note.get('content') or ''
+        if content:
+            painter.setFont(self.content_font)
+            painter.setPen(QColor("#424242"))
+            content_rect = QRect(left, top, text_width, max(0, date_top - 8 - top))
+            painter.save()
+            painter.setClipRect(content_rect)
+            painter.drawText(content_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap,
+                             truncate_text(content, 150))
+            painter.restore()
+
+        # Botones de acción
+        painter.setFont(self.button_font)
+        painter.setPen(Qt.NoPen)
+        for rect, color, text in ((edit_rect, "#9C27B0", "Editar"),
+                                  (delete_rect, "#f44336", "Eliminar")):
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(QColor("#ffffff"))
+            painter.drawText(rect, Qt.AlignCenter, text)
+            painter.setPen(Qt.NoPen)
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        """Detecta los clics sobre los botones pintados de la tarjeta."""
+        if event.type() not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return False
+        if event.button() != Qt.LeftButton:
+            return False
+
+        edit_rect, delete_rect = self._button_rects(option.rect)
+        pos = event.pos()
+
+        if edit_rect.contains(pos):
+            if event.type() == QEvent.MouseButtonRelease:
+                self.edit_requested.emit(index.data(NoteListModel.NoteIdRole))
+            return True
+
+        if delete_rect.contains(pos):
+            if event.type() == QEvent.MouseButtonRelease:
+                self.delete_requested.emit(index.data(NoteListModel.NoteIdRole))
+            return True
+
+        return False
+
+
+class NoteGridView(QListView):
+    """
+    QListView en modo íconos que reparte las tarjetas en tantas columnas como
+    quepan en el ancho visible.
+    """
+
+    # Ancho mínimo de una tarjeta (incluye su margen)
+    MIN_CARD_WIDTH = 260
+
+    def __init__(self, parent=None):
+        """
+        Inicializa la grilla.
+
+        Args:
+            parent: Widget padre
+        """
+        super().__init__(parent)
+        self.setObjectName("noteGridView")
+
+        self.setViewMode(QListView.IconMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+
+        # Todas las celdas miden lo mismo: el layout no consulta cada sizeHint
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFrameShape(QListView.NoFrame)
+        self.setMouseTracking(True)
+
+        self._update_grid()
+
+    def columns(self) -> int:
+        """Cantidad de columnas que caben en el ancho visible."""
+        return max(1, self.viewport().width() // self.MIN_CARD_WIDTH)
+
+    def _update_grid(self):
+        """Ajusta el tamaño de celda para repartir el ancho entre las columnas."""
+        height = NoteCardDelegate.CARD_HEIGHT + 2 * NoteCardDelegate.CARD_MARGIN
+        width = max(self.MIN_CARD_WIDTH, self.viewport().width() // self.columns())
+        if self.gridSize() != QSize(width, height):
+            self.setGridSize(QSize(width, height))
+
+    def resizeEvent(self, event):
+        """Reacomoda las columnas al nuevo ancho."""
+        self._update_grid()
+        super().resizeEvent(event)
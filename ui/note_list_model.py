@@ -0,0 +1,136 @@
+"""
+Modelo NoteListModel.
+Modelo de lista (model/view) sobre las notas del bloc de notas.
+"""
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class NoteListModel(QAbstractListModel):
+    """Modelo que expone las notas a la grilla del bloc de notas."""
+
+    # Rol para obtener el diccionario completo de la nota
+    NoteRole = Qt.UserRole + 1
+
+    # Rol para obtener solo el ID de la nota
+    NoteIdRole = Qt.UserRole + 2
+
+    def __init__(self, parent=None):
+        """
+        Inicializa el modelo vacío.
+
+        Args:
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+        self._notes = []  # Lista de diccionarios con las notas
+        self._rows = {}  # Diccionario {note_id: fila}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Retorna la cantidad de notas del modelo."""
+        if parent.isValid():
+            return 0
+        return len(self._notes)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Retorna los datos de la nota para el rol solicitado."""
+        if not index.isValid() or index.row() >= len(self._notes):
+            return None
+
+        note = self._notes[index.row()]
+
+        if role == Qt.DisplayRole:
+            return note.get('title', '')
+        if role == Qt.ToolTipRole:
+            return note.get('content') or None
+        if role == self.NoteRole:
+            return note
+        if role == self.NoteIdRole:
+            return note.get('id')
+        return None
+
+    def flags(self, index: QModelIndex):
+        """Las notas se pueden seleccionar (no se arrastran)."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # ==================== API DE LA VISTA ====================
+
+    def set_notes(self, notes: list):
+        """
+        Reemplaza todas las notas con un solo reinicio del modelo.
+
+        Args:
+            notes: Lista de diccionarios con las notas, en el orden a mostrar
+        """
+        self.beginResetModel()
+        self._notes = list(notes)
+        self._rows = {note.get('id'): row for row, note in enumerate(self._notes)}
+        self.endResetModel()
+
+    def add_note(self, note_data: dict):
+        """
+        Agrega una nota al final o la actualiza si ya existe.
+
+        Args:
+            note_data: Diccionario con los datos de la nota
+        """
+        note_id = note_data.get('id')
+
+        if note_id in self._rows:
+            row = self._rows[note_id]
+            self._notes[row] = note_data
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            return
+
+        row = len(self._notes)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._notes.append(note_data)
+        self._rows[note_id] = row
+        self.endInsertRows()
+
+    def remove_note(self, note_id: int) -> bool:
+        """
+        Elimina una nota del modelo.
+
+        Args:
+            note_id: ID de la nota a eliminar
+
+        Returns:
+            True si la nota existía, False en caso contrario
+        """
+        row = self._rows.get(note_id)
+        if row is None:
+            return False
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._notes[row]
+        del self._rows[note_id]
+        # Recalcular solo las filas desplazadas
+        for new_row in range(row, len(self._notes)):
+            self._rows[self._notes[new_row].get('id')] = new_row
+        self.endRemoveRows()
+        return True
+
+    def get_note(self, note_id: int):
+        """
+        Obtiene los datos de una nota por su ID.
+
+        Args:
+            note_id: ID de la nota
+
+        Returns:
+            Diccionario con los datos de la nota o None si no existe
+        """
+        row = self._rows.get(note_id)
+        return self._notes[row] if row is not None else None
+
+    def has_note(self, note_id: int) -> bool:
+        """Indica si la nota está en el modelo."""
+        return note_id in self._rows
+
+    def note_ids(self) -> list:
+        """Retorna los IDs de las notas en orden de fila."""
+        return [note.get('id') for note in self._notes]
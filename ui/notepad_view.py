@@ -1,14 +1,18 @@
 """
 Vista del Bloc de Notas.
-Muestra las notas como tarjetas organizadas en un grid.
+Muestra las notas como tarjetas en una grilla virtualizada que se reacomoda
+según el ancho de la ventana.
 """
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                             QPushButton, QLabel, QScrollArea, QDialog,
-                             QLineEdit, QTextEdit, QMessageBox, QGridLayout)
-from PyQt5.QtCore import Qt
-from ui.note_card import NoteCard
+                             QPushButton, QLabel, QDialog,
+                             QLineEdit, QTextEdit, QMessageBox)
+from ui.note_list_model import NoteListModel
+from ui.note_grid_view import NoteGridView, NoteCardDelegate
 from app.note_controller import NoteController
+from app.events import NoteCreated, NoteDeleted, NoteUpdated
+from app.query_scheduler import QueryScheduler
+from ui.refreshable_view import RefreshableView
 
 
 class NoteDialog(QDialog):
@@ -103,22 +107,41 @@ class NoteDialog(QDialog):
         }
 
 
-class NotepadView(QWidget):
+class NotepadView(RefreshableView, QWidget):
     """Vista del bloc de notas que muestra las notas como tarjetas."""
     
-    def __init__(self, parent=None):
+    # Espera (ms) desde la última tecla antes de ejecutar la búsqueda
+    SEARCH_DELAY = 250
+    
+    def __init__(self, controller: NoteController = None, parent=None):
         """
         Inicializa la vista del bloc de notas.
         
         Args:
+            controller: Controlador de notas (None para uno sobre la base de
+                        datos por defecto)
             parent: Widget padre
         """
         super().__init__(parent)
-        self.controller = NoteController()
-        self.note_cards = {}  # Diccionario {note_id: NoteCard}
+        self.controller = controller if controller is not None else NoteController()
+        # Cambios que la vista todavía no muestra: {note_id: nota o None si se eliminó}
+        self._pending_changes = {}
+        self._search_text = ""  # Búsqueda aplicada al grid ("" = todas las notas)
+        
+        # Las búsquedas se ejecutan fuera del hilo de la interfaz
+        self.search_scheduler = QueryScheduler(self.controller.database, delay=self.SEARCH_DELAY, parent=self)
+        self.search_scheduler.results_ready.connect(self._on_search_results)
+        # Las búsquedas leen con la conexión del programador (la que se cancela)
+        self._search_model = self.search_scheduler.bind_model(self.controller.model)
         
         self._setup_ui()
         self._load_notes()
+        
+        # Las tarjetas se actualizan con los eventos que publica el controlador
+        bus = self.controller.bus
+        bus.subscribe(NoteCreated, lambda event: self._on_note_changed(event.note['id'], event.note))
+        bus.subscribe(NoteUpdated, lambda event: self._on_note_changed(event.note['id'], event.note))
+        bus.subscribe(NoteDeleted, lambda event: self._on_note_changed(event.note_id, None))
     
     def _setup_ui(self):
         """Configura la interfaz del bloc de notas."""
@@ -137,6 +160,15 @@ class NotepadView(QWidget):
         
         toolbar_layout.addStretch()
         
+        # Caja de búsqueda: filtra las notas mientras se escribe
+        self.search_edit = QLineEdit()
+        self.search_edit.setObjectName("searchBox")
+        self.search_edit.setPlaceholderText("🔍 Buscar notas...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(lambda text: self._request_search())
+        self.search_edit.returnPressed.connect(lambda: self._request_search(immediate=True))
+        toolbar_layout.addWidget(self.search_edit)
+        
         # Botón: Agregar Nota
         self.add_button = QPushButton("➕ Nueva Nota")
         self.add_button.setObjectName("notepadButton")
@@ -145,97 +177,99 @@ class NotepadView(QWidget):
         
         layout.addLayout(toolbar_layout)
         
-        # Área scrollable para las tarjetas de notas
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setFrameShape(QScrollArea.NoFrame)
-        
-        # Widget contenedor para las tarjetas (con grid layout)
-        self.cards_container = QWidget()
-        self.grid_layout = QGridLayout(self.cards_container)
-        self.grid_layout.setContentsMargins(10, 10, 10, 10)
-        self.grid_layout.setSpacing(15)
-        
-        scroll_area.setWidget(self.cards_container)
-        layout.addWidget(scroll_area)
+        # Grilla de notas: solo se pintan las tarjetas visibles
+        self.note_model = NoteListModel(self)
+        self.note_delegate = NoteCardDelegate(self)
+        self.note_delegate.edit_requested.connect(self._on_edit_note_requested)
+        self.note_delegate.delete_requested.connect(self._on_delete_note_requested)
+        
+        self.note_view = NoteGridView(self)
+        self.note_view.setModel(self.note_model)
+        self.note_view.setItemDelegate(self.note_delegate)
+        layout.addWidget(self.note_view)
     
     def _load_notes(self):
         """Carga todas las notas desde la base de datos y las muestra como tarjetas."""
         notes = self.controller.get_all_notes()
-        
-        # Limpiar tarjetas existentes
-        self._clear_cards()
-        
-        # Agregar cada nota como tarjeta
-        for note in notes:
-            self._add_note_card(note)
+        self.note_model.set_notes(notes)
     
-    def _add_note_card(self, note_data: dict):
+    def _request_search(self, immediate: bool = False):
         """
-        Agrega una tarjeta de nota al grid.
+        Pide la búsqueda del texto de la caja (o quita el filtro si está vacía).
         
         Args:
-            note_data: Diccionario con los datos de la nota
+            immediate: Si es True, busca sin esperar a que se deje de escribir
         """
-        note_id = note_data.get('id')
-        
-        # Si la tarjeta ya existe, actualizarla
-        if note_id in self.note_cards:
-            self.note_cards[note_id].update_data(note_data)
+        text = self.search_edit.text().strip()
+        if not text:
+            self.search_scheduler.cancel()
+            if self._search_text:
+                self._search_text = ""
+                self._pending_changes = {}
+                self._load_notes()
             return
         
-        # Crear nueva tarjeta
-        card = NoteCard(note_data, self.cards_container)
-        
-        # Conectar señales
-        card.edit_requested.connect(self._on_edit_note_requested)
-        card.delete_requested.connect(self._on_delete_note_requested)
-        
-        # Calcular posición en el grid (3 columnas)
-        row = len(self.note_cards) // 3
-        col = len(self.note_cards) % 3
+        run = self.search_scheduler.run_now if immediate else self.search_scheduler.schedule
+        run(self._search_notes, text)
+    
+    def _search_notes(self, text: str):
+        """
+        Busca las notas (se ejecuta en el hilo del QueryScheduler).
         
-        self.grid_layout.addWidget(card, row, col)
+        Args:
+            text: Texto de búsqueda
+            
+        Returns:
+            Tupla (texto, notas ordenadas por relevancia)
+        """
+        return text, self._search_model.search(text)
+    
+    def _on_search_results(self, result: tuple, latency_ms: float):
+        """
+        Muestra las notas encontradas en el orden de relevancia de la búsqueda.
         
-        # Guardar referencia
-        self.note_cards[note_id] = card
+        Args:
+            result: Tupla (texto buscado, notas)
+            latency_ms: Tiempo desde la última tecla hasta los resultados
+        """
+        self._search_text, notes = result
+        self._pending_changes = {}
+        self.note_model.set_notes(notes)
     
-    def _remove_note_card(self, note_id: int):
+    def _on_note_changed(self, note_id: int, note):
         """
-        Elimina una tarjeta de nota del grid.
+        Aplica un evento de nota, o lo acumula si la vista está oculta.
         
         Args:
-            note_id: ID de la nota a eliminar
+            note_id: ID de la nota
+            note: Diccionario con la nota persistida o None si se eliminó
         """
-        if note_id in self.note_cards:
-            card = self.note_cards[note_id]
-            self.grid_layout.removeWidget(card)
-            card.setParent(None)
-            card.deleteLater()
-            del self.note_cards[note_id]
-            
-            # Reorganizar las tarjetas restantes
-            self._reorganize_cards()
+        if self._search_text:
+            # El cambio puede hacer que la nota entre o salga de los resultados
+            self._request_search()
+        else:
+            # Solo importa el último estado de cada nota
+            self._pending_changes[note_id] = note
+            self.mark_dirty()
     
-    def _reorganize_cards(self):
-        """Reorganiza las tarjetas en el grid después de eliminar una."""
-        # Limpiar el layout
-        for i in reversed(range(self.grid_layout.count())):
-            self.grid_layout.itemAt(i).widget().setParent(None)
-        
-        # Reagregar todas las tarjetas
-        cards_list = list(self.note_cards.values())
-        for idx, card in enumerate(cards_list):
-            row = idx // 3
-            col = idx % 3
-            self.grid_layout.addWidget(card, row, col)
+    def _apply_note_changes(self, changes: dict):
+        """
+        Aplica varios cambios de notas sobre el modelo de la grilla.
+        
+        Args:
+            changes: Diccionario {note_id: nota o None si se eliminó}
+        """
+        for note_id, note in changes.items():
+            if note is None:
+                self.note_model.remove_note(note_id)
+            else:
+                self.note_model.add_note(note)
     
-    def _clear_cards(self):
-        """Elimina todas las tarjetas."""
-        for note_id in list(self.note_cards.keys()):
-            self._remove_note_card(note_id)
+    def _refresh(self):
+        """Aplica en un solo paso los cambios pendientes."""
+        if self._pending_changes:
+            changes, self._pending_changes = self._pending_changes, {}
+            self._apply_note_changes(changes)
     
     def _on_add_note_requested(self):
         """Gestiona la solicitud de agregar una nueva nota."""
@@ -243,18 +277,13 @@ class NotepadView(QWidget):
         
         if dialog.exec_() == QDialog.Accepted:
             note_data = dialog.get_note_data()
-            note_id = self.controller.create_note(
+            new_note = self.controller.create_note(
                 note_data['title'],
                 note_data['content']
             )
             
-            if note_id:
-                # Obtener la nota completa desde la BD
-                new_note = self.controller.get_note(note_id)
-                if new_note:
-                    self._add_note_card(new_note)
-                    self._reorganize_cards()
-            else:
+            # La tarjeta la agrega el evento NoteCreated
+            if not new_note:
                 QMessageBox.critical(self, "Error", "No se pudo crear la nota.")
     
     def _on_edit_note_requested(self, note_id: int):
@@ -275,18 +304,14 @@ class NotepadView(QWidget):
         if dialog.exec_() == QDialog.Accepted:
             note_data = dialog.get_note_data()
             
-            if self.controller.update_note(
+            updated_note = self.controller.update_note(
                 note_id,
                 title=note_data['title'],
                 content=note_data['content']
-            ):
-                # Obtener la nota actualizada
-                updated_note = self.controller.get_note(note_id)
-                
-                if updated_note:
-                    # Actualizar la tarjeta
-                    self._add_note_card(updated_note)
-            else:
+            )
+            
+            # La tarjeta la actualiza el evento NoteUpdated
+            if not updated_note:
                 QMessageBox.critical(self, "Error", "No se pudo actualizar la nota.")
     
     def _on_delete_note_requested(self, note_id: int):
@@ -305,7 +330,6 @@ class NotepadView(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            if self.controller.delete_note(note_id):
-                self._remove_note_card(note_id)
-            else:
+            # La tarjeta la quita el evento NoteDeleted
+            if not self.controller.delete_note(note_id):
                 QMessageBox.critical(self, "Error", "No se pudo eliminar la nota.")
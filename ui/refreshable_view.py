@@ -0,0 +1,53 @@
+"""
+Protocolo de refresco de las vistas.
+Las vistas marcan sus datos como pendientes y se actualizan una sola vez,
+cuando están visibles.
+"""
+
+
+class RefreshableView:
+    """
+    Mixin para las vistas del QStackedWidget que se refrescan bajo demanda.
+
+    Los cambios de datos llaman a mark_dirty(): si la vista está visible se
+    refresca en el momento; si está oculta, el refresco se hace una sola vez
+    al mostrarse (showEvent llama a ensure_fresh()), sin importar cuántos
+    cambios hayan llegado ni cuántas veces se pida. Cada vista redefine
+    _refresh().
+
+    Se hereda antes que QWidget: class MiVista(RefreshableView, QWidget).
+    """
+
+    _stale = False  # Hay cambios que la vista todavía no muestra
+    refresh_count = 0  # Refrescos hechos (para --profile-views)
+
+    def mark_dirty(self):
+        """Indica que los datos de la vista cambiaron."""
+        self._stale = True
+        if self.isVisible():
+            self.ensure_fresh()
+
+    def is_dirty(self) -> bool:
+        """Indica si la vista tiene cambios pendientes de mostrar."""
+        return self._stale
+
+    def ensure_fresh(self):
+        """Refresca la vista si tiene cambios pendientes (si no, no hace nada)."""
+        if not self._stale:
+            return
+        self._stale = False
+        self.refresh_count += 1
+        self._refresh()
+
+    def _refresh(self):
+        """
+        Vuelve a mostrar los datos pendientes.
+
+        Cada vista lo redefine; por defecto no hay nada que actualizar (no se
+        usa abc.ABC porque su metaclase no se combina con la de QWidget).
+        """
+
+    def showEvent(self, event):
+        """Aplica los cambios que llegaron mientras la vista estaba oculta."""
+        super().showEvent(event)
+        self.ensure_fresh()
@@ -1,20 +1,33 @@
 """
 Vista de Estadísticas.
-Muestra estadísticas de las tareas con gráficos de barras.
+Muestra estadísticas de las tareas con gráficos de barras y métricas de flujo
+(flujo acumulado, lead time y cycle time).
 """
 
+import numpy as np
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                             QLabel, QPushButton, QFrame)
-from PyQt5.QtCore import Qt
+                             QLabel, QPushButton, QFrame, QComboBox)
+from PyQt5.QtCore import Qt, QTimer
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+from matplotlib.ticker import MaxNLocator
+from matplotlib.dates import DateFormatter, date2num
 from app.controller import TaskController
+from ui.refreshable_view import RefreshableView
+from app.analytics import FlowAnalytics, WINDOWS
 
 
-class StatsView(QWidget):
+class StatsView(RefreshableView, QWidget):
     """Vista que muestra estadísticas de las tareas con gráficos."""
     
+    # Capas del flujo acumulado, de abajo hacia arriba: (estado, etiqueta, color)
+    FLOW_LAYERS = (("done", "Hecho", "#4CAF50"),
+                   ("doing", "En Progreso", "#FF9800"),
+                   ("todo", "Por Hacer", "#2196F3"))
+    
+    # Barras por serie del histograma de lead time y cycle time
+    FLOW_BINS = 20
+    
     def __init__(self, controller: TaskController, parent=None):
         """
         Inicializa la vista de estadísticas.
@@ -25,9 +38,29 @@ class StatsView(QWidget):
         """
         super().__init__(parent)
         self.controller = controller
+        self.counters = controller.counters
+        
+        # Métricas de flujo: se calculan en segundo plano y se guardan por ventana
+        self.analytics = FlowAnalytics(database=controller.database, model=controller.model,
+                                       bus=controller.bus, parent=self)
+        self.analytics.metrics_ready.connect(self._on_flow_metrics_ready)
+        self.analytics.invalidated.connect(self._on_flow_invalidated)
+        self._flow_dirty = True  # Las métricas mostradas no están al día
+        
+        # Agrupa varias invalidaciones seguidas en un solo cálculo
+        self._flow_timer = QTimer(self)
+        self._flow_timer.setSingleShot(True)
+        self._flow_timer.setInterval(500)
+        self._flow_timer.timeout.connect(self._request_flow_metrics)
         
         self._setup_ui()
-        self._update_stats()
+        
+        # Los conteos se mantienen de forma incremental y avisan de cada cambio
+        self.counters.ensure_loaded()
+        self.counters.changed.connect(lambda counts: self.mark_dirty())
+        
+        # La vista se construye oculta: se dibuja una sola vez al mostrarse
+        self.mark_dirty()
     
     def _setup_ui(self):
         """Configura la interfaz de la vista de estadísticas."""
@@ -69,17 +102,46 @@ class StatsView(QWidget):
         
         self.refresh_button = QPushButton("🔄 Actualizar")
         self.refresh_button.setObjectName("statsRefreshButton")
-        self.refresh_button.clicked.connect(self._update_stats)
+        # Vuelve a contar (recoge cambios hechos fuera de la aplicación)
+        self.refresh_button.clicked.connect(self._on_refresh_clicked)
         refresh_layout.addWidget(self.refresh_button)
         
+        # Selector de la ventana de tiempo de las métricas de flujo
+        self.window_combo = QComboBox()
+        self.window_combo.setObjectName("statsWindowCombo")
+        for days in WINDOWS:
+            self.window_combo.addItem(f"Últimos {days} días", days)
+        self.window_combo.setCurrentIndex(1)
+        self.window_combo.currentIndexChanged.connect(self._request_flow_metrics)
+        refresh_layout.addWidget(self.window_combo)
+        
         refresh_layout.addStretch()
         layout.addLayout(refresh_layout)
         
+        charts_layout = QHBoxLayout()
+        charts_layout.setSpacing(15)
+        
         # Gráfico de barras
         self.figure = Figure(figsize=(10, 6))
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setObjectName("statsChart")
-        layout.addWidget(self.canvas)
+        charts_layout.addWidget(self.canvas, 1)
+        self._setup_chart()
+        
+        # Gráficos de flujo
+        self.flow_figure = Figure(figsize=(10, 6))
+        self.flow_canvas = FigureCanvas(self.flow_figure)
+        self.flow_canvas.setObjectName("statsFlowChart")
+        charts_layout.addWidget(self.flow_canvas, 1)
+        self._setup_flow_charts()
+        
+        layout.addLayout(charts_layout)
+        
+        # Resumen de las métricas de flujo
+        self.flow_summary_label = QLabel("Calculando métricas de flujo...")
+        self.flow_summary_label.setObjectName("statsFlowSummary")
+        self.flow_summary_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.flow_summary_label)
     
     def _create_stat_card(self, title: str, value: str, color: str) -> QFrame:
         """
@@ -132,22 +194,9 @@ class StatsView(QWidget):
     
     def _update_stats(self):
         """Actualiza las estadísticas y el gráfico."""
-        # Obtener todas las tareas
-        tasks = self.controller.get_all_tasks()
-        
-        # Contar por estado
-        counts = {
-            "todo": 0,
-            "doing": 0,
-            "done": 0
-        }
-        
-        for task in tasks:
-            status = task.get('status', 'todo')
-            if status in counts:
-                counts[status] += 1
-        
-        total = len(tasks)
+        # Conteos por estado mantenidos en memoria (O(1), sin consultar la base de datos)
+        counts = self.counters.counts()
+        total = self.counters.total()
         
         # Actualizar las tarjetas
         self._update_stat_card(self.todo_card, str(counts["todo"]))
@@ -174,57 +223,204 @@ class StatsView(QWidget):
                 if value_label:
                     value_label.setText(value)
     
-    def _update_chart(self, counts: dict):
+    def _setup_chart(self):
         """
-        Actualiza el gráfico de barras con las estadísticas.
+        Crea una sola vez los ejes, las barras y las etiquetas del gráfico.
         
-        Args:
-            counts: Diccionario con los conteos por estado
+        Las actualizaciones solo cambian la altura de las barras y el texto de
+        las etiquetas; la figura nunca se vuelve a construir.
         """
-        # Limpiar el gráfico anterior
-        self.figure.clear()
-        
-        # Crear el gráfico
         ax = self.figure.add_subplot(111)
+        self.chart_axes = ax
         
         # Datos para el gráfico
         estados = ["Por Hacer", "En Progreso", "Hecho"]
-        valores = [counts["todo"], counts["doing"], counts["done"]]
         colores = ["#2196F3", "#FF9800", "#4CAF50"]
         
-        # Crear el gráfico de barras
-        bars = ax.bar(estados, valores, color=colores, alpha=0.8, edgecolor='black', linewidth=1.5)
+        # Crear el gráfico de barras (las alturas se ajustan en _update_chart)
+        self.chart_bars = ax.bar(estados, [0] * len(estados), color=colores,
+                                 alpha=0.8, edgecolor='black', linewidth=1.5)
         
         # Personalizar el gráfico
         ax.set_ylabel('Cantidad de Tareas', fontsize=12, fontweight='bold')
         ax.set_xlabel('Estado', fontsize=12, fontweight='bold')
         ax.set_title('Distribución de Tareas por Estado', fontsize=14, fontweight='bold', pad=20)
         
-        # Agregar valores en las barras
-        for bar, valor in zip(bars, valores):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{valor}',
-                   ha='center', va='bottom', fontsize=11, fontweight='bold')
+        # Etiquetas con el valor sobre cada barra
+        self.chart_labels = [
+            ax.text(bar.get_x() + bar.get_width()/2., 0, '0',
+                    ha='center', va='bottom', fontsize=11, fontweight='bold')
+            for bar in self.chart_bars
+        ]
         
         # Configurar el eje Y para mostrar solo números enteros
-        ax.set_ylim(bottom=0)
-        max_val = max(valores) if valores else 1
-        ax.set_ylim(top=max(max_val + 1, 5))
-        ax.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
+        ax.set_ylim(bottom=0, top=5)
+        ax.yaxis.set_major_locator(MaxNLocator(integer=True))
         
         # Agregar grid
         ax.grid(axis='y', alpha=0.3, linestyle='--')
         
-        # Ajustar el layout
+        # Ajustar el layout ahora y solo cuando cambie el tamaño del canvas
         self.figure.tight_layout()
+        self.canvas.mpl_connect('resize_event', lambda event: self.figure.tight_layout())
         
-        # Actualizar el canvas
-        self.canvas.draw()
+        self.chart_values = None  # Valores dibujados actualmente
     
-    def showEvent(self, event):
-        """Evento que se ejecuta cuando la vista se muestra."""
-        super().showEvent(event)
-        # Actualizar estadísticas cada vez que se muestra la vista
+    def _update_chart(self, counts: dict):
+        """
+        Actualiza el gráfico de barras con las estadísticas.
+        
+        Args:
+            counts: Diccionario con los conteos por estado
+        """
+        valores = [counts["todo"], counts["doing"], counts["done"]]
+        
+        # Sin cambios no hay nada que redibujar
+        if valores == self.chart_values:
+            return
+        self.chart_values = valores
+        
+        for bar, label, valor in zip(self.chart_bars, self.chart_labels, valores):
+            bar.set_height(valor)
+            label.set_y(valor)
+            label.set_text(f'{valor}')
+        
+        max_val = max(valores) if valores else 1
+        self.chart_axes.set_ylim(bottom=0, top=max(max_val + 1, 5))
+        
+        # Redibujar cuando vuelva el bucle de eventos (varios cambios seguidos
+        # se agrupan en un solo dibujo)
+        self.canvas.draw_idle()
+    
+    def _refresh(self):
+        """Actualiza los conteos y, si quedaron viejas, pide las métricas de flujo."""
         self._update_stats()
+        if self._flow_dirty:
+            self._request_flow_metrics()
+    
+    # ==================== MÉTRICAS DE FLUJO ====================
+    
+    def _on_refresh_clicked(self):
+        """Vuelve a contar las tareas y a calcular las métricas de flujo."""
+        self.counters.reload()
+        self.analytics.invalidate()
+    
+    def _request_flow_metrics(self):
+        """Pide las métricas de la ventana seleccionada (llegan por metrics_ready)."""
+        self._flow_dirty = False
+        self.analytics.request(self.window_combo.currentData())
+    
+    def _on_flow_invalidated(self):
+        """Recalcula las métricas si la vista está visible, o las marca pendientes."""
+        if self.isVisible():
+            self._flow_timer.start()
+        else:
+            self._flow_dirty = True
+            self.mark_dirty()
+    
+    def _on_flow_metrics_ready(self, window_days: int, metrics):
+        """
+        Dibuja las métricas de flujo recibidas.
+        
+        Args:
+            window_days: Ventana de las métricas
+            metrics: FlowMetrics calculadas
+        """
+        if window_days != self.window_combo.currentData():
+            return  # Respuesta de una ventana que ya no está seleccionada
+        
+        self._update_flow_charts(metrics)
+    
+    def _setup_flow_charts(self):
+        """
+        Crea una sola vez los ejes y los artistas de los gráficos de flujo.
+        
+        Igual que en el gráfico de barras, las actualizaciones solo cambian
+        los vértices de las áreas y la altura de las barras.
+        """
+        # Flujo acumulado: una área apilada por estado ('done' abajo)
+        ax = self.flow_cfd_axes = self.flow_figure.add_subplot(211)
+        self.flow_areas = [ax.fill_between([0, 1], 0, 0, label=label, color=color, alpha=0.8)
+                           for _, label, color in self.FLOW_LAYERS]
+        self.flow_cfd_title = ax.set_title('Flujo acumulado', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Tareas', fontsize=10)
+        ax.legend(loc='upper left', fontsize=8)
+        ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+        ax.xaxis_date()
+        ax.xaxis.set_major_formatter(DateFormatter('%d/%m'))
+        ax.tick_params(axis='x', labelsize=8)
+        
+        # Distribución de lead time y cycle time (en días): barras lado a lado
+        ax = self.flow_times_axes = self.flow_figure.add_subplot(212)
+        self.flow_time_bars = [
+            ax.bar(np.zeros(self.FLOW_BINS), np.zeros(self.FLOW_BINS), align='edge',
+                   label=label, color=color, alpha=0.8)
+            for label, color in (("Lead time", "#9C27B0"), ("Cycle time", "#FF9800"))
+        ]
+        self.flow_times_empty = ax.text(0.5, 0.5, 'Sin tareas terminadas en la ventana',
+                                        ha='center', va='center', transform=ax.transAxes)
+        ax.set_title('Lead time y cycle time', fontsize=12, fontweight='bold')
+        ax.set_xlabel('Días', fontsize=10)
+        ax.set_ylabel('Tareas', fontsize=10)
+        ax.legend(fontsize=8)
+        ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+        
+        self.flow_figure.tight_layout()
+        self.flow_canvas.mpl_connect('resize_event', lambda event: self.flow_figure.tight_layout())
+    
+    def _update_flow_charts(self, metrics):
+        """
+        Dibuja el flujo acumulado y la distribución de lead time y cycle time.
+        
+        Args:
+            metrics: FlowMetrics calculadas
+        """
+        # Flujo acumulado: cada área va del tope de la anterior a su propio tope
+        x = date2num(metrics.days.astype('datetime64[s]').astype(object))
+        lower = np.zeros(len(x))
+        for area, (status, _, _) in zip(self.flow_areas, self.FLOW_LAYERS):
+            upper = lower + metrics.cumulative[status]
+            area.set_verts([np.column_stack((np.concatenate((x, x[::-1])),
+                                             np.concatenate((upper, lower[::-1]))))])
+            lower = upper
+        
+        ax = self.flow_cfd_axes
+        self.flow_cfd_title.set_text(f'Flujo acumulado (últimos {metrics.window_days} días)')
+        if len(x):
+            ax.set_xlim(x[0], x[-1] if len(x) > 1 else x[0] + 1)
+        ax.set_ylim(0, max(float(lower.max()) if len(lower) else 0, 1) * 1.05)
+        
+        # Histograma con los mismos intervalos para las dos series
+        series = (metrics.lead_times, metrics.cycle_times)
+        values = np.concatenate(series)
+        has_values = bool(len(values))
+        edges = np.histogram_bin_edges(values if has_values else [0, 1], bins=self.FLOW_BINS)
+        if edges[-1] == edges[0]:
+            edges = edges[0] + np.arange(self.FLOW_BINS + 1)  # Todas las duraciones iguales
+        width = (edges[1] - edges[0]) / 2
+        
+        top = 0
+        for offset, (bars, data) in enumerate(zip(self.flow_time_bars, series)):
+            heights, _ = np.histogram(data, bins=edges)
+            top = max(top, int(heights.max()))
+            for bar, left, height in zip(bars, edges[:-1], heights):
+                bar.set_x(left + offset * width)
+                bar.set_width(width)
+                bar.set_height(height)
+        
+        ax = self.flow_times_axes
+        self.flow_times_empty.set_visible(not has_values)
+        ax.set_xlim(edges[0], edges[-1])
+        ax.set_ylim(0, max(top + 1, 5))
+        
+        self.flow_canvas.draw_idle()
+        
+        summary = metrics.summary
+        self.flow_summary_label.setText(
+            f"Throughput: {summary['throughput_total']:.0f} tareas "
+            f"({summary['throughput_per_day']:.1f}/día)   •   "
+            f"Lead time p50 {summary['lead_time_p50']:.1f} d / p85 {summary['lead_time_p85']:.1f} d   •   "
+            f"Cycle time p50 {summary['cycle_time_p50']:.1f} d / p85 {summary['cycle_time_p85']:.1f} d"
+        )
 
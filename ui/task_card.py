@@ -5,9 +5,10 @@ Widget que representa una tarjeta de tarea individual.
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal, QMimeData, QPoint
-from PyQt5.QtGui import QDrag, QPainter
+from PyQt5.QtCore import Qt, pyqtSignal, QPoint
+from PyQt5.QtGui import QDrag, QPainter, QPixmap
 from app.utils import format_datetime, truncate_text
+from ui.task_mime import encode_task_mime
 
 
 class TaskCard(QFrame):
@@ -30,6 +31,7 @@ class TaskCard(QFrame):
         self.task_data = task_data
         self.task_id = task_data.get('id')
         self.setAcceptDrops(False)  # Las tarjetas no reciben drops, solo se arrastran
+        self._drag_pixmap = None  # Imagen del drag, se invalida al cambiar los datos o el tamaño
         
         self._setup_ui()
         self._apply_styles()
@@ -107,17 +109,12 @@ class TaskCard(QFrame):
             return
         
         drag = QDrag(self)
-        mime_data = QMimeData()
         
         # Guardar el ID de la tarea y su estado actual en los datos del drag
-        mime_data.setText(str(self.task_id))
-        mime_data.setData("application/x-task", str(self.task_id).encode())
+        drag.setMimeData(encode_task_mime([self.task_id], self.get_status()))
         
-        drag.setMimeData(mime_data)
-        
-        # Crear una imagen de la tarjeta para el drag
-        pixmap = self.grab()
-        drag.setPixmap(pixmap)
+        # Imagen de la tarjeta para el drag (se renderiza solo la primera vez)
+        drag.setPixmap(self.drag_pixmap())
         drag.setHotSpot(event.pos())
         
         # Cambiar el cursor durante el drag
@@ -129,6 +126,22 @@ class TaskCard(QFrame):
         # Restaurar el cursor
         self.setCursor(Qt.OpenHandCursor)
     
+    def drag_pixmap(self) -> QPixmap:
+        """
+        Retorna la imagen de la tarjeta usada al arrastrarla.
+        
+        Returns:
+            QPixmap cacheado (se vuelve a renderizar tras update_data o un resize)
+        """
+        if self._drag_pixmap is None:
+            self._drag_pixmap = self.grab()
+        return self._drag_pixmap
+    
+    def resizeEvent(self, event):
+        """Invalida la imagen del drag al cambiar el tamaño."""
+        self._drag_pixmap = None
+        super().resizeEvent(event)
+    
     def get_task_id(self) -> int:
         """Retorna el ID de la tarea."""
         return self.task_id
@@ -146,6 +159,7 @@ class TaskCard(QFrame):
         """
         self.task_data = new_data
         self.task_id = new_data.get('id')
+        self._drag_pixmap = None
         
         # Actualizar los labels
         self.title_label.setText(truncate_text(new_data.get('title', 'Sin título'), 40))
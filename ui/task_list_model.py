@@ -0,0 +1,218 @@
+"""
+Modelo TaskListModel.
+Modelo de lista (model/view) sobre las filas de tareas de una columna Kanban.
+"""
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QMimeData
+from ui.task_mime import TASK_MIME_TYPE, encode_task_mime
+
+
+class TaskListModel(QAbstractListModel):
+    """Modelo que expone las tareas de una columna a un QListView."""
+
+    # Rol para obtener el diccionario completo de la tarea
+    TaskRole = Qt.UserRole + 1
+
+    # Rol para obtener solo el ID de la tarea
+    TaskIdRole = Qt.UserRole + 2
+
+    MIME_TYPE = TASK_MIME_TYPE
+
+    def __init__(self, parent=None):
+        """
+        Inicializa el modelo vacío.
+
+        Args:
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+        self._tasks = []  # Lista de diccionarios con las tareas
+        self._rows = {}  # Diccionario {task_id: fila}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Retorna la cantidad de tareas del modelo."""
+        if parent.isValid():
+            return 0
+        return len(self._tasks)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Retorna los datos de la tarea para el rol solicitado."""
+        if not index.isValid() or index.row() >= len(self._tasks):
+            return None
+
+        task = self._tasks[index.row()]
+
+        if role == Qt.DisplayRole:
+            return task.get('title', '')
+        if role == Qt.ToolTipRole:
+            return task.get('description') or None
+        if role == self.TaskRole:
+            return task
+        if role == self.TaskIdRole:
+            return task.get('id')
+        return None
+
+    def flags(self, index: QModelIndex):
+        """Las tareas se pueden seleccionar y arrastrar."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def supportedDragActions(self):
+        """Las tareas solo se mueven entre columnas."""
+        return Qt.MoveAction
+
+    def mimeTypes(self) -> list:
+        """Tipos MIME que genera el modelo al arrastrar."""
+        return [self.MIME_TYPE, "text/plain"]
+
+    def mimeData(self, indexes) -> QMimeData:
+        """
+        Genera los datos del drag con el mismo formato que TaskCard.
+
+        Args:
+            indexes: Índices arrastrados (pueden ser varios)
+
+        Returns:
+            QMimeData con los IDs de las tareas, en el orden de la columna, y su estado
+        """
+        rows = sorted({index.row() for index in indexes
+                       if index.isValid() and index.row() < len(self._tasks)})
+        tasks = [self._tasks[row] for row in rows]
+        status = tasks[0].get('status') if tasks else None
+        return encode_task_mime([task.get('id') for task in tasks], status)
+
+    # ==================== API DE LA COLUMNA ====================
+
+    @staticmethod
+    def sort_key(task: dict) -> tuple:
+        """Orden de las tarjetas en la columna: (position, id)."""
+        return (task.get('position') or '', task.get('id') or 0)
+
+    def _insertion_row(self, task_data: dict) -> int:
+        """Fila donde va una tarea según su posición (búsqueda binaria)."""
+        key = self.sort_key(task_data)
+        low, high = 0, len(self._tasks)
+        while low < high:
+            middle = (low + high) // 2
+            if self.sort_key(self._tasks[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _is_in_order(self, row: int) -> bool:
+        """Indica si la tarea de una fila sigue ordenada respecto de sus vecinas."""
+        key = self.sort_key(self._tasks[row])
+        if row > 0 and self.sort_key(self._tasks[row - 1]) > key:
+            return False
+        if row + 1 < len(self._tasks) and self.sort_key(self._tasks[row + 1]) < key:
+            return False
+        return True
+
+    def add_task(self, task_data: dict):
+        """
+        Agrega una tarea en la fila que le corresponde según su posición, o la
+        actualiza si ya existe (moviéndola si cambió su posición).
+
+        Args:
+            task_data: Diccionario con los datos de la tarea
+        """
+        task_id = task_data.get('id')
+
+        if task_id in self._rows:
+            row = self._rows[task_id]
+            self._tasks[row] = task_data
+            if self._is_in_order(row):
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+                return
+            self.remove_task(task_id)
+
+        row = self._insertion_row(task_data)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tasks.insert(row, task_data)
+        # Recalcular solo las filas desplazadas
+        for new_row in range(row, len(self._tasks)):
+            self._rows[self._tasks[new_row].get('id')] = new_row
+        self.endInsertRows()
+
+    def append_tasks(self, tasks: list):
+        """
+        Agrega varias tareas al final, en el orden recibido (páginas y
+        resultados de búsqueda); las que ya existen solo se actualizan.
+
+        Args:
+            tasks: Lista de diccionarios con las tareas
+        """
+        new_tasks = {}  # {task_id: tarea}, en orden de inserción
+        for task_data in tasks:
+            task_id = task_data.get('id')
+            if task_id in self._rows:
+                row = self._rows[task_id]
+                self._tasks[row] = task_data
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+            else:
+                new_tasks[task_id] = task_data
+
+        if not new_tasks:
+            return
+
+        first = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_tasks) - 1)
+        for row, task_data in enumerate(new_tasks.values(), first):
+            self._tasks.append(task_data)
+            self._rows[task_data.get('id')] = row
+        self.endInsertRows()
+
+    def remove_task(self, task_id: int) -> bool:
+        """
+        Elimina una tarea del modelo.
+
+        Args:
+            task_id: ID de la tarea a eliminar
+
+        Returns:
+            True si la tarea existía, False en caso contrario
+        """
+        row = self._rows.get(task_id)
+        if row is None:
+            return False
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._tasks[row]
+        del self._rows[task_id]
+        # Recalcular solo las filas desplazadas
+        for new_row in range(row, len(self._tasks)):
+            self._rows[self._tasks[new_row].get('id')] = new_row
+        self.endRemoveRows()
+        return True
+
+    def clear(self):
+        """Elimina todas las tareas del modelo."""
+        self.beginResetModel()
+        self._tasks = []
+        self._rows = {}
+        self.endResetModel()
+
+    def get_task(self, task_id: int):
+        """
+        Obtiene los datos de una tarea por su ID.
+
+        Args:
+            task_id: ID de la tarea
+
+        Returns:
+            Diccionario con los datos de la tarea o None si no existe
+        """
+        row = self._rows.get(task_id)
+        return self._tasks[row] if row is not None else None
+
+    def has_task(self, task_id: int) -> bool:
+        """Indica si la tarea está en el modelo."""
+        return task_id in self._rows
+
+    def task_ids(self) -> list:
+        """Retorna los IDs de las tareas en orden de fila."""
+        return [task.get('id') for task in self._tasks]
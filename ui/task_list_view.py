@@ -0,0 +1,317 @@
+"""
+Componente TaskListView.
+Lista virtualizada de tareas: un QListView cuyas tarjetas se pintan con un
+delegado, de modo que solo las filas visibles tienen costo.
+"""
+
+from PyQt5.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt5.QtCore import Qt, QEvent, QPoint, QRect, QSize, pyqtSignal
+from PyQt5.QtGui import QColor, QDrag, QFont, QPainter, QPen, QPixmap
+from app.utils import format_datetime
+from ui.task_list_model import TaskListModel
+
+
+class TaskCardDelegate(QStyledItemDelegate):
+    """Delegado que pinta una tarea con el mismo aspecto que TaskCard."""
+
+    # Señales para comunicar los clics en los botones pintados
+    edit_requested = pyqtSignal(int)  # task_id
+    delete_requested = pyqtSignal(int)  # task_id
+
+    CARD_HEIGHT = 128
+    CARD_MARGIN = 4  # Separación vertical entre tarjetas
+    PADDING = 12
+    BUTTON_WIDTH = 64
+    BUTTON_HEIGHT = 24
+
+    def __init__(self, parent=None):
+        """
+        Inicializa el delegado y sus fuentes.
+
+        Args:
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+
+        self.title_font = QFont()
+        self.title_font.setPixelSize(14)
+        self.title_font.setBold(True)
+
+        self.description_font = QFont()
+        self.description_font.setPixelSize(12)
+
+        self.date_font = QFont()
+        self.date_font.setPixelSize(10)
+
+        self.button_font = QFont()
+        self.button_font.setPixelSize(11)
+
+    def sizeHint(self, option, index) -> QSize:
+        """Todas las tarjetas tienen la misma altura (permite uniformItemSizes)."""
+        return QSize(option.rect.width(), self.CARD_HEIGHT + 2 * self.CARD_MARGIN)
+
+    def _card_rect(self, rect: QRect) -> QRect:
+        """Rectángulo de la tarjeta dentro de la fila."""
+        return rect.adjusted(1, self.CARD_MARGIN, -1, -self.CARD_MARGIN)
+
+    def _button_rects(self, rect: QRect) -> tuple:
+        """
+        Calcula los rectángulos de los botones Editar y Eliminar.
+
+        Args:
+            rect: Rectángulo de la fila
+
+        Returns:
+            Tupla (rect_editar, rect_eliminar)
+        """
+        card = self._card_rect(rect)
+        top = card.bottom() - self.PADDING - self.BUTTON_HEIGHT + 1
+        edit_rect = QRect(card.left() + self.PADDING, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        delete_rect = QRect(edit_rect.right() + 9, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        return edit_rect, delete_rect
+
+    def paint(self, painter: QPainter, option, index):
+        """Pinta la tarjeta de la tarea."""
+        task = index.data(TaskListModel.TaskRole)
+        if not task:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        card = self._card_rect(option.rect)
+        highlighted = option.state & (QStyle.State_MouseOver | QStyle.State_Selected)
+
+        # Fondo y borde de la tarjeta
+        painter.setPen(QPen(QColor("#2196F3" if highlighted else "#d0d0d0"), 1))
+        painter.setBrush(QColor("#ffffff"))
+        painter.drawRoundedRect(card, 6, 6)
+
+        text_width = card.width() - 2 * self.PADDING
+        left = card.left() + self.PADDING
+        top = card.top() + self.PADDING
+
+        # Título
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#212121"))
+        metrics = painter.fontMetrics()
+        title = metrics.elidedText(task.get('title') or 'Sin título', Qt.ElideRight, text_width)
+        painter.drawText(QRect(left, top, text_width, metrics.height()), Qt.AlignLeft | Qt.AlignVCenter, title)
+        top += metrics.height() + 6
+
+        # Descripción (una línea)
+        description = task.get('description') or ''
+        painter.setFont(self.description_font)
+        metrics = painter.fontMetrics()
+        if description:
+            painter.setPen(QColor("#757575"))
+            description = metrics.elidedText(" ".join(description.split()), Qt.ElideRight, text_width)
+            painter.drawText(QRect(left, top, text_width, metrics.height()), Qt.AlignLeft | Qt.AlignVCenter, description)
+        top += metrics.height() + 6
+
+        # Fecha de creación
+        created_at = task.get('created_at') or ''
+        if created_at:
+            painter.setFont(self.date_font)
+            painter.setPen(QColor("#9e9e9e"))
+            metrics = painter.fontMetrics()
+            painter.drawText(QRect(left, top, text_width, metrics.height()),
+                             Qt.AlignLeft | Qt.AlignVCenter, format_datetime(created_at))
+
+        # Botones de acción
+        edit_rect, delete_rect = self._button_rects(option.rect)
+        painter.setFont(self.button_font)
+        painter.setPen(Qt.NoPen)
+        for rect, color, text in ((edit_rect, "#2196F3", "Editar"),
+                                  (delete_rect, "#f44336", "Eliminar")):
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(QColor("#ffffff"))
+            painter.drawText(rect, Qt.AlignCenter, text)
+            painter.setPen(Qt.NoPen)
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        """Detecta los clics sobre los botones pintados de la tarjeta."""
+        if event.type() not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return False
+        if event.button() != Qt.LeftButton:
+            return False
+
+        edit_rect, delete_rect = self._button_rects(option.rect)
+        pos = event.pos()
+
+        if edit_rect.contains(pos):
+            if event.type() == QEvent.MouseButtonRelease:
+                self.edit_requested.emit(index.data(TaskListModel.TaskIdRole))
+            return True  # Evita que el clic inicie un drag o cambie la selección
+
+        if delete_rect.contains(pos):
+            if event.type() == QEvent.MouseButtonRelease:
+                self.delete_requested.emit(index.data(TaskListModel.TaskIdRole))
+            return True
+
+        return False
+
+
+class TaskListView(QListView):
+    """
+    QListView configurado para mostrar y arrastrar tarjetas de tareas.
+
+    Con Ctrl/Shift se pueden seleccionar y arrastrar varias tarjetas juntas.
+    """
+
+    # Tarjetas apiladas que se dibujan, como máximo, en la imagen de un drag múltiple
+    MAX_STACKED_PREVIEWS = 3
+    STACK_OFFSET = 6
+
+    def __init__(self, parent=None):
+        """
+        Inicializa la vista de lista.
+
+        Args:
+            parent: Widget padre
+        """
+        super().__init__(parent)
+        self.setObjectName("taskListView")
+
+        # Todas las filas miden lo mismo: el layout no consulta cada sizeHint
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setFrameShape(QListView.NoFrame)
+        self.setMouseTracking(True)
+        self.setCursor(Qt.OpenHandCursor)
+
+        # Solo arrastrar: los drops los recibe la KanbanColumn contenedora
+        self.setDragDropMode(QAbstractItemView.DragOnly)
+        self.setDefaultDropAction(Qt.MoveAction)
+
+        # Imágenes de drag ya pintadas: {task_id: (ancho, QPixmap)}
+        self._preview_cache = {}
+
+    def setModel(self, model):
+        """Asigna el modelo y vacía las imágenes de drag al cambiar sus filas."""
+        previous = self.model()
+        if previous is not None:
+            previous.dataChanged.disconnect(self._on_data_changed)
+            previous.rowsAboutToBeRemoved.disconnect(self._on_rows_removed)
+            previous.modelReset.disconnect(self._preview_cache.clear)
+
+        super().setModel(model)
+        self._preview_cache.clear()
+
+        if model is not None:
+            model.dataChanged.connect(self._on_data_changed)
+            model.rowsAboutToBeRemoved.connect(self._on_rows_removed)
+            model.modelReset.connect(self._preview_cache.clear)
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        """Invalida la imagen de drag de las tareas modificadas."""
+        self._discard_previews(top_left.row(), bottom_right.row())
+
+    def _on_rows_removed(self, parent, first: int, last: int):
+        """Invalida la imagen de drag de las tareas que salen del modelo."""
+        self._discard_previews(first, last)
+
+    def _discard_previews(self, first: int, last: int):
+        """Quita del caché las imágenes de drag de un rango de filas."""
+        if not self._preview_cache:
+            return
+        model = self.model()
+        for row in range(first, last + 1):
+            self._preview_cache.pop(model.index(row, 0).data(TaskListModel.TaskIdRole), None)
+
+    def resizeEvent(self, event):
+        """Las imágenes de drag dependen del ancho de la columna."""
+        if event.size().width() != event.oldSize().width():
+            self._preview_cache.clear()
+        super().resizeEvent(event)
+
+    def card_pixmap(self, index) -> QPixmap:
+        """
+        Retorna la imagen de una tarjeta pintada con el delegado.
+
+        Args:
+            index: Índice de la tarea
+
+        Returns:
+            QPixmap cacheado por tarea (se vuelve a pintar si la tarea cambió
+            o cambió el ancho de la columna)
+        """
+        task_id = index.data(TaskListModel.TaskIdRole)
+        width = self.viewport().width()
+        cached = self._preview_cache.get(task_id)
+        if cached is not None and cached[0] == width:
+            return cached[1]
+
+        option = self.viewOptions()
+        option.rect = QRect(QPoint(0, 0), QSize(width, self.itemDelegate().sizeHint(option, index).height()))
+        option.state &= ~(QStyle.State_MouseOver | QStyle.State_Selected)
+
+        pixmap = QPixmap(option.rect.size())
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        self.itemDelegate().paint(painter, option, index)
+        painter.end()
+
+        self._preview_cache[task_id] = (width, pixmap)
+        return pixmap
+
+    def _drag_pixmap(self, indexes) -> QPixmap:
+        """
+        Imagen del drag: la tarjeta, o varias tarjetas apiladas con la cantidad.
+
+        Args:
+            indexes: Índices arrastrados, en el orden de la columna
+
+        Returns:
+            QPixmap para el QDrag
+        """
+        first = self.card_pixmap(indexes[0])
+        if len(indexes) == 1:
+            return first
+
+        stacked = min(len(indexes), self.MAX_STACKED_PREVIEWS)
+        offset = self.STACK_OFFSET * (stacked - 1)
+        pixmap = QPixmap(first.width() + offset, first.height() + offset)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        # De atrás hacia adelante: la primera tarjeta queda arriba
+        for i in reversed(range(stacked)):
+            painter.drawPixmap(i * self.STACK_OFFSET, i * self.STACK_OFFSET, self.card_pixmap(indexes[i]))
+
+        # Insignia con la cantidad de tarjetas
+        badge = QRect(first.width() - 34, 4, 28, 20)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#2196F3"))
+        painter.drawRoundedRect(badge, 10, 10)
+        painter.setPen(QColor("#ffffff"))
+        painter.drawText(badge, Qt.AlignCenter, str(len(indexes)))
+        painter.end()
+
+        return pixmap
+
+    def startDrag(self, supported_actions):
+        """Arrastra todas las tarjetas seleccionadas, con una imagen cacheada."""
+        indexes = sorted((index for index in self.selectedIndexes()
+                          if self.model().flags(index) & Qt.ItemIsDragEnabled),
+                         key=lambda index: index.row())
+        if not indexes:
+            return
+
+        drag = QDrag(self)
+        drag.setMimeData(self.model().mimeData(indexes))
+
+        pixmap = self._drag_pixmap(indexes)
+        drag.setPixmap(pixmap)
+        drag.setHotSpot(QPoint(pixmap.width() // 2, 20))
+
+        drag.exec_(supported_actions & Qt.MoveAction, Qt.MoveAction)
@@ -0,0 +1,66 @@
+"""
+Formato de los datos de drag & drop de tareas.
+Lo comparten TaskCard, TaskListModel y KanbanColumn.
+"""
+
+import json
+from typing import List, Optional, Tuple
+from PyQt5.QtCore import QMimeData
+
+# Tipo MIME propio: JSON con las tareas arrastradas y su columna de origen
+TASK_MIME_TYPE = "application/x-task"
+
+
+def encode_task_mime(task_ids: List[int], status: Optional[str]) -> QMimeData:
+    """
+    Genera los datos de un drag de tareas.
+
+    Args:
+        task_ids: IDs de las tareas arrastradas, en el orden de la columna
+        status: Estado (columna) de origen de las tareas
+
+    Returns:
+        QMimeData con el tipo propio y una copia en texto plano de los IDs
+    """
+    mime_data = QMimeData()
+    payload = {"status": status, "ids": [int(task_id) for task_id in task_ids]}
+    mime_data.setData(TASK_MIME_TYPE, json.dumps(payload).encode())
+    mime_data.setText(",".join(str(task_id) for task_id in payload["ids"]))
+    return mime_data
+
+
+def has_task_mime(mime_data: QMimeData) -> bool:
+    """Indica si los datos del drag pueden contener tareas."""
+    return mime_data.hasFormat(TASK_MIME_TYPE) or mime_data.hasText()
+
+
+def decode_task_mime(mime_data: QMimeData) -> Tuple[Optional[str], List[int]]:
+    """
+    Lee los datos de un drag de tareas.
+
+    Acepta también texto plano con IDs separados por comas (sin estado de origen).
+
+    Args:
+        mime_data: Datos del drag
+
+    Returns:
+        Tupla (estado de origen o None, lista de IDs); la lista queda vacía si
+        los datos no son válidos
+    """
+    if mime_data.hasFormat(TASK_MIME_TYPE):
+        raw = bytes(mime_data.data(TASK_MIME_TYPE)).decode()
+        try:
+            payload = json.loads(raw)
+            if isinstance(payload, dict):
+                return payload.get("status"), [int(task_id) for task_id in payload.get("ids", [])]
+            return None, [int(payload)]  # Formato anterior: solo el ID
+        except (ValueError, TypeError):
+            return None, []
+
+    if mime_data.hasText():
+        try:
+            return None, [int(part) for part in mime_data.text().split(",") if part.strip()]
+        except ValueError:
+            return None, []
+
+    return None, []
@@ -1,6 +1,8 @@
 """
 Script para visualizar el contenido de la base de datos.
 Útil para pruebas y depuración.
+
+Uso: python view_database.py [--tasks | --plans] [--db RUTA]
 """
 
 import sqlite3
@@ -22,7 +24,8 @@ def show_database_info(db_path="tasks.db"):
         # 1. Mostrar todas las tablas
         print("\n📋 TABLAS EN LA BASE DE DATOS:")
         print("-" * 70)
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        # Se omiten los índices de búsqueda FTS5 (tasks_fts, notes_fts y sus tablas internas)
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE '%\\_fts%' ESCAPE '\\'")
         tables = cursor.fetchall()
         
         if not tables:
@@ -180,13 +183,67 @@ def show_tasks_table(db_path="tasks.db"):
         print(f"\n❌ No se encontró el archivo: {db_path}")
 
 
+def check_query_plans() -> bool:
+    """
+    Muestra el EXPLAIN QUERY PLAN de cada consulta de lectura de los modelos,
+    sobre una base de datos nueva con todas las migraciones aplicadas, y
+    verifica que todas usen un índice (ningún SCAN de tabla completa).
+    
+    Returns:
+        True si todas las consultas usan índices, False en caso contrario
+    """
+    import os
+    import tempfile
+    from app.database import Database
+    from app.query_plans import explain_model_queries, is_full_scan
+    
+    print("=" * 70)
+    print("PLANES DE CONSULTA DE LOS MODELOS")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(os.path.join(directory, "plans.db"))
+        try:
+            plans = explain_model_queries(database)
+        finally:
+            database.close()
+    
+    all_ok = True
+    
+    for name, statement, details in plans:
+        ok = not any(is_full_scan(detail) for detail in details)
+        all_ok = all_ok and ok
+        
+        print(f"\n   {'✓' if ok else '✗'} {name}")
+        for detail in details:
+            print(f"        {detail}")
+    
+    print("\n" + "=" * 70)
+    if all_ok:
+        print("✅ Todas las consultas usan índices")
+    else:
+        print("❌ Hay consultas que recorren una tabla completa")
+    print("=" * 70)
+    
+    return all_ok
+
+
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--tasks":
+    from app.database import configure_from_args
+    
+    # Archivo a inspeccionar: --db RUTA, TASKS_DB_PATH o "tasks.db"
+    db_path = configure_from_args(sys.argv)
+    
+    if "--tasks" in sys.argv:
         # Mostrar solo la tabla de tareas de forma detallada
-        show_tasks_table()
+        show_tasks_table(db_path)
+    elif "--plans" in sys.argv:
+        # Verificar que las consultas de los modelos usen índices (sobre una
+        # base de datos temporal: no toca ni migra el archivo indicado)
+        sys.exit(0 if check_query_plans() else 1)
     else:
         # Mostrar información completa de la base de datos
-        show_database_info()
+        show_database_info(db_path)
 